@@ -0,0 +1,63 @@
+# backend/adls_index.py
+
+"""
+Maintenance commands for the ADLS identifier index.
+
+    python adls_index.py refresh          # incremental (only changed files)
+    python adls_index.py rebuild          # drop and re-index the whole lake
+    python adls_index.py verify [--deep]  # compare index and lake, exit 1 on drift
+"""
+
+import argparse
+import os
+import sys
+
+# Ensure "app" package is importable when running this as a script
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.append(CURRENT_DIR)
+
+from app.tools.adls_index import get_adls_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the ADLS identifier index.")
+    parser.add_argument("command", choices=["refresh", "rebuild", "verify"])
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="verify: also re-tokenize indexed files and compare postings",
+    )
+    args = parser.parse_args()
+
+    index = get_adls_index()
+    print(f"Index: {index.index_path}  Lake: {index.base_path}")
+
+    if args.command in ("refresh", "rebuild"):
+        stats = index.rebuild() if args.command == "rebuild" else index.refresh()
+        print(
+            f"✅ {args.command}: {stats.scanned} file(s) indexed, "
+            f"{stats.unchanged} unchanged, {stats.removed} removed, "
+            f"{stats.tokens} token(s) in {stats.elapsed:.2f}s."
+        )
+        return
+
+    report = index.verify(deep=args.deep)
+    for label, paths in (
+        ("missing", report.missing),
+        ("stale", report.stale),
+        ("orphaned", report.orphaned),
+        ("mismatched", report.mismatched),
+    ):
+        for path in paths:
+            print(f"  {label}: {path}")
+
+    if report.ok:
+        print("✅ Index is up to date.")
+    else:
+        print("❌ Index is out of date – run `python adls_index.py refresh`.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,20 @@ def run_audit_agent(state: Any) -> Any:
     state.logs.append("AuditAgent: generating user summary and admin report.")
 
     # User-facing summary
-    discovery_count = len(getattr(state, "discovery_results", []))
-    actions_count = len(getattr(state, "deletion_actions", []))
-
+    # Streaming runs keep counts only; their actions are in request_actions.
+    streaming = getattr(state, "streaming", False)
+    if streaming:
+        discovery_count = state.locations_found
+        actions_count = sum(state.action_counts.values())
+    else:
+        discovery_count = len(getattr(state, "discovery_results", []))
+        actions_count = len(getattr(state, "deletion_actions", []))
+
+    verb = "executed" if str(state.mode).upper() == "LIVE" else "simulated"
     state.user_summary = (
         f"Your deletion request was processed in {state.mode} mode. "
         f"The system located {discovery_count} data locations and "
-        f"simulated {actions_count} policy actions (mask/flag)."
+        f"{verb} {actions_count} policy actions (mask/flag)."
     )
 
     # Admin-facing report
@@ -29,6 +36,12 @@ def run_audit_agent(state: Any) -> Any:
     lines.append("")
     lines.append("Actions:")
 
+    if streaming:
+        for key, count in sorted(state.action_counts.items()):
+            action_type, status = key.split("/", 1)
+            lines.append(f"- [{status}] {action_type}: {count} action(s)")
+        lines.append("(each action is stored in request_actions)")
+
     for action in getattr(state, "deletion_actions", []):
         lines.append(
             f"- [{action.get('status')}] {action.get('source_name')} "
@@ -0,0 +1,64 @@
+# backend/app/agents/data_discovery_agent.py
+
+from typing import Any, Dict, List
+
+from app.agents.state import DataLocation
+from app.tools.discovery_executor import run_discovery
+
+
+def _discovery_result(loc: DataLocation) -> Dict[str, Any]:
+    # The shape the policy agent reads (source / location_type / pii_type).
+    return {
+        "source": loc.source_name,
+        "location_type": loc.location_type.value,
+        "pii_type": ",".join(loc.pii_fields),
+        "identifier": loc.describe_target(),
+    }
+
+
+def run_data_discovery_agent(state: Any) -> Any:
+    """
+    Data Discovery Agent (the pipeline's discovery step):
+    - Fan out to every registered connector (SQL, Mongo, ADLS) concurrently,
+      each under its own deadline (discovery_executor.run_discovery).
+    - Store one discovery result per DataLocation in state.discovery_results.
+    - Log per-connector timings, and which connectors timed out or failed;
+      if any did, state.discovery_partial is set and the request ends
+      PARTIAL.
+    """
+
+    state.logs.append("DataDiscoveryAgent: starting discovery step.")
+
+    if not getattr(state, "identity_verified", False):
+        state.logs.append(
+            "DataDiscoveryAgent: identity not verified, skipping data discovery."
+        )
+        return state
+
+    report = run_discovery(state.email, state.customer_id)
+
+    results: List[Dict[str, Any]] = [_discovery_result(loc) for loc in report.locations]
+    state.discovery_results = results
+
+    for run in report.runs:
+        line = (
+            f"DataDiscoveryAgent: connector '{run.name}' -> {run.status} "
+            f"in {run.duration * 1000:.0f} ms, {run.locations_found} location(s)."
+        )
+        if run.error:
+            line += f" Error: {run.error}"
+        state.logs.append(line)
+
+    if report.partial:
+        state.discovery_partial = True
+        state.logs.append(
+            "DataDiscoveryAgent: partial results – some connectors did not complete "
+            f"({', '.join(r.name for r in report.runs if r.status != 'ok')})."
+        )
+
+    state.logs.append(
+        f"DataDiscoveryAgent: found {len(results)} data locations "
+        f"in {report.elapsed * 1000:.0f} ms."
+    )
+
+    return state
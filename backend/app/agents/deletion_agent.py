@@ -1,23 +1,41 @@
 # backend/app/agents/deletion_agent.py
 
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
 from app.agents.state import (
     RegentState,
+    DataLocation,
     DeletionAction,
-    ActionType,
     ActionStatus,
-    LocationType,
+    Mode,
+    UserIdentifiers,
 )
-from app.tools.policy_engine import decide_action_for_location
+from app.db.session import SessionLocal
+from app.tools.file_redactor import FileExecutionReport, execute_file_actions
+from app.tools.mongo_executor import MongoExecutionReport, execute_mongo_actions
+from app.tools.policy_engine import decide_actions
+from app.tools.sql_executor import SqlExecutionReport, execute_sql_actions
 
 
 def run_deletion_agent(state: RegentState) -> RegentState:
     """
     Deletion Agent (policy-driven simulation):
 
-    - For each DataLocation in state.data_map:
-        * Ask policy_engine.decide_action_for_location(location)
-        * Build a DeletionAction using the returned ActionType + policy reason.
-    - We do NOT actually modify any data yet (simulation only).
+    - Ask policy_engine.decide_actions(state.data_map) for all locations at once
+      (one decision per (source, location type) group).
+    - For each DataLocation, build a DeletionAction using the returned
+      ActionType + policy reason (its description is rendered on demand).
+    - In SIMULATION mode nothing is modified. In LIVE mode MASK / DELETE
+      actions are applied in bulk by the SQL executor
+      (app/tools/sql_executor.py), the Mongo executor
+      (app/tools/mongo_executor.py) and the file redactor
+      (app/tools/file_redactor.py), which record each outcome on its action.
+
+    This agent is not a step of the request pipeline (agents/graph.py);
+    LIVE requests are executed batch by batch by the streaming agent
+    through iter_deletion_actions / execute_live_actions.
     """
 
     if not state.data_map:
@@ -26,41 +44,83 @@ def run_deletion_agent(state: RegentState) -> RegentState:
         )
         return state
 
-    for loc in state.data_map:
-        # Get action + reason from policy engine
-        action_type, policy_reason = decide_action_for_location(loc)
-
-        # Build nice description depending on location type
-        if loc.location_type == LocationType.SQL_ROW:
-            target_desc = (
-                f"SQL table '{loc.table_name}', primary_key={loc.primary_key}"
-            )
-        elif loc.location_type == LocationType.MONGO_DOC:
-            target_desc = (
-                f"Mongo collection '{loc.collection_name}', document_id={loc.document_id}"
-            )
-        elif loc.location_type == LocationType.FILE:
-            target_desc = f"File at path '{loc.file_path}'"
-        else:
-            target_desc = "Unknown location type"
-
-        details = (
-            f"Policy decision: {action_type.value.upper()} "
-            f"(reason: {policy_reason}). "
-            f"Target: source={loc.source_name}, {target_desc}, pii_fields={loc.pii_fields}"
-        )
+    state.deletion_actions.extend(_decide(state.data_map))
+
+    state.logs.append(
+        f"DeletionAgent: Created {len(state.deletion_actions)} policy-driven simulated actions."
+    )
 
-        deletion_action = DeletionAction(
+    if state.mode == Mode.LIVE:
+        _execute_live(state)
+
+    return state
+
+
+def _decide(locations: Sequence[DataLocation]) -> Iterator[DeletionAction]:
+    # details are rendered lazily from (location, decision) when read.
+    for loc, (action_type, policy_reason) in zip(locations, decide_actions(locations)):
+        yield DeletionAction(
             location=loc,
             action_type=action_type,
             status=ActionStatus.SUCCESS,
-            details=details,
+            policy_reason=policy_reason,
+        )
+
+
+def iter_deletion_actions(
+    batches: Iterable[Sequence[DataLocation]],
+) -> Iterator[List[DeletionAction]]:
+    """
+    Streaming stage of the deletion agent: for each batch of locations
+    (e.g. from discovery_executor.stream_discovery), yield its actions as
+    soon as the batch is decided. Each batch is decided against one policy
+    snapshot; nothing is kept between batches.
+    """
+
+    for locations in batches:
+        yield list(_decide(locations))
+
+
+def execute_live_actions(
+    db: Session,
+    actions: Sequence[DeletionAction],
+    identifiers: UserIdentifiers,
+) -> Tuple[SqlExecutionReport, MongoExecutionReport, FileExecutionReport]:
+    """
+    Apply MASK / DELETE actions with the SQL, Mongo and file executors, in
+    that order. Each records its outcome on the actions it handles.
+    """
+
+    return (
+        execute_sql_actions(db, actions),
+        execute_mongo_actions(actions),
+        execute_file_actions(actions, identifiers),
+    )
+
+
+def _execute_live(state: RegentState) -> None:
+    db = SessionLocal()
+    try:
+        report, mongo_report, file_report = execute_live_actions(
+            db, state.deletion_actions, state.user_identifiers
         )
+    finally:
+        db.close()
 
-        state.deletion_actions.append(deletion_action)
+    state.logs.append(
+        f"DeletionAgent: LIVE SQL executor affected {report.rows_affected} row(s) "
+        f"in {len(report.chunks)} chunk(s) ({report.failed_chunks} failed) "
+        f"in {report.elapsed * 1000:.0f} ms."
+    )
 
     state.logs.append(
-        f"DeletionAgent: Created {len(state.deletion_actions)} policy-driven simulated actions."
+        f"DeletionAgent: LIVE Mongo executor affected {mongo_report.documents_affected} "
+        f"document(s) in {len(mongo_report.batches)} batch(es) "
+        f"({mongo_report.write_errors} write error(s)) in {mongo_report.elapsed * 1000:.0f} ms."
     )
 
-    return state
+    state.logs.append(
+        f"DeletionAgent: LIVE file redactor masked {file_report.replacements} occurrence(s) "
+        f"in {len(file_report.files)} file(s) ({file_report.failed} failed) "
+        f"in {file_report.elapsed * 1000:.0f} ms."
+    )
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 from app.agents.identity_agent import run_identity_agent
-from app.agents.discovery_agent import run_discovery_agent
+from app.agents.data_discovery_agent import run_data_discovery_agent
 from app.agents.policy_agent import run_policy_agent
 from app.agents.audit_agent import run_audit_agent
+from app.agents.streaming_agent import run_streaming_agent
+from app.core.metrics import AGENT_DURATION, AGENT_RUNS, track
 
 
 @dataclass
@@ -29,28 +31,81 @@ class RegentState:
     # Pipeline artifacts
     logs: List[str] = field(default_factory=list)
     discovery_results: List[Dict[str, Any]] = field(default_factory=list)
+    # A connector timed out or failed: the request ends PARTIAL.
+    discovery_partial: bool = False
     deletion_actions: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Streaming mode (app/agents/streaming_agent.py): actions are handed to
+    # action_sink batch by batch instead of being kept in deletion_actions,
+    # and only these counts stay here. action_counts is keyed
+    # "<action_type>/<status>", e.g. "mask/success".
+    action_sink: Optional[Callable[[List[Any]], None]] = None
+    # DiscoveryReport from run_batch_discovery (JobRunner.run_batch): the
+    # streaming agent uses its locations instead of running the connectors.
+    prefetched_discovery: Optional[Any] = None
+    locations_found: int = 0
+    action_counts: Dict[str, int] = field(default_factory=dict)
+
     # Final summaries
     user_summary: Optional[str] = None
     admin_report: Optional[str] = None
 
+    @property
+    def streaming(self) -> bool:
+        return self.action_sink is not None
+
+
+# (step name, state) -> None; called after every step of the pipeline.
+StepCallback = Callable[[str, RegentState], None]
+
+PIPELINE_STEPS = (
+    ("identity", run_identity_agent),
+    ("discovery", run_data_discovery_agent),
+    ("policy", run_policy_agent),
+    ("audit", run_audit_agent),
+)
 
-def run_regent_flow(state: RegentState) -> RegentState:
+# With state.action_sink set: discovery, policy and actions in one pass.
+STREAMING_PIPELINE_STEPS = (
+    ("identity", run_identity_agent),
+    ("streaming", run_streaming_agent),
+    ("audit", run_audit_agent),
+)
+
+
+def run_regent_flow(
+    state: RegentState,
+    on_step: Optional[StepCallback] = None,
+) -> RegentState:
     """
     Orchestrates the full agentic pipeline in order:
     1) Identity
     2) Discovery
     3) Policy / actions
     4) Audit / summarisation
+
+    on_step, if given, is called after each step (and once for "start" /
+    "completed"), e.g. to publish new log lines while the pipeline runs.
+
+    If state.action_sink is set, steps 2) and 3) are replaced by the
+    streaming agent, which hands actions to the sink batch by batch. Only
+    that path executes actions: run_request_pipeline sets the sink for
+    every LIVE request; the default steps run discovery (run_discovery) and
+    only simulate the policy actions.
     """
 
     state.logs.append("Regent: starting pipeline.")
+    if on_step:
+        on_step("start", state)
 
-    state = run_identity_agent(state)
-    state = run_discovery_agent(state)
-    state = run_policy_agent(state)
-    state = run_audit_agent(state)
+    steps = STREAMING_PIPELINE_STEPS if state.streaming else PIPELINE_STEPS
+    for name, agent in steps:
+        with track(AGENT_DURATION, AGENT_RUNS, agent=name):
+            state = agent(state)
+        if on_step:
+            on_step(name, state)
 
     state.logs.append("Regent: pipeline completed.")
+    if on_step:
+        on_step("completed", state)
     return state
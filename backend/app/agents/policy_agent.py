@@ -8,24 +8,24 @@ class PolicyAgent:
     - Input: state.discovery_results (list of dicts)
     - Output:
         - state.deletion_actions (list of dicts)
-        - state.status updated (COMPLETED / PARTIAL)
+        - state.status updated (COMPLETED / PARTIAL; PARTIAL also when
+          discovery did not complete, state.discovery_partial)
     """
 
     def run(self, state: Any) -> Any:
         discovery_results = getattr(state, "discovery_results", []) or []
         actions: List[Dict] = []
 
+        had_failure = getattr(state, "discovery_partial", False)
+
         if not discovery_results:
             state.logs.append(
                 "PolicyAgent: no discovery results, nothing to delete/mask/flag."
             )
             state.deletion_actions = []
-            # For demo, still mark as completed
-            state.status = "COMPLETED"
+            state.status = "PARTIAL" if had_failure else "COMPLETED"
             return state
 
-        had_failure = False
-
         for hit in discovery_results:
             if isinstance(hit, dict):
                 source = hit.get("source", "unknown_source")
@@ -69,7 +69,7 @@ class PolicyAgent:
         if had_failure:
             state.status = "PARTIAL"
             state.logs.append(
-                "PolicyAgent: some actions failed → marking status PARTIAL."
+                "PolicyAgent: discovery did not complete → marking status PARTIAL."
             )
         else:
             state.status = "COMPLETED"
@@ -1,7 +1,8 @@
 # backend/app/agents/state.py
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from enum import Enum
 
 
@@ -58,7 +59,22 @@ class UserIdentifiers:
     dob: Optional[str] = None  # keep as string "YYYY-MM-DD" for simplicity
 
 
-@dataclass
+# Distinct pii_fields tuples, shared by every location with the same fields.
+_PII_FIELDS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def pii_fields_tuple(fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    The shared, interned tuple for these PII field names.
+    """
+    key = tuple(fields)
+    shared = _PII_FIELDS.get(key)
+    if shared is None:
+        shared = _PII_FIELDS.setdefault(key, tuple(sys.intern(f) for f in key))
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
 class DataLocation:
     """
     Represents one place where the user's data was found.
@@ -66,6 +82,11 @@ class DataLocation:
       - SQL row in customers table
       - Mongo document in events collection
       - JSON file in ADLS path
+
+    Immutable and slotted: discovery can return hundreds of thousands of
+    these per request. Source / table / collection names are interned and
+    pii_fields is a shared tuple (lists passed in are converted), so only
+    the per-row key / path takes memory of its own.
     """
 
     source_name: str                       # e.g., "CustomerDB", "MongoEvents", "ADLS_Customers"
@@ -81,21 +102,107 @@ class DataLocation:
 
     # File specific
     file_path: Optional[str] = None
-
-    # Which PII fields were detected here (e.g., ["email", "phone"])
-    pii_fields: List[str] = field(default_factory=list)
+    byte_offsets: Tuple[int, ...] = ()     # where hits start
+    line_numbers: Tuple[int, ...] = ()     # 1-based, same order
+
+    # Which PII fields were detected here (e.g., ("email", "phone"))
+    pii_fields: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Only reassign (slow on a frozen class) what is not canonical yet.
+        set_field = object.__setattr__
+        intern = sys.intern
+        value = self.source_name
+        if type(value) is str and intern(value) is not value:
+            set_field(self, "source_name", intern(value))
+        value = self.table_name
+        if value is not None and intern(value) is not value:
+            set_field(self, "table_name", intern(value))
+        value = self.collection_name
+        if value is not None and intern(value) is not value:
+            set_field(self, "collection_name", intern(value))
+        fields = self.pii_fields
+        if type(fields) is not tuple or _PII_FIELDS.get(fields) is not fields:
+            set_field(self, "pii_fields", pii_fields_tuple(fields))
+        if type(self.byte_offsets) is not tuple:
+            set_field(self, "byte_offsets", tuple(self.byte_offsets))
+        if type(self.line_numbers) is not tuple:
+            set_field(self, "line_numbers", tuple(self.line_numbers))
+
+    def describe_target(self) -> str:
+        if self.location_type == LocationType.SQL_ROW:
+            return f"SQL table '{self.table_name}', primary_key={self.primary_key}"
+        if self.location_type == LocationType.MONGO_DOC:
+            return f"Mongo collection '{self.collection_name}', document_id={self.document_id}"
+        if self.location_type == LocationType.FILE:
+            return f"File at path '{self.file_path}'"
+        return "Unknown location type"
 
 
-@dataclass
 class DeletionAction:
     """
     Represents what we did (or would do) to one DataLocation.
+
+    Slotted. When created with a policy_reason and no details, details is
+    rendered from the location and decision on first read instead of being
+    stored per action; assigning details stores the given text. Executors
+    record what they did in `outcome` (add_outcome), which details appends
+    when it is read, so recording it does not render details.
     """
 
-    location: DataLocation
-    action_type: ActionType                # mask / delete / flag
-    status: ActionStatus                   # success / failed / skipped
-    details: Optional[str] = None          # e.g., SQL query, file path, error message
+    __slots__ = ("location", "action_type", "status", "policy_reason", "_details", "outcome")
+
+    def __init__(
+        self,
+        location: DataLocation,
+        action_type: ActionType,            # mask / delete / flag
+        status: ActionStatus,               # success / failed / skipped
+        details: Optional[str] = None,      # e.g., SQL query, file path, error message
+        policy_reason: Optional[str] = None,
+    ) -> None:
+        self.location = location
+        self.action_type = action_type
+        self.status = status
+        self.policy_reason = policy_reason
+        self._details = details
+        self.outcome: Optional[str] = None
+
+    @property
+    def details(self) -> Optional[str]:
+        details = self._details
+        if details is None and self.policy_reason is not None:
+            loc = self.location
+            details = (
+                f"Policy decision: {self.action_type.value.upper()} "
+                f"(reason: {self.policy_reason}). "
+                f"Target: source={loc.source_name}, {loc.describe_target()}, "
+                f"pii_fields={list(loc.pii_fields)}"
+            )
+        if self.outcome is None:
+            return details
+        return f"{details} | {self.outcome}" if details else self.outcome
+
+    @details.setter
+    def details(self, value: Optional[str]) -> None:
+        self._details = value
+
+    def add_outcome(self, text: str) -> None:
+        self.outcome = f"{self.outcome} | {text}" if self.outcome else text
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeletionAction):
+            return NotImplemented
+        return (self.location, self.action_type, self.status, self.details) == (
+            other.location, other.action_type, other.status, other.details
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"DeletionAction(location={self.location!r}, action_type={self.action_type!r}, "
+            f"status={self.status!r}, details={self.details!r})"
+        )
 
 
 # -------------------------
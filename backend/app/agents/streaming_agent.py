@@ -0,0 +1,114 @@
+# backend/app/agents/streaming_agent.py
+
+from typing import Any
+
+from app.agents.deletion_agent import execute_live_actions, iter_deletion_actions
+from app.agents.state import ActionStatus, Mode, UserIdentifiers
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.tools.batching import batched
+from app.tools.discovery_executor import DiscoveryReport, stream_discovery
+
+
+def run_streaming_agent(state: Any) -> Any:
+    """
+    Streaming discovery + policy + actions (settings.pipeline_streaming_enabled,
+    and every LIVE request).
+
+    - Connectors yield the user's locations in batches
+      (discovery_executor.stream_discovery), unless batch discovery already
+      found them (state.prefetched_discovery).
+    - Each batch is decided by the policy engine
+      (deletion_agent.iter_deletion_actions), executed in LIVE mode, and
+      handed to state.action_sink, which persists it.
+    - Only counts are kept: state.locations_found and state.action_counts.
+      Memory is bounded by the batch size, not by the user's footprint.
+
+    Sets status COMPLETED, or PARTIAL when a connector did not finish or
+    an action failed.
+    """
+
+    state.logs.append("StreamingAgent: starting streaming discovery and actions.")
+
+    if not getattr(state, "identity_verified", False):
+        state.logs.append(
+            "StreamingAgent: identity not verified, skipping data discovery."
+        )
+        return state
+
+    identifiers = UserIdentifiers(
+        email=state.email,
+        customer_id=state.customer_id,
+        phone_last4=state.phone_last4,
+    )
+    live = str(state.mode).upper() == Mode.LIVE.value
+    batch_count = 0
+    rows_affected = documents_affected = replacements = 0
+
+    db = SessionLocal() if live else None
+    discovery = getattr(state, "prefetched_discovery", None)
+    if discovery is not None:
+        locations, discovery.locations = discovery.locations, []
+        discovery.locations_streamed = len(locations)
+        batches = batched(locations, get_settings().pipeline_batch_size)
+    else:
+        discovery = DiscoveryReport()
+        # Closed explicitly so the connectors stop even if a batch fails.
+        batches = stream_discovery(state.email, state.customer_id, discovery)
+    try:
+        for actions in iter_deletion_actions(batches):
+            if live:
+                sql_report, mongo_report, file_report = execute_live_actions(
+                    db, actions, identifiers
+                )
+                rows_affected += sql_report.rows_affected
+                documents_affected += mongo_report.documents_affected
+                replacements += file_report.replacements
+
+            for action in actions:
+                key = f"{action.action_type.value}/{action.status.value}"
+                state.action_counts[key] = state.action_counts.get(key, 0) + 1
+            state.locations_found += len(actions)
+            batch_count += 1
+
+            state.action_sink(actions)
+    finally:
+        batches.close()
+        if db is not None:
+            db.close()
+
+    for run in discovery.runs:
+        line = (
+            f"StreamingAgent: connector '{run.name}' -> {run.status} "
+            f"in {run.duration * 1000:.0f} ms, {run.locations_found} location(s)."
+        )
+        if run.error:
+            line += f" Error: {run.error}"
+        state.logs.append(line)
+
+    state.logs.append(
+        f"StreamingAgent: {state.locations_found} location(s) -> "
+        f"{sum(state.action_counts.values())} action(s) in {batch_count} batch(es) "
+        f"in {discovery.elapsed * 1000:.0f} ms."
+    )
+    if live:
+        state.logs.append(
+            f"StreamingAgent: LIVE executors affected {rows_affected} row(s), "
+            f"{documents_affected} document(s) and {replacements} file occurrence(s)."
+        )
+
+    failed = sum(
+        n for key, n in state.action_counts.items()
+        if key.endswith(f"/{ActionStatus.FAILED.value}")
+    )
+    if discovery.partial or failed:
+        state.status = "PARTIAL"
+        state.logs.append(
+            f"StreamingAgent: {failed} failed action(s), connectors not completed: "
+            f"{', '.join(r.name for r in discovery.runs if r.status != 'ok') or '-'} "
+            "→ status PARTIAL."
+        )
+    else:
+        state.status = "COMPLETED"
+
+    return state
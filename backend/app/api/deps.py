@@ -1,9 +1,11 @@
 # backend/app/api/deps.py
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.db.async_session import get_async_db as _get_async_db
 from app.db.session import get_db as _get_db
 
 
@@ -13,3 +15,11 @@ def get_db() -> Generator[Session, None, None]:
     We define it here so routers can import from api.deps.
     """
     yield from _get_db()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async counterpart of get_db, for `async def` routes.
+    """
+    async for db in _get_async_db():
+        yield db
@@ -1,25 +1,74 @@
-from typing import List
+import io
+import os
+import pstats
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.models.request import DataRightsRequest
+from app.api.deps import get_async_db
+from app.core.config import get_settings
+from app.core.profiling import get_request_profiler
+from app.models.request_log import RequestAction, RequestLogEvent
 from app.schemas.requests import (
+    RequestActionEntry,
     RequestAdminListItem,
     RequestAdminDetail,
+    RequestLogEntry,
 )
+from app.services.admin_service import (
+    InvalidCursor,
+    RequestListFilters,
+    build_count_query,
+    build_request_actions_query,
+    build_request_list_query,
+    build_request_logs_query,
+    encode_cursor,
+)
+from app.services.request_service import aget_request
 
 router = APIRouter(prefix="/admin/requests", tags=["admin"])
 
 
 @router.get("", response_model=List[RequestAdminListItem])
-def list_requests(db: Session = Depends(get_db)) -> List[RequestAdminListItem]:
-    objs = (
-        db.query(DataRightsRequest)
-        .order_by(DataRightsRequest.created_at.desc())
-        .all()
+async def list_requests(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    request_type: Optional[str] = None,
+    mode: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> List[RequestAdminListItem]:
+    """
+    Newest-first page of requests, with optional filters.
+
+    Pagination is keyset-based: when more rows exist, the X-Next-Cursor
+    response header holds the cursor to pass as ?cursor= for the next page.
+    """
+    filters = RequestListFilters(
+        status=status,
+        request_type=request_type,
+        mode=mode,
+        created_from=created_from,
+        created_to=created_to,
     )
+    try:
+        stmt = build_request_list_query(filters, cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = (await db.execute(stmt)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
     return [
         RequestAdminListItem(
             id=o.id,
@@ -30,18 +79,40 @@ def list_requests(db: Session = Depends(get_db)) -> List[RequestAdminListItem]:
             created_at=o.created_at,
             updated_at=o.updated_at,
         )
-        for o in objs
+        for o in rows
     ]
 
 
+async def _seq_page(db: AsyncSession, stmt, limit: int, response: Optional[Response] = None):
+    """
+    Run a limit + 1 seq-page query; set X-Next-Cursor when more rows exist.
+    """
+    rows = (await db.execute(stmt)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if response is not None:
+            response.headers["X-Next-Cursor"] = str(rows[-1].seq)
+    return rows
+
+
 @router.get("/{request_id}", response_model=RequestAdminDetail)
-def get_request_detail(
-    request_id: int, db: Session = Depends(get_db)
+async def get_request_detail(
+    request_id: int, db: AsyncSession = Depends(get_async_db)
 ) -> RequestAdminDetail:
-    o = db.query(DataRightsRequest).get(request_id)
+    """
+    Request row plus the first page of its logs and actions and their
+    total counts; page further with /logs and /actions.
+    """
+    o = await aget_request(db, request_id)
     if not o:
         raise HTTPException(status_code=404, detail="Request not found")
 
+    page_size = get_settings().admin_detail_page_size
+    logs = await _seq_page(db, build_request_logs_query(request_id, None, page_size), page_size)
+    actions = await _seq_page(db, build_request_actions_query(request_id, None, page_size), page_size)
+    log_count = (await db.execute(build_count_query(RequestLogEvent, request_id))).scalar()
+    action_count = (await db.execute(build_count_query(RequestAction, request_id))).scalar()
+
     return RequestAdminDetail(
         id=o.id,
         email=o.email,
@@ -53,8 +124,91 @@ def get_request_detail(
         message=o.message,
         user_summary=o.user_summary,
         admin_report=o.admin_report,
-        logs=o.logs or [],
-        actions=o.actions or [],
+        logs=[RequestLogEntry(**r._mapping) for r in logs],
+        actions=[RequestActionEntry(**r._mapping) for r in actions],
+        log_count=log_count,
+        action_count=action_count,
         created_at=o.created_at,
         updated_at=o.updated_at,
     )
+
+
+@router.get("/{request_id}/logs", response_model=List[RequestLogEntry])
+async def list_request_logs(
+    request_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> List[RequestLogEntry]:
+    """
+    A request's pipeline log lines in order; keyset-paginated via
+    ?cursor= / X-Next-Cursor like the request list.
+    """
+    try:
+        stmt = build_request_logs_query(request_id, cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = await _seq_page(db, stmt, limit, response)
+    return [RequestLogEntry(**r._mapping) for r in rows]
+
+
+@router.get("/{request_id}/actions", response_model=List[RequestActionEntry])
+async def list_request_actions(
+    request_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> List[RequestActionEntry]:
+    """
+    A request's actions in order; keyset-paginated via ?cursor= / X-Next-Cursor.
+    """
+    try:
+        stmt = build_request_actions_query(request_id, cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = await _seq_page(db, stmt, limit, response)
+    return [RequestActionEntry(**r._mapping) for r in rows]
+
+
+def _pstats_text(path: str, limit: int) -> str:
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+@router.get("/{request_id}/profile")
+async def get_request_profile(
+    request_id: int,
+    format: Optional[str] = Query(None, pattern="^(pstats|collapsed|text)$"),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """
+    Stored profile of the request's pipeline run (see app/core/profiling.py).
+
+    ?format=pstats / collapsed downloads the file (default: whichever was
+    stored); ?format=text renders the top `limit` functions of a cProfile
+    profile by cumulative time.
+    """
+    profiler = get_request_profiler()
+    available = profiler.available(request_id)
+    if not available:
+        raise HTTPException(status_code=404, detail="No profile stored for this request")
+
+    wanted = format or available[0]
+    stored = "pstats" if wanted == "text" else wanted
+    if stored not in available:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No {stored} profile for this request (available: {', '.join(available)})",
+        )
+
+    path = profiler.path(request_id, stored)
+    if wanted == "text":
+        return PlainTextResponse(await run_in_threadpool(_pstats_text, path, limit))
+
+    media_type = "application/octet-stream" if stored == "pstats" else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=os.path.basename(path))
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.schemas.llm import (
+    LlmDispatcherStats,
+    SummaryCacheInvalidation,
+    SummaryCacheStats,
+)
+from app.services.llm_dispatcher import get_llm_dispatcher
+from app.services.summary_cache import get_summary_cache
+
+router = APIRouter(prefix="/admin/llm", tags=["admin"])
+
+
+@router.get("/cache", response_model=SummaryCacheStats)
+async def get_cache_stats() -> SummaryCacheStats:
+    """
+    Hit/miss counters and entry counts of the LLM summary cache.
+    """
+    stats = await run_in_threadpool(get_summary_cache().stats)
+    return SummaryCacheStats(enabled=get_settings().llm_cache_enabled, **stats)
+
+
+@router.delete("/cache", response_model=SummaryCacheInvalidation)
+async def invalidate_cache(model: Optional[str] = None) -> SummaryCacheInvalidation:
+    """
+    Drop cached generations for ?model=... (or all of them), e.g. after a
+    model upgrade.
+    """
+    removed = await run_in_threadpool(get_summary_cache().invalidate, model)
+    return SummaryCacheInvalidation(model=model, removed=removed)
+
+
+@router.get("/dispatcher", response_model=LlmDispatcherStats)
+async def get_dispatcher_stats() -> LlmDispatcherStats:
+    """
+    Queue depth, in-flight generations, shed/expired counters and recent
+    queue wait times of the LLM dispatcher.
+    """
+    return LlmDispatcherStats(**get_llm_dispatcher().stats())
@@ -1,28 +1,60 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import hmac
+import json
+import tempfile
+from typing import AsyncIterator, Optional
 
-from app.api.deps import get_db
-from app.models.request import DataRightsRequest
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+
+from app.api.deps import get_async_db
+from app.core.config import get_settings
+from app.db.async_session import AsyncSessionLocal
+from app.db.session import SessionLocal
 from app.schemas.requests import (
     CreateRequestPayload,
     RequestCreateResponse,
     RequestStatusResponse,
 )
-from app.services.request_service import create_and_start_request
+from app.services.bulk_intake import (
+    BulkRequestBatch,
+    NdjsonLineSplitter,
+    results_to_ndjson,
+)
+from app.services.event_bus import TERMINAL_EVENT, RequestEvent, get_event_bus
+from app.services.job_runner import get_job_runner
+from app.services.request_service import (
+    ACTIVE_STATUSES,
+    acreate_pending_request,
+    aget_request,
+)
 
 router = APIRouter(prefix="/requests", tags=["requests"])
 
+# Bulk results stay in memory up to this size, then spill to disk.
+RESULTS_SPOOL_BYTES = 1024 * 1024
+RESULTS_READ_BYTES = 64 * 1024
+
 
 @router.post("", response_model=RequestCreateResponse)
-def create_request(
+async def create_request(
     payload: CreateRequestPayload,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ) -> RequestCreateResponse:
     """
-    Create a new data-rights request and run the Regent agentic flow.
+    Create a new data-rights request and queue it for the Regent agentic flow.
+    The pipeline runs on a background worker; poll GET /requests/{id} for progress.
     Returns just: id, status, mode.
+
+    With profiling enabled, sending settings.profiling_header set to
+    settings.profiling_header_token gets the pipeline run profiled
+    (GET /admin/requests/{id}/profile).
     """
-    req = create_and_start_request(payload, db)
+    req = await acreate_pending_request(payload, db, profile=_wants_profile(request))
+    get_job_runner().notify()
     return RequestCreateResponse(
         id=req.id,
         status=req.status,
@@ -30,15 +62,78 @@ def create_request(
     )
 
 
+def _wants_profile(request: Request) -> bool:
+    settings = get_settings()
+    if not settings.profiling_enabled:
+        return False
+    value = request.headers.get(settings.profiling_header)
+    token = settings.profiling_header_token
+    # No token configured -> the header is ignored (sampling still applies).
+    if not value or not token:
+        return False
+    return hmac.compare_digest(value.encode(), token.encode())
+
+
+@router.post("/bulk")
+async def create_requests_bulk(request: Request) -> StreamingResponse:
+    """
+    Bulk intake: the body is NDJSON, one CreateRequestPayload per line.
+
+    The body is read and validated incrementally; valid rows are inserted
+    with multi-row INSERTs, one transaction per chunk. Per-line results
+    (BulkRequestLineResult, NDJSON, in input order) are spooled to a temp
+    file while ingesting and streamed back once the body is consumed.
+    """
+    settings = get_settings()
+
+    db = SessionLocal()
+    splitter = NdjsonLineSplitter(settings.bulk_max_line_bytes)
+    batch = BulkRequestBatch(mode=settings.MODE)
+    results_file = tempfile.SpooledTemporaryFile(max_size=RESULTS_SPOOL_BYTES)
+    line_no = 0
+
+    async def flush() -> None:
+        chunk_results = await run_in_threadpool(batch.flush, db)
+        results_file.write(results_to_ndjson(chunk_results))
+        get_job_runner().notify()
+
+    try:
+        async for chunk in request.stream():
+            for raw in splitter.feed(chunk):
+                line_no += 1
+                batch.add_line(line_no, raw)
+                if len(batch) >= settings.bulk_chunk_size:
+                    await flush()
+
+        for raw in splitter.close():
+            line_no += 1
+            batch.add_line(line_no, raw)
+
+        if len(batch):
+            await flush()
+    except BaseException:
+        results_file.close()
+        raise
+    finally:
+        await run_in_threadpool(db.close)
+
+    results_file.seek(0)
+    return StreamingResponse(
+        iter(lambda: results_file.read(RESULTS_READ_BYTES), b""),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(results_file.close),
+    )
+
+
 @router.get("/{request_id}", response_model=RequestStatusResponse)
-def get_request_status(
+async def get_request_status(
     request_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RequestStatusResponse:
     """
     User-facing status endpoint for a single request.
     """
-    req = db.query(DataRightsRequest).get(request_id)
+    req = await aget_request(db, request_id)
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
 
@@ -55,3 +150,91 @@ def get_request_status(
         created_at=req.created_at,
         updated_at=req.updated_at,
     )
+
+
+def _sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _sse_event(e: RequestEvent) -> str:
+    return _sse(e.event, e.data, e.id)
+
+
+async def _final_state_events(request_id: int) -> Optional[str]:
+    """
+    If the request has finished according to the database, the events that
+    close the stream (status, summary, done); otherwise None. Covers requests
+    that finished before we subscribed or ran in another process.
+    """
+    async with AsyncSessionLocal() as db:
+        req = await aget_request(db, request_id)
+    if req is None or req.status in ACTIVE_STATUSES:
+        return None
+
+    out = _sse("status", {"status": req.status})
+    if req.user_summary:
+        out += _sse("summary", {"user_summary": req.user_summary})
+    return out + _sse(TERMINAL_EVENT, {"status": req.status})
+
+
+@router.get("/{request_id}/events")
+async def stream_request_events(
+    request_id: int,
+    last_event_id: Optional[int] = Header(None),
+) -> StreamingResponse:
+    """
+    Server-sent events with live progress of one request:
+    `status`, `log`, `summary` and a final `done`, after which the stream ends.
+
+    Events carry ids; a reconnecting client (EventSource does this
+    automatically) sends Last-Event-ID and receives only newer events that
+    are still buffered.
+    """
+    settings = get_settings()
+
+    async with AsyncSessionLocal() as db:
+        if await aget_request(db, request_id) is None:
+            raise HTTPException(status_code=404, detail="Request not found")
+
+    async def events() -> AsyncIterator[str]:
+        # Subscribe before checking the database so nothing published in
+        # between is lost.
+        sub, backlog = get_event_bus().subscribe(request_id, last_event_id)
+        try:
+            for e in backlog:
+                yield _sse_event(e)
+                if e.event == TERMINAL_EVENT:
+                    return
+
+            if not backlog:
+                final = await _final_state_events(request_id)
+                if final:
+                    yield final
+                    return
+
+            while True:
+                e = await sub.get(timeout=settings.events_heartbeat_seconds)
+                if e is not None:
+                    yield _sse_event(e)
+                    if e.event == TERMINAL_EVENT:
+                        return
+                    continue
+
+                final = await _final_state_events(request_id)
+                if final:
+                    yield final
+                    return
+                yield ": keep-alive\n\n"
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -15,10 +15,97 @@ class Settings(BaseSettings):
     # ---------- Primary SQL database ----------
     database_url: str = "sqlite:///./regent.db"
 
+    # URL for the async engine used by the API routes (app/db/async_session.py).
+    # Empty -> derived from database_url by swapping in an async driver:
+    # sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg.
+    async_database_url: str = ""
+
+    # Engine profile (app/db/engine_profiles.py). Set db_tuning_enabled=false
+    # to get SQLAlchemy's bare defaults.
+    db_tuning_enabled: bool = True
+
+    # SQLite: PRAGMAs applied on every new connection.
+    db_sqlite_journal_mode: str = "WAL"
+    db_sqlite_synchronous: str = "NORMAL"
+    db_sqlite_busy_timeout_ms: int = 5000
+    db_sqlite_cache_size_kib: int = 64 * 1024
+    db_sqlite_mmap_size: int = 256 * 1024 * 1024
+
+    # Connection pool (QueuePool) sizing; pre-ping/recycle matter for server DBs.
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # SQL discovery: identifiers per `IN (...)` query, and rows fetched per
+    # round trip while streaming primary keys.
+    sql_in_chunk_size: int = 500
+    sql_yield_per: int = 1000
+
+    # LIVE mode (app/tools/sql_executor.py): primary keys per set-based
+    # UPDATE / DELETE; every chunk is its own transaction.
+    sql_executor_chunk_size: int = 1000
+
+    # ---------- Observability ----------
+    # Expose GET /metrics (Prometheus text format) and track HTTP latency.
+    metrics_enabled: bool = True
+
+    # Per-request profiling (app/core/profiling.py), off by default. When on,
+    # a pipeline run is profiled if its POST /requests carried
+    # profiling_header set to profiling_header_token (the header is ignored
+    # while no token is set) or with probability profiling_sample_rate. "cprofile" stores .pstats,
+    # "sample" stores collapsed stacks sampled every
+    # profiling_sample_interval_ms; the newest profiling_max_profiles are
+    # kept in profiling_dir and served by /admin/requests/{id}/profile.
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.0
+    profiling_header: str = "X-Regent-Profile"
+    profiling_header_token: str = ""
+    profiling_mode: str = "cprofile"
+    profiling_sample_interval_ms: float = 5.0
+    profiling_dir: str = "./profiles"
+    profiling_max_profiles: int = 500
+
     # ---------- Orchestration ----------
-    # "simulation" vs "live" (for future)
+    # "simulation" vs "live". LIVE requests always run the streaming
+    # pipeline below, whose actions are executed against the sources.
     default_mode: str = "simulation"
 
+    # Pipeline logs / actions are appended to request_events / request_actions
+    # with multi-row INSERTs of up to this many rows.
+    request_log_batch_size: int = 1000
+
+    # Streaming pipeline (app/agents/streaming_agent.py), off by default
+    # (LIVE and batch-discovered requests use it regardless). When on,
+    # discovery, policy and actions run as one generator pipeline:
+    # connectors yield locations in batches of pipeline_batch_size, each
+    # batch is decided, executed (LIVE) and its actions persisted before the
+    # next one is taken, and only counts stay in the pipeline state. At most
+    # pipeline_max_pending_batches discovered batches wait for the consumer;
+    # a connector that is waiting on that queue is not timed out.
+    pipeline_streaming_enabled: bool = False
+    pipeline_batch_size: int = 1000
+    pipeline_max_pending_batches: int = 4
+
+    # Logs / actions included inline in GET /admin/requests/{id}.
+    admin_detail_page_size: int = 100
+
+    # ---------- Live progress events (GET /requests/{id}/events) ----------
+    # Events kept per request for Last-Event-ID resume, requests kept in
+    # memory, and the SSE keep-alive interval (also how often a stream
+    # re-checks the database for requests run by another process).
+    events_buffer_size: int = 256
+    events_max_requests: int = 1000
+    events_heartbeat_seconds: float = 15.0
+
+    # ---------- Policy engine ----------
+    # JSON file with the policy rules; empty -> app/tools/policy_rules.json.
+    # The file is re-read (and swapped in atomically) when its mtime changes,
+    # checked at most every policy_reload_interval_seconds.
+    policy_rules_path: str = ""
+    policy_reload_interval_seconds: float = 5.0
+
     # ---------- LLM / Audit Summaries ----------
     # Toggle: if false, system uses fallback templates only.
     llm_enabled: bool = False
@@ -30,11 +117,115 @@ class Settings(BaseSettings):
     # Example for Ollama: "llama3.2" or any pulled model
     llm_model_name: str = "llama3.2"
 
+    # Shared HTTP client pool for LLM calls (app/services/llm_client.py).
+    llm_timeout_seconds: float = 20.0
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    llm_keepalive_expiry_seconds: float = 30.0
+
+    # Summary cache (app/services/summary_cache.py): identical
+    # (model, max_tokens, prompt) are generated once. The memory tier is an
+    # LRU whose entries expire after llm_cache_ttl_seconds; the SQLite file
+    # persists across restarts until invalidated via /admin/llm/cache.
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "./llm_cache.db"
+    llm_cache_memory_entries: int = 1024
+    llm_cache_ttl_seconds: float = 3600.0
+
+    # LLM dispatcher (app/services/llm_dispatcher.py): at most
+    # llm_max_concurrency generations hit the backend at once, at most
+    # llm_queue_size wait (more are shed to the template fallback), and a
+    # queued prompt with less than llm_min_generation_seconds of its
+    # deadline left is dropped instead of started.
+    llm_max_concurrency: int = 2
+    llm_queue_size: int = 32
+    llm_min_generation_seconds: float = 2.0
+
+    # The audit step sends the user-summary and admin-report prompts
+    # concurrently; whatever has not returned within this many seconds
+    # falls back to the template.
+    audit_llm_deadline_seconds: float = 30.0
+
     # ---------- Mongo / ADLS (simulated connectors) ----------
     # These are for demo connectors; they can point to mock data.
     mongo_uri: str = "mongodb://localhost:27017"
+    mongo_db_name: str = "regent"
+
+    # One MongoClient is shared by the whole process (see mongo_connector);
+    # these size its connection pool.
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 0
+    mongo_server_selection_timeout_ms: int = 2000
+
+    # Documents fetched per cursor round trip, and identifiers per `$in` query
+    # in batch discovery.
+    mongo_cursor_batch_size: int = 1000
+    mongo_in_chunk_size: int = 5000
+
+    # LIVE mode (app/tools/mongo_executor.py): operations per unordered
+    # bulk_write batch.
+    mongo_executor_batch_size: int = 1000
+
     adls_base_path: str = "./mock_adls"
 
+    # ADLS identifier index: email/customer_id tokens -> file paths, kept in a
+    # local SQLite file and refreshed incrementally (mtime/size) so lookups
+    # don't rescan the whole lake. Disable to fall back to a full scan.
+    adls_index_enabled: bool = True
+    adls_index_path: str = "./adls_index.db"
+
+    # Max age of the index answers: once the last refresh (by any process,
+    # e.g. a `python adls_index.py refresh` cron) is older than half of this,
+    # a lookup starts an incremental refresh on a background thread; older
+    # than this, lookups fall back to the full scan until it is done. So a
+    # file added or changed is missed for at most this long, and lookups
+    # never wait for a lake walk. 0: refresh synchronously before every
+    # lookup (never stale, but each lookup stats the whole lake).
+    adls_index_max_age_seconds: int = 60
+
+    # How the full scan reads lake files: "stream" (fixed-size blocks),
+    # "mmap" (memory-mapped) or "text" (legacy: decode the whole file).
+    # stream/mmap search raw bytes with constant memory and record hit
+    # offsets / line numbers on the DataLocation.
+    adls_scan_mode: str = "stream"
+
+    # Max hits (offset + line) recorded per identifier and file.
+    adls_max_hits_per_file: int = 100
+
+    # LIVE mode (app/tools/file_redactor.py): files redacted in parallel, and
+    # bytes read per step of the streaming find-and-mask.
+    file_redaction_workers: int = 4
+    file_redaction_block_size: int = 4 * 1024 * 1024
+
+    # ---------- Discovery fan-out ----------
+    # Size of the shared thread pool that runs connectors concurrently.
+    discovery_max_workers: int = 8
+
+    # Default per-connector deadline (seconds). A connector that misses it is
+    # reported as timed out and discovery continues with the other results.
+    discovery_connector_timeout: float = 10.0
+
+    # ---------- Background job runner ----------
+    # Number of in-process worker threads that pick up PENDING requests.
+    # Set to 0 when requests are drained by a separate `run_worker.py` process.
+    job_workers: int = 2
+
+    # How long an idle worker sleeps before polling the database again (seconds).
+    job_poll_interval: float = 2.0
+
+    # IN_PROGRESS rows untouched for this long are assumed orphaned by a
+    # crashed worker and are put back to PENDING when a runner starts.
+    # Running pipelines touch their row after every step and every stored
+    # batch of actions, so this must exceed the longest single step.
+    job_stale_after_seconds: int = 900
+
+    # ---------- Bulk intake (POST /requests/bulk, import_requests.py) ----------
+    # Rows per multi-row INSERT / transaction.
+    bulk_chunk_size: int = 1000
+
+    # NDJSON lines longer than this are rejected without being buffered.
+    bulk_max_line_bytes: int = 64 * 1024
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -87,6 +278,13 @@ class Settings(BaseSettings):
         """
         return self.mongo_uri
 
+    @property
+    def MONGO_DB_NAME(self) -> str:
+        """
+        Backwards compat: the Mongo connector uses settings.MONGO_DB_NAME.
+        """
+        return self.mongo_db_name
+
     @property
     def ADLS_BASE_PATH(self) -> str:
         """
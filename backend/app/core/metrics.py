@@ -0,0 +1,387 @@
+# backend/app/core/metrics.py
+
+"""
+Minimal in-process metrics with Prometheus text exposition (GET /metrics).
+
+Counter / Gauge / Histogram families with labels, in the spirit of
+prometheus_client but dependency-free. Recording is a dict lookup (cached
+per label set), a bisect for histograms and a short lock-protected update,
+so it is cheap enough for the hot path.
+
+    AGENT_DURATION.labels(agent="identity").observe(0.012)
+
+    with track(CONNECTOR_DURATION, CONNECTOR_CALLS, connector="sql"):
+        ...
+"""
+
+import inspect
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; covers sub-millisecond lookups up to slow LLM generations.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_registry: List["_Family"] = []
+_registry_lock = threading.Lock()
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Family(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    @abstractmethod
+    def _new_child(self):
+        ...
+
+    def labels(self, **labels: str):
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            children = sorted(self._children.items())
+        for key, child in children:
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _Value:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def get(self) -> float:
+        return self._value
+
+    def render(self, name: str, labelnames, key) -> List[str]:
+        return [f"{name}{_label_str(labelnames, key)} {_format_value(self._value)}"]
+
+
+class Counter(_Family):
+    type_name = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+
+class Gauge(_Family):
+    type_name = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+
+class _HistogramValue:
+    __slots__ = ("_upper_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]) -> None:
+        self._upper_bounds = upper_bounds
+        self._counts = [0] * (len(upper_bounds) + 1)   # last slot: +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def render(self, name: str, labelnames, key) -> List[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self._upper_bounds + (float("inf"),), counts):
+            cumulative += count
+            labels = _label_str(labelnames + ("le",), key + (_format_value(bound),))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        base = _label_str(labelnames, key)
+        lines.append(f"{name}_sum{base} {_format_value(total_sum)}")
+        lines.append(f"{name}_count{base} {cumulative}")
+        return lines
+
+
+class Histogram(_Family):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+
+def render_prometheus() -> str:
+    with _registry_lock:
+        families = list(_registry)
+    lines: List[str] = []
+    for family in families:
+        lines.extend(family.render())
+    return "\n".join(lines) + "\n"
+
+
+class track:
+    """
+    Context manager: time the block into `duration`, count it in `outcomes`
+    with an extra outcome="ok"/"error" label, and keep `in_flight` up to
+    date. All three families share `labels` (outcomes adds "outcome").
+    A generator closed by its consumer (GeneratorExit) counts as "ok".
+    """
+
+    __slots__ = ("duration", "outcomes", "gauge", "labels", "started")
+
+    def __init__(
+        self,
+        duration: Histogram,
+        outcomes: Optional[Counter] = None,
+        in_flight: Optional[Gauge] = None,
+        **labels: str,
+    ) -> None:
+        self.duration = duration
+        self.outcomes = outcomes
+        self.gauge = in_flight.labels(**labels) if in_flight is not None else None
+        self.labels = labels
+
+    def __enter__(self) -> "track":
+        if self.gauge is not None:
+            self.gauge.inc()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration.labels(**self.labels).observe(time.perf_counter() - self.started)
+        if self.outcomes is not None:
+            ok = exc_type is None or issubclass(exc_type, GeneratorExit)
+            outcome = "ok" if ok else "error"
+            self.outcomes.labels(outcome=outcome, **self.labels).inc()
+        if self.gauge is not None:
+            self.gauge.dec()
+
+
+def instrumented(
+    duration: Histogram,
+    outcomes: Optional[Counter] = None,
+    in_flight: Optional[Gauge] = None,
+    **labels: str,
+) -> Callable:
+    """
+    Decorator form of track(). On a generator function the tracked block is
+    the whole iteration, until the generator is exhausted or closed (time
+    spent suspended between items included).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                with track(duration, outcomes, in_flight, **labels):
+                    yield from func(*args, **kwargs)
+
+            return generator_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with track(duration, outcomes, in_flight, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: HTTP latency / status counts by route template
+    (e.g. "/requests/{request_id}", so ids do not explode label sets) and
+    in-flight requests. Streaming responses are timed until the last byte.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels()
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_REQUEST_DURATION.labels(method=method, route=path).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(method=method, route=path, status=status_code).inc()
+
+
+# ----------------------------------------------------------------------
+# Application metrics
+# ----------------------------------------------------------------------
+
+HTTP_REQUEST_DURATION = Histogram(
+    "regent_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+HTTP_REQUESTS = Counter(
+    "regent_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "regent_http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+
+PIPELINE_IN_FLIGHT = Gauge(
+    "regent_pipelines_in_flight",
+    "Request pipelines currently running.",
+)
+PIPELINE_DURATION = Histogram(
+    "regent_pipeline_duration_seconds",
+    "End-to-end run_request_pipeline duration.",
+)
+PIPELINE_RUNS = Counter(
+    "regent_pipeline_runs_total",
+    "Pipeline runs by final request status.",
+    ("status",),
+)
+
+AGENT_DURATION = Histogram(
+    "regent_agent_duration_seconds",
+    "Duration of one agent step of run_regent_flow.",
+    ("agent",),
+)
+AGENT_RUNS = Counter(
+    "regent_agent_runs_total",
+    "Agent step invocations by outcome.",
+    ("agent", "outcome"),
+)
+
+CONNECTOR_DURATION = Histogram(
+    "regent_connector_duration_seconds",
+    "Duration of one discovery connector call (a stream: its whole iteration).",
+    ("connector",),
+)
+CONNECTOR_CALLS = Counter(
+    "regent_connector_calls_total",
+    "Discovery connector calls by outcome.",
+    ("connector", "outcome"),
+)
+CONNECTOR_IN_FLIGHT = Gauge(
+    "regent_connector_calls_in_flight",
+    "Discovery connector calls currently running.",
+    ("connector",),
+)
+DISCOVERY_TIMEOUTS = Counter(
+    "regent_discovery_timeouts_total",
+    "Connector calls abandoned by run_discovery at their deadline.",
+    ("connector",),
+)
+
+LLM_DURATION = Histogram(
+    "regent_llm_request_duration_seconds",
+    "Duration of one LLM backend call (cache hits excluded).",
+    ("api",),
+)
+LLM_REQUESTS = Counter(
+    "regent_llm_requests_total",
+    "generate_summary calls by outcome "
+    "(ok, empty, error, cache_hit).",
+    ("api", "outcome"),
+)
+LLM_IN_FLIGHT = Gauge(
+    "regent_llm_requests_in_flight",
+    "LLM backend calls currently running.",
+    ("api",),
+)
+
+DB_COMMIT_DURATION = Histogram(
+    "regent_db_commit_duration_seconds",
+    "Session.commit() duration, including the final flush.",
+)
+DB_COMMITS = Counter(
+    "regent_db_commits_total",
+    "Session commits by outcome.",
+    ("outcome",),
+)
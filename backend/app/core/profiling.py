@@ -0,0 +1,246 @@
+# backend/app/core/profiling.py
+
+"""
+Opt-in profiling of individual pipeline runs.
+
+A run is profiled when profiling is enabled and either the request was
+flagged when it was submitted (admin header on POST /requests, see
+RequestProfiler.mark) or it falls in the random settings.profiling_sample_rate
+fraction. Profiles are written to settings.profiling_dir, keyed by request id:
+
+    request-<id>.pstats      cProfile stats   (profiling_mode="cprofile")
+    request-<id>.collapsed   sampled stacks   (profiling_mode="sample"),
+                             "frame;frame;frame count" lines for
+                             flamegraph.pl / speedscope
+
+and served by GET /admin/requests/{id}/profile. The flag is a marker file in
+the same directory, so it also reaches a separate run_worker.py process.
+
+When profiling is disabled, profile_request() is a settings check returning
+a shared no-op context manager.
+"""
+
+import cProfile
+import os
+import random
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import get_settings
+
+PROFILE_FORMATS = ("pstats", "collapsed")
+
+_NO_PROFILE = nullcontext()
+
+# Only one cProfile profiler can be active per process (Python 3.12+); runs
+# that find it busy are sampled instead.
+_cprofile_lock = threading.Lock()
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack every `interval` seconds from a
+    background thread and counts identical stacks (collapsed format).
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.counts: Dict[str, int] = Counter()
+        self._target: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        # Samples the calling thread.
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="regent-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def render(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.items())
+
+
+class RequestProfiler:
+    def __init__(
+        self,
+        directory: str,
+        mode: str = "cprofile",
+        sample_rate: float = 0.0,
+        sample_interval: float = 0.005,
+        max_profiles: int = 500,
+    ) -> None:
+        self.directory = directory
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.sample_interval = sample_interval
+        self.max_profiles = max_profiles
+
+    # ----------------- Paths -----------------
+
+    def path(self, request_id: int, fmt: str) -> str:
+        return os.path.join(self.directory, f"request-{request_id}.{fmt}")
+
+    def _marker_path(self, request_id: int) -> str:
+        return os.path.join(self.directory, f"request-{request_id}.requested")
+
+    def available(self, request_id: int) -> List[str]:
+        """
+        Formats stored for this request.
+        """
+        return [fmt for fmt in PROFILE_FORMATS if os.path.isfile(self.path(request_id, fmt))]
+
+    # ----------------- Selection -----------------
+
+    def mark(self, request_id: int) -> None:
+        """
+        Flag a request so its pipeline run is profiled.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._marker_path(request_id), "w"):
+            pass
+
+    def unmark(self, request_id: int) -> None:
+        """
+        Drop the flag set by mark() (e.g. the request was never stored).
+        """
+        self._take_marker(request_id)
+
+    def _take_marker(self, request_id: int) -> bool:
+        try:
+            os.remove(self._marker_path(request_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def should_profile(self, request_id: int) -> bool:
+        marked = self._take_marker(request_id)
+        return marked or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    # ----------------- Profiling -----------------
+
+    @contextmanager
+    def profile(self, request_id: int) -> Iterator[None]:
+        """
+        Profile the block (on the calling thread) and store the result
+        under request_id.
+        """
+
+        if self.mode == "cprofile" and _cprofile_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                try:
+                    yield
+                finally:
+                    profiler.disable()
+                    self._save(request_id, "pstats", profiler.dump_stats)
+            finally:
+                _cprofile_lock.release()
+            return
+
+        sampler = StackSampler(self.sample_interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            rendered = sampler.render()
+
+            def write(path: str) -> None:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(rendered)
+
+            self._save(request_id, "collapsed", write)
+
+    def _save(self, request_id: int, fmt: str, write) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self.path(request_id, fmt)
+            tmp_path = f"{path}.tmp"
+            write(tmp_path)
+            os.replace(tmp_path, path)
+            # A request profiled again (e.g. requeued) keeps only its latest format.
+            for other in PROFILE_FORMATS:
+                if other != fmt and os.path.exists(self.path(request_id, other)):
+                    os.remove(self.path(request_id, other))
+            self._prune()
+            print(f"[Profiler] Stored {fmt} profile for request {request_id}")
+        except OSError as e:
+            print(f"[Profiler] Could not store profile for request {request_id}: {e}")
+
+    def _prune(self) -> None:
+        # Keep the newest max_profiles profiles.
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(PROFILE_FORMATS):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        if len(entries) <= self.max_profiles:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_profiles]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_profiler: Optional[RequestProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_request_profiler() -> RequestProfiler:
+    """
+    Process-wide RequestProfiler configured from Settings.
+    """
+
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            settings = get_settings()
+            _profiler = RequestProfiler(
+                directory=settings.profiling_dir,
+                mode=settings.profiling_mode,
+                sample_rate=settings.profiling_sample_rate,
+                sample_interval=settings.profiling_sample_interval_ms / 1000.0,
+                max_profiles=settings.profiling_max_profiles,
+            )
+        return _profiler
+
+
+def profile_request(request_id: int):
+    """
+    Context manager around one pipeline run: profiles it when selected,
+    otherwise does nothing.
+    """
+
+    if not get_settings().profiling_enabled:
+        return _NO_PROFILE
+    profiler = get_request_profiler()
+    if not profiler.should_profile(request_id):
+        return _NO_PROFILE
+    return profiler.profile(request_id)
@@ -0,0 +1,36 @@
+# backend/app/db/async_session.py
+
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.db.engine_profiles import create_tuned_async_engine, to_async_url
+
+settings = get_settings()
+
+# Async engine for the API routes: aiosqlite locally, asyncpg (or another
+# async driver) for server DBs. Same database and tuning as the sync engine
+# in app/db/session.py, which background workers and scripts keep using.
+async_engine = create_tuned_async_engine(
+    settings.async_database_url or to_async_url(settings.DATABASE_URL),
+    settings,
+    echo=False,
+)
+
+# expire_on_commit=False: attributes stay loaded after commit, so routes can
+# build responses without an implicit (blocking) refresh.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency.
+    Yields an AsyncSession and makes sure it's closed after the request.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
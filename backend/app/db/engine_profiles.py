@@ -0,0 +1,130 @@
+# backend/app/db/engine_profiles.py
+
+"""
+Per-backend engine tuning.
+
+- SQLite: WAL journal (readers no longer block the writer and vice versa),
+  synchronous=NORMAL (safe with WAL, far fewer fsyncs), a busy timeout so
+  concurrent writers wait instead of failing with "database is locked",
+  plus a larger page cache and mmap I/O. Applied with a "connect" event
+  listener, i.e. once per pooled connection.
+- Server databases (Postgres, MySQL, ...): a sized QueuePool with
+  pre-ping (drop dead connections before use) and recycle (avoid server /
+  proxy idle timeouts).
+
+Everything is driven by Settings.db_* values, for both the sync engine
+(app/db/session.py) and the async engine (app/db/async_session.py).
+"""
+
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import Settings
+
+
+def is_sqlite_url(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+# Sync driver (or bare backend name) -> async driver.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Same database, async driver. URLs that already name an async driver
+    (or an unknown one) are returned unchanged.
+    """
+
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:"
+
+
+def engine_kwargs(url: str, settings: Settings) -> Dict[str, Any]:
+    """
+    Keyword arguments for create_engine / create_async_engine.
+    """
+
+    if not settings.db_tuning_enabled:
+        return {}
+
+    if is_sqlite_url(url):
+        if _is_sqlite_memory(url):
+            # In-memory SQLite uses a special pool; leave it alone.
+            return {}
+        return {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "connect_args": {"timeout": settings.db_sqlite_busy_timeout_ms / 1000},
+        }
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def apply_engine_profile(engine: Engine, settings: Settings) -> Engine:
+    """
+    Attach per-connection tuning to a (sync) engine. For an AsyncEngine,
+    pass async_engine.sync_engine.
+    """
+
+    if not settings.db_tuning_enabled or not is_sqlite_url(str(engine.url)):
+        return engine
+
+    pragmas = [
+        f"PRAGMA journal_mode={settings.db_sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.db_sqlite_synchronous}",
+        f"PRAGMA busy_timeout={int(settings.db_sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size=-{int(settings.db_sqlite_cache_size_kib)}",
+        f"PRAGMA mmap_size={int(settings.db_sqlite_mmap_size)}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def create_tuned_engine(url: str, settings: Settings, **kwargs: Any) -> Engine:
+    options = engine_kwargs(url, settings)
+    options.update(kwargs)
+    engine = create_engine(url, **options)
+    return apply_engine_profile(engine, settings)
+
+
+def create_tuned_async_engine(url: str, settings: Settings, **kwargs: Any) -> AsyncEngine:
+    options = engine_kwargs(url, settings)
+    options.update(kwargs)
+    engine = create_async_engine(url, **options)
+    apply_engine_profile(engine.sync_engine, settings)
+    return engine
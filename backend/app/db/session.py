@@ -1,15 +1,22 @@
 # backend/app/db/session.py
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
+from app.core.metrics import DB_COMMIT_DURATION, DB_COMMITS
+from app.db.engine_profiles import create_tuned_engine
 
 settings = get_settings()
 
+# Per-backend tuning (SQLite PRAGMAs / pool sizing) comes from the engine
+# profile; see app/db/engine_profiles.py.
 # echo=True will print SQL queries in console (handy for debugging, but noisy)
-engine = create_engine(
+engine = create_tuned_engine(
     settings.DATABASE_URL,
+    settings,
     echo=False,
     future=True,  # SQLAlchemy 2.x style
 )
@@ -22,6 +29,30 @@ SessionLocal = sessionmaker(
 )
 
 
+# Commit latency for every Session (sync, and the sync side of AsyncSession).
+# before_commit fires before the final flush, so flush time is included.
+@event.listens_for(Session, "before_commit")
+def _commit_started(session):
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_finished(session):
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_DURATION.labels().observe(time.perf_counter() - started)
+        DB_COMMITS.labels(outcome="ok").inc()
+
+
+@event.listens_for(Session, "after_rollback")
+def _commit_failed(session):
+    # Only counts rollbacks that interrupted a commit.
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_DURATION.labels().observe(time.perf_counter() - started)
+        DB_COMMITS.labels(outcome="error").inc()
+
+
 def get_db():
     """
     FastAPI dependency.
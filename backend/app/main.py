@@ -1,23 +1,55 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import requests as requests_router
 from app.api.routes import admin as admin_router
+from app.api.routes import llm as llm_router
+from app.api.routes import metrics as metrics_router
 from app.core.config import get_settings
+from app.core.metrics import MetricsMiddleware
+from app.db.async_session import async_engine
 from app.db.base_class import Base
 from app.db.session import engine
+from app.models import DataRightsRequest  # registers all app models
+from app.services.job_runner import get_job_runner
+from app.services.llm_client import close_llm_client
+from app.services.llm_dispatcher import get_llm_dispatcher
+from app.tools.mongo_connector import close_mongo_client
 
 settings = get_settings()
 
 # 🔹 Create all tables at startup (VERY IMPORTANT)
 Base.metadata.create_all(bind=engine)
 
+# 🔹 create_all skips existing tables, so add indexes introduced later
+for index in DataRightsRequest.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 🔹 Background workers that run the pipeline for PENDING requests
+    runner = get_job_runner()
+    runner.start(stale_after_seconds=settings.job_stale_after_seconds)
+    try:
+        yield
+    finally:
+        runner.stop(timeout=30)
+        get_llm_dispatcher().stop(timeout=5)
+        # 🔹 Release pooled connections held by shared clients
+        close_mongo_client()
+        close_llm_client()
+        await async_engine.dispose()
+
 
 def get_application() -> FastAPI:
     app = FastAPI(
         title="Regent Data Rights Orchestrator",
         version="1.0.0",
         description="Automating GDPR/CCPA data rights workflows",
+        lifespan=lifespan,
     )
 
     # 🔹 CORS
@@ -27,11 +59,18 @@ def get_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # 🔹 Routers – no prefix to avoid the '/' assertion error
     app.include_router(requests_router.router)
     app.include_router(admin_router.router)
+    app.include_router(llm_router.router)
+
+    # 🔹 Prometheus metrics (GET /metrics) + HTTP latency / in-flight tracking
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router.router)
 
     return app
 
@@ -1 +1,2 @@
 from .request import DataRightsRequest  # re-export for convenience
+from .request_log import RequestAction, RequestLogEvent
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 
 from app.db.base_class import Base
 
@@ -12,6 +12,10 @@ class DataRightsRequest(Base):
     """
 
     __tablename__ = "data_rights_requests"
+    __table_args__ = (
+        # Keyset pagination of the admin list: ORDER BY created_at DESC, id DESC
+        Index("ix_data_rights_requests_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -30,9 +34,10 @@ class DataRightsRequest(Base):
     user_summary = Column(Text, nullable=True)
     admin_report = Column(Text, nullable=True)
 
-    # Logs + actions stored as JSON arrays
-    logs = Column(JSON, nullable=True)
-    actions = Column(JSON, nullable=True)
+    # Logs + actions live in request_events / request_actions
+    # (app/models/request_log.py). Databases created before that may still
+    # have unused, nullable `logs` / `actions` JSON columns on this table;
+    # they are no longer mapped.
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+
+from app.db.base_class import Base
+
+
+class RequestLogEvent(Base):
+    """
+    One pipeline log line / status transition of a request.
+    Append-only; ordered by seq within a request.
+    """
+
+    __tablename__ = "request_events"
+    __table_args__ = (
+        Index("ix_request_events_request_id_seq", "request_id", "seq", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    request_id = Column(Integer, ForeignKey("data_rights_requests.id"), nullable=False)
+    seq = Column(Integer, nullable=False)
+
+    event = Column(String(16), nullable=False)   # "log" / "status"
+    step = Column(String(32), nullable=True)     # pipeline step, e.g. "discovery"
+    message = Column(Text, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class RequestAction(Base):
+    """
+    One deletion / masking / flagging action decided for a request.
+    Append-only; ordered by seq within a request.
+    """
+
+    __tablename__ = "request_actions"
+    __table_args__ = (
+        Index("ix_request_actions_request_id_seq", "request_id", "seq", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    request_id = Column(Integer, ForeignKey("data_rights_requests.id"), nullable=False)
+    seq = Column(Integer, nullable=False)
+
+    source_name = Column(String, nullable=True)
+    location_type = Column(String, nullable=True)
+    action_type = Column(String, nullable=True)
+    status = Column(String, nullable=True)
+    details = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
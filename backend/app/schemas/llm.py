@@ -0,0 +1,37 @@
+# backend/app/schemas/llm.py
+
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SummaryCacheStats(BaseModel):
+    enabled: bool
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    stores: int
+    evictions: int
+    invalidations: int
+    memory_entries: int
+    disk_entries: int
+
+
+class SummaryCacheInvalidation(BaseModel):
+    model: Optional[str] = None   # None -> all models
+    removed: int
+
+
+class LlmDispatcherStats(BaseModel):
+    submitted: int
+    cache_hits: int
+    shed: int
+    expired: int
+    completed: int
+    failed: int
+    queue_depth: int
+    in_flight: int
+    max_concurrency: int
+    max_queue: int
+    wait_seconds_p50: float
+    wait_seconds_p95: float
+    wait_seconds_max: float
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -22,6 +22,15 @@ class RequestCreateResponse(BaseModel):
     mode: str
 
 
+# ---------- Per-line result for POST /requests/bulk (NDJSON) ----------
+
+class BulkRequestLineResult(BaseModel):
+    line: int
+    status: str                  # "created" / "error"
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
 # ---------- User-facing status view (GET /requests/{id}) ----------
 
 class RequestStatusResponse(BaseModel):
@@ -50,6 +59,26 @@ class RequestAdminListItem(BaseModel):
     updated_at: datetime
 
 
+# ---------- Pipeline logs / actions (request_events / request_actions) ----------
+
+class RequestLogEntry(BaseModel):
+    seq: int
+    event: str                   # "log" / "status"
+    step: Optional[str] = None
+    message: str
+    created_at: datetime
+
+
+class RequestActionEntry(BaseModel):
+    seq: int
+    source_name: Optional[str] = None
+    location_type: Optional[str] = None
+    action_type: Optional[str] = None
+    status: Optional[str] = None
+    details: Optional[str] = None
+    created_at: datetime
+
+
 # ---------- Admin detail view (GET /admin/requests/{id}) ----------
 
 class RequestAdminDetail(BaseModel):
@@ -63,7 +92,10 @@ class RequestAdminDetail(BaseModel):
     message: Optional[str] = None
     user_summary: Optional[str] = None
     admin_report: Optional[str] = None
-    logs: List[str] = []
-    actions: List[Any] = []
+    # First page of each; the rest via /admin/requests/{id}/logs|actions.
+    logs: List[RequestLogEntry] = []
+    actions: List[RequestActionEntry] = []
+    log_count: int = 0
+    action_count: int = 0
     created_at: datetime
     updated_at: datetime
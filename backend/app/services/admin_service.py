@@ -0,0 +1,157 @@
+# backend/app/services/admin_service.py
+
+"""
+Query helpers for the admin request list.
+
+The list uses keyset pagination on (created_at, id) – newest first – backed
+by the composite index ix_data_rights_requests_created_at_id, and selects
+only the columns shown in the list (never the large report / JSON blobs).
+The cursor is an opaque token encoding the (created_at, id) of the last
+row of the previous page.
+
+A request's logs / actions (request_events / request_actions) are paged
+the same way on (request_id, seq), with the last seq as the cursor.
+"""
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import Select, and_, func, or_, select
+
+from app.models.request import DataRightsRequest
+from app.models.request_log import RequestAction, RequestLogEvent
+
+LIST_COLUMNS = (
+    DataRightsRequest.id,
+    DataRightsRequest.email,
+    DataRightsRequest.request_type,
+    DataRightsRequest.status,
+    DataRightsRequest.mode,
+    DataRightsRequest.created_at,
+    DataRightsRequest.updated_at,
+)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class RequestListFilters:
+    status: Optional[str] = None
+    request_type: Optional[str] = None
+    mode: Optional[str] = None
+    created_from: Optional[datetime] = None   # inclusive
+    created_to: Optional[datetime] = None     # exclusive
+
+
+def encode_cursor(created_at: datetime, request_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{request_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, request_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(request_id)
+    except Exception as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def build_request_list_query(
+    filters: RequestListFilters,
+    cursor: Optional[str],
+    limit: int,
+) -> Select:
+    """
+    SELECT of the list columns for one page. Fetches limit + 1 rows so the
+    caller can tell whether a next page exists.
+    """
+
+    stmt = select(*LIST_COLUMNS)
+
+    if filters.status:
+        stmt = stmt.where(DataRightsRequest.status == filters.status)
+    if filters.request_type:
+        stmt = stmt.where(DataRightsRequest.request_type == filters.request_type)
+    if filters.mode:
+        stmt = stmt.where(DataRightsRequest.mode == filters.mode)
+    if filters.created_from:
+        stmt = stmt.where(DataRightsRequest.created_at >= filters.created_from)
+    if filters.created_to:
+        stmt = stmt.where(DataRightsRequest.created_at < filters.created_to)
+
+    if cursor:
+        after_created_at, after_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                DataRightsRequest.created_at < after_created_at,
+                and_(
+                    DataRightsRequest.created_at == after_created_at,
+                    DataRightsRequest.id < after_id,
+                ),
+            )
+        )
+
+    return stmt.order_by(
+        DataRightsRequest.created_at.desc(),
+        DataRightsRequest.id.desc(),
+    ).limit(limit + 1)
+
+
+LOG_COLUMNS = (
+    RequestLogEvent.seq,
+    RequestLogEvent.event,
+    RequestLogEvent.step,
+    RequestLogEvent.message,
+    RequestLogEvent.created_at,
+)
+
+ACTION_COLUMNS = (
+    RequestAction.seq,
+    RequestAction.source_name,
+    RequestAction.location_type,
+    RequestAction.action_type,
+    RequestAction.status,
+    RequestAction.details,
+    RequestAction.created_at,
+)
+
+
+def decode_seq_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def _build_seq_page_query(model, columns, request_id: int, cursor: Optional[str], limit: int) -> Select:
+    return (
+        select(*columns)
+        .where(model.request_id == request_id, model.seq > decode_seq_cursor(cursor))
+        .order_by(model.seq)
+        .limit(limit + 1)
+    )
+
+
+def build_request_logs_query(request_id: int, cursor: Optional[str], limit: int) -> Select:
+    """
+    One page (limit + 1 rows) of a request's log lines, in seq order.
+    """
+    return _build_seq_page_query(RequestLogEvent, LOG_COLUMNS, request_id, cursor, limit)
+
+
+def build_request_actions_query(request_id: int, cursor: Optional[str], limit: int) -> Select:
+    """
+    One page (limit + 1 rows) of a request's actions, in seq order.
+    """
+    return _build_seq_page_query(RequestAction, ACTION_COLUMNS, request_id, cursor, limit)
+
+
+def build_count_query(model, request_id: int) -> Select:
+    return select(func.count()).select_from(model).where(model.request_id == request_id)
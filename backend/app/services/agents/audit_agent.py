@@ -1,8 +1,9 @@
+from concurrent.futures import wait
 from textwrap import indent
-from typing import Any, List
+from typing import Any, List, Optional
 
 from app.core.config import get_settings
-from app.services.llm_client import generate_summary
+from app.services.llm_dispatcher import get_llm_dispatcher
 
 
 class AuditAgent:
@@ -14,42 +15,75 @@ class AuditAgent:
         * user_summary  -> short explanation for end-user
         * admin_report  -> detailed technical story for admin
     - Uses LLM if enabled; otherwise, falls back to deterministic templates.
+    - The two LLM prompts are independent, so they are sent concurrently:
+      latency is the slower of the two generations, not their sum.
+      Both go through the LLM dispatcher, which bounds backend concurrency
+      and sheds to the templates under load.
     """
 
     def run(self, state: Any) -> Any:
+        """
+        Both LLM prompts are built (only when the LLM is enabled), queued on
+        the dispatcher at once and waited for under one deadline
+        (settings.audit_llm_deadline_seconds).
+        """
         settings = get_settings()
+        prepared = self._prepare(state)
 
-        # ----- 1. Prepare raw text blocks from state -----
-        logs_text = self._format_logs(state.logs)
-        actions_text = self._format_actions(getattr(state, "deletion_actions", []))
-
-        # Basic, always-available fallbacks:
-        user_summary_fallback = self._build_user_summary_fallback(state, actions_text)
-        admin_report_fallback = self._build_admin_report_fallback(state, logs_text, actions_text)
-
-        used_llm = False
-
-        # ----- 2. Try LLM for user-facing summary -----
-        user_summary = None
+        user_summary = admin_report = None
         if settings.llm_enabled:
+            deadline = settings.audit_llm_deadline_seconds
+            dispatcher = get_llm_dispatcher()
+            logs_text, actions_text = prepared["logs_text"], prepared["actions_text"]
             user_prompt = self._build_user_prompt_for_llm(state, logs_text, actions_text)
-            user_summary = generate_summary(user_prompt, max_tokens=350)
-            if user_summary:
-                used_llm = True
-
-        # ----- 3. Try LLM for admin technical report -----
-        admin_report = None
-        if settings.llm_enabled:
             admin_prompt = self._build_admin_prompt_for_llm(state, logs_text, actions_text)
-            admin_report = generate_summary(admin_prompt, max_tokens=900)
-            if admin_report:
-                used_llm = True
+            user_future = dispatcher.submit(user_prompt, 350, deadline)
+            admin_future = dispatcher.submit(admin_prompt, 900, deadline)
+            wait([user_future, admin_future], timeout=deadline)
+            for future in (user_future, admin_future):
+                future.cancel()  # no-op unless still queued
+            user_summary = self._result_or_none(user_future)
+            admin_report = self._result_or_none(admin_future)
+
+        return self._finish(state, prepared, user_summary, admin_report)
 
-        # ----- 4. Fallbacks if LLM disabled / fails -----
-        state.user_summary = (user_summary or user_summary_fallback).strip()
-        state.admin_report = (admin_report or admin_report_fallback).strip()
+    def _prepare(self, state: Any) -> dict:
+        # ----- 1. Prepare raw text blocks from state -----
+        logs_text = self._format_logs(state.logs)
+        actions_text = self._format_actions(getattr(state, "deletion_actions", []))
 
-        # ----- 5. Log what we did -----
+        # Basic, always-available fallbacks; the LLM prompts are only built
+        # by run() when the LLM is enabled.
+        return {
+            "logs_text": logs_text,
+            "actions_text": actions_text,
+            "user_summary_fallback": self._build_user_summary_fallback(state, actions_text),
+            "admin_report_fallback": self._build_admin_report_fallback(state, logs_text, actions_text),
+        }
+
+    @staticmethod
+    def _result_or_none(future) -> Optional[str]:
+        if not future.done() or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _finish(
+        self,
+        state: Any,
+        prepared: dict,
+        user_summary: Optional[str],
+        admin_report: Optional[str],
+    ) -> Any:
+        used_llm = bool(user_summary or admin_report)
+
+        # ----- Fallbacks if LLM disabled / fails / misses the deadline -----
+        state.user_summary = (user_summary or prepared["user_summary_fallback"]).strip()
+        state.admin_report = (admin_report or prepared["admin_report_fallback"]).strip()
+
+        # ----- Log what we did -----
         if used_llm:
             state.logs.append("AuditAgent: generated user_summary + admin_report using LLM.")
         else:
@@ -0,0 +1,218 @@
+# backend/app/services/bulk_intake.py
+
+"""
+Streaming NDJSON intake for data-rights requests.
+
+Used by POST /requests/bulk and by the `import_requests.py` CLI:
+
+- NdjsonLineSplitter turns arbitrary byte chunks into lines, so input is
+  never loaded into memory as a whole (oversized lines are dropped early).
+- BulkRequestBatch validates lines one by one and buffers at most
+  `chunk_size` rows, which are then written with a single multi-row INSERT
+  in their own transaction.
+- Results come back per input line, in input order.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.request import DataRightsRequest
+from app.schemas.requests import BulkRequestLineResult, CreateRequestPayload
+
+
+class NdjsonLineSplitter:
+    """
+    Incremental newline splitter.
+
+    feed() returns the complete lines found so far; a line that grows past
+    max_line_bytes is returned as None (and its remaining bytes are skipped).
+    """
+
+    def __init__(self, max_line_bytes: int) -> None:
+        self.max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+        self._discarding = False
+
+    def feed(self, chunk: bytes) -> List[Optional[bytes]]:
+        lines: List[Optional[bytes]] = []
+        start = 0
+
+        while True:
+            newline = chunk.find(b"\n", start)
+            if newline == -1:
+                break
+            if self._discarding:
+                self._discarding = False
+            elif len(self._buffer) + (newline - start) > self.max_line_bytes:
+                lines.append(None)
+            else:
+                self._buffer += chunk[start:newline]
+                lines.append(bytes(self._buffer))
+            self._buffer.clear()
+            start = newline + 1
+
+        if not self._discarding:
+            self._buffer += chunk[start:]
+            if len(self._buffer) > self.max_line_bytes:
+                # Report it once now, then skip until the next newline.
+                lines.append(None)
+                self._buffer.clear()
+                self._discarding = True
+
+        return lines
+
+    def close(self) -> List[Optional[bytes]]:
+        if self._discarding or not self._buffer:
+            return []
+        line = bytes(self._buffer)
+        self._buffer.clear()
+        return [line]
+
+
+class BulkRequestBatch:
+    """
+    Buffer of validated rows (plus the results of invalid lines) waiting
+    to be inserted together.
+    """
+
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+        self.rows: List[Dict[str, Any]] = []
+        # (line number, index into rows or None, error message)
+        self.entries: List[Tuple[int, Optional[int], Optional[str]]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_line(self, line_no: int, raw: Optional[bytes]) -> None:
+        if raw is not None and not raw.strip():
+            # Blank lines are allowed and produce no result.
+            return
+        if raw is None:
+            self.entries.append((line_no, None, "line too long"))
+            return
+
+        try:
+            payload = CreateRequestPayload.model_validate_json(raw)
+        except ValidationError as e:
+            self.entries.append((line_no, None, _format_validation_error(e)))
+            return
+
+        self.rows.append(
+            {
+                "email": payload.email,
+                "customer_id": payload.customer_id,
+                "phone_last4": payload.phone_last4,
+                "request_type": payload.request_type,
+                "status": "PENDING",
+                "mode": self.mode,
+                "message": payload.message,
+            }
+        )
+        self.entries.append((line_no, len(self.rows) - 1, None))
+
+    def flush(self, db: Session) -> List[BulkRequestLineResult]:
+        """
+        Insert all buffered rows in one transaction and return the results
+        for every buffered line. The batch is empty afterwards.
+        """
+
+        ids: List[int] = []
+        insert_error: Optional[str] = None
+
+        if self.rows:
+            try:
+                ids = insert_request_rows(db, self.rows)
+            except Exception as e:
+                db.rollback()
+                insert_error = f"insert failed: {e.__class__.__name__}"
+                print(f"[BulkIntake] Chunk insert failed: {e}")
+
+        results: List[BulkRequestLineResult] = []
+        for line_no, row_index, error in self.entries:
+            if row_index is None:
+                results.append(BulkRequestLineResult(line=line_no, status="error", error=error))
+            elif insert_error:
+                results.append(BulkRequestLineResult(line=line_no, status="error", error=insert_error))
+            else:
+                results.append(BulkRequestLineResult(line=line_no, status="created", id=ids[row_index]))
+
+        self.rows = []
+        self.entries = []
+        return results
+
+
+def insert_request_rows(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Multi-row INSERT of DataRightsRequest rows in a single transaction.
+    Returns the new ids in the same order as `rows`.
+    """
+
+    now = datetime.utcnow()
+    for row in rows:
+        row["created_at"] = now
+        row["updated_at"] = now
+
+    result = db.execute(
+        insert(DataRightsRequest).returning(
+            DataRightsRequest.id, sort_by_parameter_order=True
+        ),
+        rows,
+    )
+    ids = list(result.scalars())
+    db.commit()
+    return ids
+
+
+def import_request_lines(
+    db: Session,
+    lines: Iterable[Optional[bytes]],
+    chunk_size: Optional[int] = None,
+) -> Iterator[BulkRequestLineResult]:
+    """
+    Validate and insert NDJSON lines, yielding one result per non-blank line.
+    Memory use is bounded by `chunk_size`, not by the input size.
+    """
+
+    settings = get_settings()
+    chunk_size = chunk_size or settings.bulk_chunk_size
+
+    batch = BulkRequestBatch(mode=settings.MODE)
+    for line_no, raw in enumerate(lines, start=1):
+        batch.add_line(line_no, raw)
+        if len(batch) >= chunk_size:
+            yield from batch.flush(db)
+
+    if len(batch):
+        yield from batch.flush(db)
+
+
+def results_to_ndjson(results: List[BulkRequestLineResult]) -> bytes:
+    return "".join(r.model_dump_json(exclude_none=True) + "\n" for r in results).encode()
+
+
+def iter_file_lines(
+    chunks: Iterable[bytes],
+    max_line_bytes: Optional[int] = None,
+) -> Iterator[Optional[bytes]]:
+    """
+    Split an iterable of byte chunks (e.g. a file read in blocks) into lines.
+    """
+
+    splitter = NdjsonLineSplitter(max_line_bytes or get_settings().bulk_max_line_bytes)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    parts = []
+    for err in e.errors():
+        loc = ".".join(str(p) for p in err.get("loc", ())) or "line"
+        parts.append(f"{loc}: {err.get('msg')}")
+    return "; ".join(parts)
@@ -0,0 +1,158 @@
+# backend/app/services/event_bus.py
+
+"""
+In-process pub/sub for live request progress.
+
+Pipeline code (worker threads) publishes events per request id; SSE
+subscribers (asyncio, see GET /requests/{id}/events) receive them as they
+happen. Each request keeps a ring buffer of its most recent events with
+increasing ids, so a reconnecting client can resume from its Last-Event-ID
+and a late subscriber still sees what it missed.
+
+Event types:
+    status   {"status": ...}          status transition
+    log      {"message": ...}         one agent log line
+    summary  {"user_summary": ...}    final user-facing summary
+    done     {"status": ...}          terminal event, stream ends
+
+Only events published in this process are seen; the SSE route falls back
+to the database for requests run elsewhere (e.g. run_worker.py).
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+
+TERMINAL_EVENT = "done"
+
+
+@dataclass
+class RequestEvent:
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+
+class Subscription:
+    """
+    One subscriber's view of a request's events; iterate with get().
+    """
+
+    def __init__(self, bus: "EventBus", request_id: int) -> None:
+        self.bus = bus
+        self.request_id = request_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[RequestEvent]" = asyncio.Queue()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[RequestEvent]:
+        """
+        Next event, or None if nothing arrived within `timeout` seconds.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus._unsubscribe(self)
+
+
+@dataclass
+class _Topic:
+    buffer: Deque[RequestEvent]
+    next_id: int = 1
+    closed: bool = False
+    subscribers: Set[Subscription] = field(default_factory=set)
+
+
+class EventBus:
+    def __init__(self, buffer_size: int, max_topics: int) -> None:
+        self.buffer_size = buffer_size
+        self.max_topics = max_topics
+        self._lock = threading.Lock()
+        self._topics: "OrderedDict[int, _Topic]" = OrderedDict()
+
+    def _topic(self, request_id: int) -> _Topic:
+        # Caller holds self._lock.
+        topic = self._topics.get(request_id)
+        if topic is None:
+            topic = self._topics[request_id] = _Topic(deque(maxlen=self.buffer_size))
+            self._evict()
+        return topic
+
+    def _evict(self) -> None:
+        # Drop the oldest topics nobody listens to, finished ones first.
+        excess = len(self._topics) - self.max_topics
+        if excess <= 0:
+            return
+        idle = [rid for rid, t in self._topics.items() if not t.subscribers]
+        idle.sort(key=lambda rid: not self._topics[rid].closed)
+        for request_id in idle[:excess]:
+            del self._topics[request_id]
+
+    def publish(self, request_id: int, event: str, data: Dict[str, Any]) -> RequestEvent:
+        """
+        Thread-safe; may be called from any thread.
+        """
+
+        with self._lock:
+            topic = self._topic(request_id)
+            item = RequestEvent(topic.next_id, event, data)
+            topic.next_id += 1
+            topic.buffer.append(item)
+            if event == TERMINAL_EVENT:
+                topic.closed = True
+            subscribers = list(topic.subscribers)
+
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub.queue.put_nowait, item)
+            except RuntimeError:
+                # Subscriber's loop is closed; it will never read again.
+                self._unsubscribe(sub)
+        return item
+
+    def subscribe(
+        self,
+        request_id: int,
+        last_event_id: Optional[int] = None,
+    ) -> Tuple[Subscription, List[RequestEvent]]:
+        """
+        Register a subscriber (must be called from the event loop that will
+        read it). Returns it together with the buffered events newer than
+        last_event_id (all buffered events when None), to replay first.
+        """
+
+        sub = Subscription(self, request_id)
+        with self._lock:
+            topic = self._topic(request_id)
+            topic.subscribers.add(sub)
+            after = last_event_id or 0
+            backlog = [e for e in topic.buffer if e.id > after]
+        return sub, backlog
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            topic = self._topics.get(sub.request_id)
+            if topic is not None:
+                topic.subscribers.discard(sub)
+
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            settings = get_settings()
+            _bus = EventBus(
+                buffer_size=settings.events_buffer_size,
+                max_topics=settings.events_max_requests,
+            )
+        return _bus
@@ -0,0 +1,219 @@
+# backend/app/services/job_runner.py
+
+"""
+Background execution of the Regent pipeline.
+
+POST /requests only persists a PENDING row. A JobRunner owns a small pool of
+worker threads that claim PENDING rows from the database and run the
+pipeline for them, so API latency no longer depends on pipeline duration.
+
+run_batch() / drain_batched() instead claim a group of requests and
+discover all of them in one go (discovery_executor.run_batch_discovery: one
+set of IN-queries and a single pass over the lake for the whole group)
+before running each request's pipeline – for draining a large backlog.
+
+Because claiming goes through the database (see request_service.claim_request),
+several runners can safely drain the same table: the in-process one started
+by the FastAPI lifespan and/or standalone `run_worker.py` processes.
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.agents.state import UserIdentifiers
+from app.models.request import DataRightsRequest
+from app.services.request_service import (
+    claim_next_pending_request,
+    heartbeat_requests,
+    requeue_stale_requests,
+    run_request_pipeline,
+)
+from app.tools.discovery_executor import run_batch_discovery
+
+
+class JobRunner:
+    """
+    Pool of worker threads draining PENDING requests.
+
+    - start(): requeue orphaned rows and spawn the workers
+    - notify(): wake idle workers right away (called after a new request is stored)
+    - stop(): ask workers to exit after their current request
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        poll_interval: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self, stale_after_seconds: Optional[int] = None) -> None:
+        if self.running or self.workers <= 0:
+            return
+
+        if stale_after_seconds:
+            db = self.session_factory()
+            try:
+                requeued = requeue_stale_requests(db, stale_after_seconds)
+                if requeued:
+                    print(f"[JobRunner] Requeued {requeued} stale IN_PROGRESS request(s).")
+            finally:
+                db.close()
+
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(
+                target=self._worker_loop,
+                name=f"regent-worker-{i}",
+                daemon=True,
+            )
+            for i in range(self.workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    def run_once(self) -> bool:
+        """
+        Claim and process a single PENDING request.
+        Returns False when there was nothing to do.
+        """
+
+        db = self.session_factory()
+        try:
+            request_id = claim_next_pending_request(db)
+            if request_id is None:
+                return False
+
+            obj = db.get(DataRightsRequest, request_id)
+            if obj is not None:
+                run_request_pipeline(db, obj)
+            return True
+        finally:
+            db.close()
+
+    def run_batch(self, max_requests: int) -> int:
+        """
+        Claim up to max_requests PENDING requests, discover all of them with
+        one batch discovery, then run each pipeline with its own result.
+        Returns how many were processed (0 when there was nothing to do).
+
+        Claimed rows stay IN_PROGRESS until their turn; all of them are
+        heartbeated before each pipeline starts, so the batch discovery
+        itself must finish within settings.job_stale_after_seconds.
+        """
+
+        db = self.session_factory()
+        try:
+            claimed = []
+            while len(claimed) < max_requests:
+                request_id = claim_next_pending_request(db)
+                if request_id is None:
+                    break
+                claimed.append(request_id)
+            if not claimed:
+                return 0
+
+            requests = [
+                obj for obj in (db.get(DataRightsRequest, rid) for rid in claimed) if obj
+            ]
+            reports = run_batch_discovery(
+                {
+                    obj.id: UserIdentifiers(email=obj.email, customer_id=obj.customer_id)
+                    for obj in requests
+                }
+            )
+            print(
+                f"[JobRunner] Batch discovery for {len(requests)} request(s): "
+                f"{sum(len(r.locations) for r in reports.values())} location(s)."
+            )
+
+            for i, obj in enumerate(requests):
+                heartbeat_requests(db, [o.id for o in requests[i:]])
+                db.commit()
+                # Hand each report over and drop it, so memory shrinks as we go.
+                run_request_pipeline(db, obj, discovery=reports.pop(obj.id))
+            return len(requests)
+        finally:
+            db.close()
+
+    def drain_batched(self, batch_size: int) -> int:
+        """
+        drain(), but batch_size requests at a time with run_batch().
+        """
+
+        processed = 0
+        while not self._stopping.is_set():
+            n = self.run_batch(batch_size)
+            if not n:
+                break
+            processed += n
+        return processed
+
+    def drain(self) -> int:
+        """
+        Process PENDING requests on the calling thread until none are left.
+        Returns how many were processed.
+        """
+
+        processed = 0
+        while not self._stopping.is_set() and self.run_once():
+            processed += 1
+        return processed
+
+    def _worker_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                did_work = self.run_once()
+            except Exception as e:
+                # Keep the worker alive (e.g. database briefly unavailable).
+                print(f"[JobRunner] Worker error: {e}")
+                did_work = False
+
+            if not did_work:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """
+    Process-wide JobRunner configured from Settings.
+    """
+
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            settings = get_settings()
+            _runner = JobRunner(
+                workers=settings.job_workers,
+                poll_interval=settings.job_poll_interval,
+            )
+        return _runner
@@ -1,16 +1,127 @@
+# backend/app/services/llm_client.py
+
+"""
+Tiny LLM client.
+
+One httpx.Client is shared by the whole process, so calls reuse keep-alive
+connections from a bounded pool instead of paying TCP (and TLS) setup per
+generation. It is created on first use and closed by close_llm_client() on
+application shutdown (see app/main.py lifespan). Generations run on the LLM
+dispatcher's worker threads (app/services/llm_dispatcher.py).
+
+Generations go through the summary cache (app/services/summary_cache.py)
+when settings.llm_cache_enabled is set: a cached text is returned without
+calling the backend, and every successful generation is stored.
+"""
+
+import threading
+import time
 from typing import Optional
 
 import httpx
 
 from app.core.config import get_settings
+from app.core.metrics import LLM_DURATION, LLM_IN_FLIGHT, LLM_REQUESTS
+from app.services.summary_cache import cache_key, get_summary_cache
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _client_options() -> dict:
+    settings = get_settings()
+    return {
+        "timeout": settings.llm_timeout_seconds,
+        "limits": httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+        ),
+    }
+
+
+def get_llm_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(**_client_options())
+        return _client
 
 
-def generate_summary(prompt: str, max_tokens: int = 512) -> Optional[str]:
+def close_llm_client() -> None:
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def _generate_url() -> str:
+    return get_settings().llm_base_url.rstrip("/") + "/api/generate"
+
+
+def _generate_payload(prompt: str) -> dict:
+    return {
+        "model": get_settings().llm_model_name,
+        "prompt": prompt,
+        "stream": False,
+    }
+
+
+def _response_text(resp: httpx.Response) -> Optional[str]:
+    resp.raise_for_status()
+    data = resp.json()
+    # Ollama returns text in "response"
+    text = data.get("response")
+    if not text:
+        return None
+    return text.strip()
+
+
+def _cache_lookup(key: Optional[str]) -> Optional[str]:
+    if key is None:
+        return None
+    try:
+        return get_summary_cache().get(key)
+    except Exception as e:
+        print(f"[LLM] Summary cache lookup failed: {e}")
+        return None
+
+
+def _cache_store(key: Optional[str], text: Optional[str]) -> None:
+    if key is None or not text:
+        return
+    try:
+        get_summary_cache().put(key, get_settings().llm_model_name, text)
+    except Exception as e:
+        print(f"[LLM] Summary cache store failed: {e}")
+
+
+def _summary_cache_key(prompt: str, max_tokens: int) -> Optional[str]:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return cache_key(settings.llm_model_name, prompt, max_tokens)
+
+
+def cached_summary(prompt: str, max_tokens: int = 512) -> Optional[str]:
+    """
+    The cached generation for this prompt, if any (no backend call).
+    """
+    return _cache_lookup(_summary_cache_key(prompt, max_tokens))
+
+
+def generate_summary(
+    prompt: str,
+    max_tokens: int = 512,
+    timeout: Optional[float] = None,
+) -> Optional[str]:
     """
     Tiny LLM client.
 
     - If LLM is disabled in settings, returns None.
     - If HTTP call fails, returns None (we then use fallback templates).
+    - timeout overrides settings.llm_timeout_seconds for this call.
 
     This is written to be compatible with a simple Ollama-style endpoint:
       POST {base_url}/api/generate
@@ -22,23 +133,31 @@ def generate_summary(prompt: str, max_tokens: int = 512) -> Optional[str]:
     if not settings.llm_enabled:
         return None
 
+    key = _summary_cache_key(prompt, max_tokens)
+    cached = _cache_lookup(key)
+    if cached is not None:
+        LLM_REQUESTS.labels(api="sync", outcome="cache_hit").inc()
+        return cached
+
+    in_flight = LLM_IN_FLIGHT.labels(api="sync")
+    in_flight.inc()
+    started = time.perf_counter()
     try:
-        with httpx.Client(timeout=20.0) as client:
-            url = settings.llm_base_url.rstrip("/") + "/api/generate"
-            payload = {
-                "model": settings.llm_model_name,
-                "prompt": prompt,
-                "stream": False,
-            }
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            # Ollama returns text in "response"
-            text = data.get("response")
-            if not text:
-                return None
-            return text.strip()
+        resp = get_llm_client().post(
+            _generate_url(),
+            json=_generate_payload(prompt),
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        text = _response_text(resp)
     except Exception as e:
         # In a real project you'd log this properly
         print(f"[LLM] Error calling LLM backend: {e}")
+        LLM_REQUESTS.labels(api="sync", outcome="error").inc()
         return None
+    finally:
+        LLM_DURATION.labels(api="sync").observe(time.perf_counter() - started)
+        in_flight.dec()
+
+    LLM_REQUESTS.labels(api="sync", outcome="ok" if text else "empty").inc()
+    _cache_store(key, text)
+    return text
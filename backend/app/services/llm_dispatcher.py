@@ -0,0 +1,239 @@
+# backend/app/services/llm_dispatcher.py
+
+"""
+Bounded work queue in front of the LLM backend.
+
+A local model server is fastest at a small, fixed number of concurrent
+generations; past that every generation slows down and a burst ends with
+everything timing out. The dispatcher keeps the backend at that operating
+point:
+
+- at most `max_concurrency` generations run at once (one worker thread each)
+- at most `max_queue` prompts wait; when the queue is full a new prompt is
+  shed immediately (result None -> the caller uses its template fallback)
+- every prompt carries a deadline that includes its time in the queue: a
+  prompt whose remaining budget is below `min_generation_seconds` when it
+  reaches a worker is dropped instead of started, and a started generation
+  gets only the remaining budget as its HTTP timeout
+- cached prompts (see summary_cache) are answered without queueing
+
+submit() always returns a Future resolving to the text or None, so shed,
+expired and failed prompts look the same to callers.
+"""
+
+import queue
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import get_settings
+from app.services.llm_client import cached_summary, generate_summary
+
+# Wait times kept for the percentile figures in stats().
+WAIT_SAMPLE_SIZE = 1000
+
+
+@dataclass
+class _Job:
+    prompt: str
+    max_tokens: int
+    enqueued_at: float
+    deadline_at: float
+    future: Future
+
+
+@dataclass
+class DispatcherCounters:
+    submitted: int = 0
+    cache_hits: int = 0
+    shed: int = 0        # rejected because the queue was full
+    expired: int = 0     # deadline (nearly) used up while queued
+    completed: int = 0   # generation returned text
+    failed: int = 0      # generation returned None (error / timeout)
+
+
+def _resolved(value: Optional[str]) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+class LlmDispatcher:
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        min_generation_seconds: float,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.min_generation_seconds = min_generation_seconds
+
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._in_flight = 0
+        self._counters = DispatcherCounters()
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    # ----------------- Lifecycle -----------------
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            self._threads = [
+                threading.Thread(
+                    target=self._worker_loop,
+                    name=f"regent-llm-{i}",
+                    daemon=True,
+                )
+                for i in range(self.max_concurrency)
+            ]
+            for t in self._threads:
+                t.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Fail everything still queued (result None) and stop the workers
+        after their current generation.
+        """
+
+        with self._lock:
+            threads, self._threads = self._threads, []
+
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None and job.future.set_running_or_notify_cancel():
+                job.future.set_result(None)
+
+        for _ in threads:
+            self._queue.put(None)
+        for t in threads:
+            t.join(timeout)
+
+    # ----------------- Submitting -----------------
+
+    def submit(self, prompt: str, max_tokens: int, deadline: float) -> Future:
+        """
+        Queue a generation that must finish within `deadline` seconds from now.
+        """
+
+        settings = get_settings()
+        if not settings.llm_enabled:
+            return _resolved(None)
+
+        with self._lock:
+            self._counters.submitted += 1
+
+        cached = cached_summary(prompt, max_tokens)
+        if cached is not None:
+            with self._lock:
+                self._counters.cache_hits += 1
+            return _resolved(cached)
+
+        self._ensure_started()
+        now = time.monotonic()
+        job = _Job(prompt, max_tokens, now, now + deadline, Future())
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._counters.shed += 1
+            return _resolved(None)
+        return job.future
+
+    def generate(self, prompt: str, max_tokens: int, deadline: float) -> Optional[str]:
+        """
+        Blocking convenience wrapper: the text, or None when the prompt was
+        shed, expired, failed or missed `deadline`.
+        """
+
+        future = self.submit(prompt, max_tokens, deadline)
+        try:
+            return future.result(timeout=deadline)
+        except Exception:
+            future.cancel()
+            return None
+
+    # ----------------- Workers -----------------
+
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                # Caller gave up while the prompt was queued.
+                continue
+
+            started = time.monotonic()
+            remaining = job.deadline_at - started
+            with self._lock:
+                self._waits.append(started - job.enqueued_at)
+                if remaining < self.min_generation_seconds:
+                    self._counters.expired += 1
+                    job.future.set_result(None)
+                    continue
+                self._in_flight += 1
+
+            text: Optional[str] = None
+            try:
+                text = generate_summary(job.prompt, job.max_tokens, timeout=remaining)
+            except Exception as e:
+                print(f"[LLMDispatcher] Generation failed: {e}")
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    if text:
+                        self._counters.completed += 1
+                    else:
+                        self._counters.failed += 1
+                job.future.set_result(text)
+
+    # ----------------- Monitoring -----------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            data: Dict[str, Any] = asdict(self._counters)
+            data["queue_depth"] = self._queue.qsize()
+            data["in_flight"] = self._in_flight
+            data["max_concurrency"] = self.max_concurrency
+            data["max_queue"] = self.max_queue
+            waits = sorted(self._waits)
+
+        if waits:
+            data["wait_seconds_p50"] = statistics.median(waits)
+            data["wait_seconds_p95"] = waits[int(0.95 * (len(waits) - 1))]
+            data["wait_seconds_max"] = waits[-1]
+        else:
+            data["wait_seconds_p50"] = data["wait_seconds_p95"] = data["wait_seconds_max"] = 0.0
+        return data
+
+
+_dispatcher: Optional[LlmDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_llm_dispatcher() -> LlmDispatcher:
+    """
+    Process-wide LlmDispatcher configured from Settings.
+    """
+
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            settings = get_settings()
+            _dispatcher = LlmDispatcher(
+                max_concurrency=settings.llm_max_concurrency,
+                max_queue=settings.llm_queue_size,
+                min_generation_seconds=settings.llm_min_generation_seconds,
+            )
+        return _dispatcher
@@ -0,0 +1,103 @@
+# backend/app/services/request_log_store.py
+
+"""
+Append-only persistence of pipeline logs and actions.
+
+Rows go to request_events / request_actions (app/models/request_log.py),
+one row per log line / action, numbered by seq within the request. Rows are
+buffered and written with multi-row INSERTs (executemany) of up to
+batch_size rows, so writing n lines costs O(n) – nothing is ever rewritten.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.request_log import RequestAction, RequestLogEvent
+
+
+def _action_row(action: Any) -> Dict[str, Any]:
+    # Actions are dicts (graph pipeline) or objects (typed agents), whose
+    # source_name / location_type live on their location.
+    if isinstance(action, dict):
+        get = action.get
+    else:
+        location = getattr(action, "location", None)
+        get = lambda k: getattr(action, k, getattr(location, k, None))
+    row = {}
+    for key in ("source_name", "location_type", "action_type", "status", "details"):
+        value = get(key)
+        # Enums -> their value, everything else -> str.
+        row[key] = None if value is None else str(getattr(value, "value", value))
+    return row
+
+
+class RequestLogWriter:
+    """
+    Buffered writer for one request. Also usable as run_regent_flow's
+    on_step callback: each call stores the log lines added since the
+    previous one. flush() inserts buffered rows; committing is up to the
+    caller.
+    """
+
+    def __init__(self, db: Session, request_id: int, batch_size: int = 1000) -> None:
+        self.db = db
+        self.request_id = request_id
+        self.batch_size = batch_size
+
+        self._events: List[Dict[str, Any]] = []
+        self._actions: List[Dict[str, Any]] = []
+        self._stored_logs = 0
+
+        # Continue numbering if the request ran before (e.g. requeued).
+        self._next_event_seq = self._max_seq(RequestLogEvent) + 1
+        self._next_action_seq = self._max_seq(RequestAction) + 1
+
+    def _max_seq(self, model) -> int:
+        return self.db.execute(
+            select(func.max(model.seq)).where(model.request_id == self.request_id)
+        ).scalar() or 0
+
+    def add_event(self, event: str, message: str, step: Optional[str] = None) -> None:
+        self._events.append(
+            {
+                "request_id": self.request_id,
+                "seq": self._next_event_seq,
+                "event": event,
+                "step": step,
+                "message": message,
+            }
+        )
+        self._next_event_seq += 1
+        if len(self._events) >= self.batch_size:
+            self._flush_events()
+
+    def add_actions(self, actions: Iterable[Any]) -> None:
+        for action in actions:
+            row = _action_row(action)
+            row["request_id"] = self.request_id
+            row["seq"] = self._next_action_seq
+            self._next_action_seq += 1
+            self._actions.append(row)
+            if len(self._actions) >= self.batch_size:
+                self._flush_actions()
+
+    def __call__(self, step: str, state: Any) -> None:
+        for message in state.logs[self._stored_logs :]:
+            self.add_event("log", message, step)
+        self._stored_logs = len(state.logs)
+
+    def flush(self) -> None:
+        self._flush_events()
+        self._flush_actions()
+
+    def _flush_events(self) -> None:
+        if self._events:
+            self.db.execute(insert(RequestLogEvent.__table__), self._events)
+            self._events = []
+
+    def _flush_actions(self) -> None:
+        if self._actions:
+            self.db.execute(insert(RequestAction.__table__), self._actions)
+            self._actions = []
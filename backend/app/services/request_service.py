@@ -1,23 +1,30 @@
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.metrics import PIPELINE_DURATION, PIPELINE_IN_FLIGHT, PIPELINE_RUNS
+from app.core.profiling import get_request_profiler, profile_request
 from app.models.request import DataRightsRequest
 from app.schemas.requests import CreateRequestPayload
 from app.agents.graph import RegentState, run_regent_flow
+from app.agents.state import Mode
+from app.tools.discovery_executor import DiscoveryReport
+from app.services.event_bus import TERMINAL_EVENT, get_event_bus
+from app.services.request_log_store import RequestLogWriter
 
 settings = get_settings()
 
+# Requests in these states are still being worked on; anything else is final.
+ACTIVE_STATUSES = ("PENDING", "IN_PROGRESS")
 
-def create_and_start_request(payload: CreateRequestPayload, db: Session) -> DataRightsRequest:
-    """
-    1) Create DB row with initial PENDING status
-    2) Build RegentState
-    3) Run full agentic pipeline
-    4) Update DB row with final status + summaries
-    """
 
-    # 1) Insert initial row
-    obj = DataRightsRequest(
+def _new_pending_request(payload: CreateRequestPayload) -> DataRightsRequest:
+    return DataRightsRequest(
         email=payload.email,
         customer_id=payload.customer_id,
         phone_last4=payload.phone_last4,
@@ -26,11 +33,208 @@ def create_and_start_request(payload: CreateRequestPayload, db: Session) -> Data
         mode=settings.MODE,
         message=payload.message,
     )
+
+
+def create_pending_request(payload: CreateRequestPayload, db: Session) -> DataRightsRequest:
+    """
+    Insert a new request row with PENDING status and return it.
+
+    The pipeline itself is run later by a job runner worker
+    (see app/services/job_runner.py).
+    """
+
+    obj = _new_pending_request(payload)
     db.add(obj)
     db.commit()
     db.refresh(obj)
 
-    # 2) Build initial state for the agent pipeline
+    return obj
+
+
+async def acreate_pending_request(
+    payload: CreateRequestPayload, db: AsyncSession, profile: bool = False
+) -> DataRightsRequest:
+    """
+    Async variant of create_pending_request, for `async def` routes.
+
+    With profile=True the request is flagged for profiling
+    (RequestProfiler.mark) before the commit makes it visible to workers,
+    so the run that claims it always sees the flag.
+
+    No refresh after commit: the session does not expire attributes on
+    commit and every column is set client-side, so the object is complete.
+    """
+
+    obj = _new_pending_request(payload)
+    db.add(obj)
+    if profile:
+        await db.flush()  # assigns obj.id
+        get_request_profiler().mark(obj.id)
+    try:
+        await db.commit()
+    except BaseException:
+        if profile:
+            get_request_profiler().unmark(obj.id)
+        raise
+
+    return obj
+
+
+async def aget_request(db: AsyncSession, request_id: int) -> Optional[DataRightsRequest]:
+    return await db.get(DataRightsRequest, request_id)
+
+
+def claim_request(db: Session, request_id: int) -> bool:
+    """
+    Atomically move one request from PENDING to IN_PROGRESS.
+
+    The conditional UPDATE makes the claim safe across threads and processes:
+    only one worker sees rowcount == 1 for a given request.
+    """
+
+    result = db.execute(
+        update(DataRightsRequest)
+        .where(
+            DataRightsRequest.id == request_id,
+            DataRightsRequest.status == "PENDING",
+        )
+        .values(status="IN_PROGRESS", updated_at=datetime.utcnow())
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def claim_next_pending_request(db: Session) -> Optional[int]:
+    """
+    Claim the oldest PENDING request, if any. Returns its id.
+    """
+
+    while True:
+        request_id = (
+            db.query(DataRightsRequest.id)
+            .filter(DataRightsRequest.status == "PENDING")
+            .order_by(DataRightsRequest.id)
+            .limit(1)
+            .scalar()
+        )
+        if request_id is None:
+            return None
+        if claim_request(db, request_id):
+            return request_id
+        # Another worker won the race for this row; try the next one.
+
+
+def heartbeat_requests(db: Session, request_ids: Sequence[int]) -> None:
+    """
+    Bump updated_at of claimed (IN_PROGRESS) requests, so
+    requeue_stale_requests only picks up runs whose worker stopped making
+    progress. Takes effect with the caller's next commit.
+    """
+
+    if not request_ids:
+        return
+    db.execute(
+        update(DataRightsRequest)
+        .where(
+            DataRightsRequest.id.in_(request_ids),
+            DataRightsRequest.status == "IN_PROGRESS",
+        )
+        .values(updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def requeue_stale_requests(db: Session, older_than_seconds: int) -> int:
+    """
+    Put IN_PROGRESS requests that have not been touched for a while back
+    to PENDING (e.g. the worker running them crashed). Returns the count.
+    Running pipelines heartbeat their row after every step and every
+    stored batch of actions (heartbeat_requests), so only a run that has
+    made no progress for older_than_seconds is requeued.
+    """
+
+    cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+    result = db.execute(
+        update(DataRightsRequest)
+        .where(
+            DataRightsRequest.status == "IN_PROGRESS",
+            DataRightsRequest.updated_at < cutoff,
+        )
+        .values(status="PENDING", updated_at=datetime.utcnow())
+    )
+    db.commit()
+    return result.rowcount
+
+
+class PipelineProgressPublisher:
+    """
+    on_step callback for run_regent_flow: publishes the log lines added
+    since the previous step to the event bus (GET /requests/{id}/events).
+    """
+
+    def __init__(self, request_id: int) -> None:
+        self.request_id = request_id
+        self.bus = get_event_bus()
+        self._published_logs = 0
+
+    def status(self, status: str) -> None:
+        self.bus.publish(self.request_id, "status", {"status": status})
+
+    def __call__(self, step: str, state: RegentState) -> None:
+        for message in state.logs[self._published_logs :]:
+            self.bus.publish(self.request_id, "log", {"step": step, "message": message})
+        self._published_logs = len(state.logs)
+
+    def finished(self, obj: DataRightsRequest) -> None:
+        self.status(obj.status)
+        if obj.user_summary:
+            self.bus.publish(self.request_id, "summary", {"user_summary": obj.user_summary})
+        self.bus.publish(self.request_id, TERMINAL_EVENT, {"status": obj.status})
+
+
+def run_request_pipeline(
+    db: Session,
+    obj: DataRightsRequest,
+    discovery: Optional[DiscoveryReport] = None,
+) -> DataRightsRequest:
+    """
+    1) Build RegentState from a claimed request row
+    2) Run full agentic pipeline, publishing progress events as it goes
+       and appending log lines to request_events after every step
+    3) Update DB row with final status + summaries (FAILED on error) and
+       append the actions to request_actions, in one commit
+       (with settings.pipeline_streaming_enabled, actions are appended and
+       committed batch by batch while the pipeline runs instead)
+
+    LIVE requests always run the streaming pipeline: its streaming step is
+    the one that runs the SQL / Mongo / file executors.
+
+    Runs selected for profiling (app/core/profiling.py) are profiled as a
+    whole and their profile stored under the request id.
+
+    `discovery` is this request's result of a batch discovery
+    (JobRunner.run_batch); the run then uses the streaming pipeline with
+    those locations instead of searching the sources itself.
+    """
+
+    in_flight = PIPELINE_IN_FLIGHT.labels()
+    in_flight.inc()
+    started = time.perf_counter()
+    try:
+        with profile_request(obj.id):
+            obj = _run_request_pipeline(db, obj, discovery)
+    finally:
+        in_flight.dec()
+        PIPELINE_DURATION.labels().observe(time.perf_counter() - started)
+    PIPELINE_RUNS.labels(status=obj.status).inc()
+    return obj
+
+
+def _run_request_pipeline(
+    db: Session,
+    obj: DataRightsRequest,
+    discovery: Optional[DiscoveryReport] = None,
+) -> DataRightsRequest:
     state = RegentState(
         request_id=obj.id,
         email=obj.email,
@@ -40,15 +244,67 @@ def create_and_start_request(payload: CreateRequestPayload, db: Session) -> Data
         status=obj.status,
     )
 
-    # 3) Run pipeline
-    final_state = run_regent_flow(state)
+    progress = PipelineProgressPublisher(obj.id)
+    progress.status(obj.status)
+
+    log_writer = RequestLogWriter(db, obj.id, batch_size=settings.request_log_batch_size)
+    log_writer.add_event("status", obj.status)
+
+    def on_step(step: str, current: RegentState) -> None:
+        progress(step, current)
+        log_writer(step, current)
+        log_writer.flush()
+        heartbeat_requests(db, [obj.id])
+        db.commit()
+
+    live = str(obj.mode).upper() == Mode.LIVE.value
+    if settings.pipeline_streaming_enabled or live or discovery is not None:
+        # Streaming pipeline: every batch of actions is stored and committed
+        # as soon as it is produced; the state only keeps counts.
+        def on_actions(actions) -> None:
+            log_writer.add_actions(actions)
+            log_writer.flush()
+            heartbeat_requests(db, [obj.id])
+            db.commit()
+
+        state.action_sink = on_actions
+        state.prefetched_discovery = discovery
 
-    # 4) Update DB row with final outputs
-    obj.status = final_state.status
-    obj.user_summary = final_state.user_summary
-    obj.admin_report = final_state.admin_report
+    try:
+        final_state = run_regent_flow(state, on_step=on_step)
+        obj.status = final_state.status
+        obj.user_summary = final_state.user_summary
+        obj.admin_report = final_state.admin_report
+        log_writer.add_actions(final_state.deletion_actions)
+    except Exception as e:
+        print(f"[RequestService] Pipeline failed for request {obj.id}: {e}")
+        db.rollback()
+        log_writer("error", state)
+        obj.status = "FAILED"
+        obj.admin_report = f"Pipeline error: {e}"
+
+    log_writer.add_event("status", obj.status)
+    log_writer.flush()
     db.add(obj)
     db.commit()
     db.refresh(obj)
 
+    # Published after the commit, so a client reacting to "done" reads the
+    # final row.
+    progress.finished(obj)
+
     return obj
+
+
+def create_and_start_request(payload: CreateRequestPayload, db: Session) -> DataRightsRequest:
+    """
+    Synchronous variant: create the row and run the pipeline inline.
+
+    The API enqueues instead (create_pending_request + job runner); this is
+    kept for scripts and debugging.
+    """
+
+    obj = create_pending_request(payload, db)
+    claim_request(db, obj.id)
+    db.refresh(obj)
+    return run_request_pipeline(db, obj)
@@ -0,0 +1,199 @@
+# backend/app/services/summary_cache.py
+
+"""
+Content-addressed cache for LLM generations.
+
+Key: sha256 of (model name, max_tokens, prompt). Identical prompts – "no data
+found" summaries, re-runs of the same request – are generated once.
+
+Two tiers:
+  - memory: LRU of the most recently used entries, each valid for ttl_seconds
+  - disk:   SQLite table (stdlib sqlite3) that survives restarts; a disk hit
+            is promoted back into the memory tier
+
+Only successful generations are stored. invalidate() drops entries for one
+model (or everything), e.g. after a model upgrade.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+from app.core.config import get_settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key        TEXT PRIMARY KEY,
+    model      TEXT NOT NULL,
+    text       TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_summaries_model ON summaries (model);
+"""
+
+
+def cache_key(model: str, prompt: str, max_tokens: int) -> str:
+    h = hashlib.sha256()
+    for part in (model, str(max_tokens), prompt):
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+        h.update(len(encoded).to_bytes(8, "big"))
+        h.update(encoded)
+    return h.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0      # memory tier only (LRU or expired)
+    invalidations: int = 0  # entries removed by invalidate()
+
+
+class SummaryCache:
+    def __init__(
+        self,
+        path: str,
+        memory_entries: int,
+        ttl_seconds: float,
+    ) -> None:
+        self.path = path
+        self.memory_entries = memory_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # key -> (model, text, expires_at)
+        self._memory: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._stats = CacheStats()
+
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ----------------- Lookups -----------------
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[2] > now:
+                    self._memory.move_to_end(key)
+                    self._stats.memory_hits += 1
+                    return entry[1]
+                del self._memory[key]
+                self._stats.evictions += 1
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT model, text FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        with self._lock:
+            if row is None:
+                self._stats.misses += 1
+                return None
+            self._stats.disk_hits += 1
+            self._remember(key, row[0], row[1])
+        return row[1]
+
+    def put(self, key: str, model: str, text: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO summaries (key, model, text, created_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "model = excluded.model, text = excluded.text, created_at = excluded.created_at",
+                (key, model, text, time.time()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            self._stats.stores += 1
+            self._remember(key, model, text)
+
+    def _remember(self, key: str, model: str, text: str) -> None:
+        # Caller holds self._lock.
+        self._memory[key] = (model, text, time.monotonic() + self.ttl_seconds)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    # ----------------- Admin -----------------
+
+    def invalidate(self, model: Optional[str] = None) -> int:
+        """
+        Drop cached generations for `model` (None -> all models) from both
+        tiers. Returns the number of disk entries removed.
+        """
+
+        conn = self._connect()
+        try:
+            if model is None:
+                removed = conn.execute("DELETE FROM summaries").rowcount
+            else:
+                removed = conn.execute(
+                    "DELETE FROM summaries WHERE model = ?", (model,)
+                ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            if model is None:
+                self._memory.clear()
+            else:
+                for key in [k for k, v in self._memory.items() if v[0] == model]:
+                    del self._memory[key]
+            self._stats.invalidations += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            disk_entries = conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        finally:
+            conn.close()
+
+        with self._lock:
+            data = asdict(self._stats)
+            data["memory_entries"] = len(self._memory)
+        data["disk_entries"] = disk_entries
+        return data
+
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_settings()
+            _cache = SummaryCache(
+                path=settings.llm_cache_path,
+                memory_entries=settings.llm_cache_memory_entries,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+            )
+        return _cache
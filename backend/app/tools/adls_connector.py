@@ -1,14 +1,32 @@
 # backend/app/tools/adls_connector.py
 
 import os
-from typing import Optional, List
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional, Set, Tuple
 
 from app.core.config import get_settings
-from app.agents.state import DataLocation, LocationType
+from app.core.metrics import (
+    CONNECTOR_CALLS,
+    CONNECTOR_DURATION,
+    CONNECTOR_IN_FLIGHT,
+    instrumented,
+)
+from app.agents.state import DataLocation, LocationType, UserIdentifiers
+from app.tools.adls_index import (
+    TOKEN_BOUNDARY_CONTEXT,
+    get_adls_index,
+    is_indexable,
+    is_whole_token,
+)
+from app.tools.batching import batched
+from app.tools.file_scanner import scan_file
+from app.tools.multi_pattern import MultiPatternMatcher
+
+READ_BLOCK_SIZE = 1024 * 1024
 
 settings = get_settings()
 
 
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="adls")
 def search_user_pii_in_adls(
     email: Optional[str],
     customer_id: Optional[str],
@@ -17,9 +35,20 @@ def search_user_pii_in_adls(
     Discovery helper for ADLS-like storage (simulated with a local folder).
 
     We walk through all files under settings.ADLS_BASE_PATH and look for the
-    email or customer_id as plain text inside .txt or .json files.
+    email or customer_id as a whole token (adls_index.is_whole_token, the
+    rule the index tokenizes by) inside .txt or .json files.
 
     If a match is found, we create a DataLocation with location_type=FILE.
+
+    With settings.adls_index_enabled, the persistent identifier index
+    (app/tools/adls_index.py) answers the lookup instead of a full scan; it
+    is refreshed incrementally (one stat() per file, changed files
+    re-tokenized) when older than adls_index_max_age_seconds – by default
+    before every lookup. Identifiers the index cannot hold are scanned for.
+
+    The full scan reads files according to settings.adls_scan_mode: "stream"
+    or "mmap" search raw bytes in constant memory and fill byte_offsets /
+    line_numbers; "text" is the original whole-file read.
     """
 
     locations: List[DataLocation] = []
@@ -33,6 +62,80 @@ def search_user_pii_in_adls(
     if not email and not customer_id:
         return locations
 
+    indexed = _index_lookup(email, customer_id)
+    if indexed is not None:
+        return indexed
+
+    locations.extend(_iter_lake_locations(base_path, email, customer_id))
+    return locations
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="adls_stream")
+def iter_user_pii_in_adls(
+    email: Optional[str],
+    customer_id: Optional[str],
+    batch_size: int,
+) -> Iterator[List[DataLocation]]:
+    """
+    Streaming variant of search_user_pii_in_adls for the streaming
+    pipeline: a full scan yields lists of at most batch_size FILE
+    DataLocations while the lake is still being walked. The index path
+    answers from one lookup, which is then yielded in batches.
+    """
+
+    base_path = settings.ADLS_BASE_PATH
+    if not base_path or not os.path.isdir(base_path):
+        return
+    if not email and not customer_id:
+        return
+
+    indexed = _index_lookup(email, customer_id)
+    if indexed is not None:
+        yield from batched(indexed, batch_size)
+        return
+
+    yield from batched(_iter_lake_locations(base_path, email, customer_id), batch_size)
+
+
+def _index_lookup(
+    email: Optional[str],
+    customer_id: Optional[str],
+) -> Optional[List[DataLocation]]:
+    """
+    The index's answer, or None when the full scan has to answer instead:
+    index disabled, an identifier the tokenizer does not index (the index
+    would report no files for it, not "unknown"), or an index last
+    refreshed more than settings.adls_index_max_age_seconds ago.
+    """
+
+    if not settings.adls_index_enabled:
+        return None
+    if email and not is_indexable(email, "email"):
+        return None
+    if customer_id and not is_indexable(customer_id, "customer_id"):
+        return None
+
+    index = get_adls_index()
+    max_age = settings.adls_index_max_age_seconds
+    if max_age <= 0:
+        index.refresh()
+        return index.lookup(email, customer_id)
+
+    # Refresh ahead of time, off the request path; an index older than
+    # max_age (or never built) does not answer until that refresh is done.
+    age = index.age()
+    if age is None or age >= max_age / 2:
+        index.refresh_in_background()
+    if age is None or age >= max_age:
+        return None
+    return index.lookup(email, customer_id)
+
+
+def _iter_lake_locations(
+    base_path: str,
+    email: Optional[str],
+    customer_id: Optional[str],
+) -> Iterator[DataLocation]:
     for root, _, files in os.walk(base_path):
         for filename in files:
             # Only scan text-like files for demo
@@ -41,8 +144,14 @@ def search_user_pii_in_adls(
 
             full_path = os.path.join(root, filename)
 
+            if settings.adls_scan_mode != "text":
+                loc = _scan_file_for_user(full_path, email, customer_id)
+                if loc:
+                    yield loc
+                continue
+
             try:
-                with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
+                with open(full_path, "rb") as f:
                     content = f.read()
             except Exception as e:
                 print(f"[ADLSConnector] Could not read file {full_path}: {e}")
@@ -50,18 +159,196 @@ def search_user_pii_in_adls(
 
             matched_fields = []
 
-            if email and email in content:
+            if email and _contains_token(content, email.encode("utf-8")):
                 matched_fields.append("email")
-            if customer_id and customer_id in content:
+            if customer_id and _contains_token(content, customer_id.encode("utf-8")):
                 matched_fields.append("customer_id")
 
             if matched_fields:
-                loc = DataLocation(
+                yield DataLocation(
                     source_name="ADLS",
                     location_type=LocationType.FILE,
                     file_path=full_path,
                     pii_fields=matched_fields,
                 )
-                locations.append(loc)
 
-    return locations
+
+def _contains_token(content: bytes, needle: bytes) -> bool:
+    pos = content.find(needle)
+    while pos != -1:
+        if is_whole_token(content, pos, pos + len(needle)):
+            return True
+        pos = content.find(needle, pos + 1)
+    return False
+
+
+def _scan_file_for_user(
+    full_path: str,
+    email: Optional[str],
+    customer_id: Optional[str],
+) -> Optional[DataLocation]:
+    """
+    Byte-level, constant-memory scan of one file (settings.adls_scan_mode).
+    """
+
+    needles = {}
+    if email:
+        needles["email"] = email.encode("utf-8")
+    if customer_id:
+        needles["customer_id"] = customer_id.encode("utf-8")
+
+    try:
+        hits = scan_file(
+            full_path,
+            needles,
+            mode=settings.adls_scan_mode,
+            max_hits=settings.adls_max_hits_per_file,
+        )
+    except Exception as e:
+        print(f"[ADLSConnector] Could not read file {full_path}: {e}")
+        return None
+
+    if not hits:
+        return None
+
+    found = {h.pii_field for h in hits}
+    return DataLocation(
+        source_name="ADLS",
+        location_type=LocationType.FILE,
+        file_path=full_path,
+        pii_fields=[f for f in ("email", "customer_id") if f in found],
+        byte_offsets=[h.byte_offset for h in hits],
+        line_numbers=[h.line_number for h in hits],
+    )
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="adls_batch")
+def search_users_pii_in_adls_batch(
+    identities: Mapping[Hashable, UserIdentifiers],
+) -> Dict[Hashable, List[DataLocation]]:
+    """
+    Batch discovery over the lake for many users at once.
+
+    `identities` maps a caller-chosen key (e.g. request id) to the user's
+    identifiers. All emails / customer_ids are compiled into one
+    Aho-Corasick automaton and every file is read exactly once, in blocks,
+    so the cost is one pass over the lake however many users are queued.
+
+    Only whole-token hits count (adls_index.is_whole_token), so a batch
+    finds exactly the files search_user_pii_in_adls finds for each user.
+    Returns key -> list of FILE DataLocations
+    (every key is present, possibly with an empty list); byte_offsets holds
+    where the hits start.
+    """
+
+    results: Dict[Hashable, List[DataLocation]] = {key: [] for key in identities}
+
+    base_path = settings.ADLS_BASE_PATH
+    if not base_path or not os.path.isdir(base_path):
+        return results
+
+    # Distinct needle -> every (key, field) that is looking for it
+    patterns: List[bytes] = []
+    owners: List[List[Tuple[Hashable, str]]] = []
+    pattern_ids: Dict[bytes, int] = {}
+    for key, ids in identities.items():
+        for pii_field, value in (("email", ids.email), ("customer_id", ids.customer_id)):
+            if not value:
+                continue
+            needle = value.encode("utf-8")
+            if needle not in pattern_ids:
+                pattern_ids[needle] = len(patterns)
+                patterns.append(needle)
+                owners.append([])
+            owners[pattern_ids[needle]].append((key, pii_field))
+
+    if not patterns:
+        return results
+
+    matcher = MultiPatternMatcher(patterns)
+    max_hits = settings.adls_max_hits_per_file
+    # A hit is checked once TOKEN_BOUNDARY_CONTEXT + 1 bytes follow it (or at
+    # EOF); the window keeps enough bytes to look behind pending hits.
+    context = TOKEN_BOUNDARY_CONTEXT + 1
+    keep = max(len(p) for p in patterns) + 2 * context
+
+    for root, _, files in os.walk(base_path):
+        for filename in files:
+            if not (filename.endswith(".txt") or filename.endswith(".json")):
+                continue
+
+            full_path = os.path.join(root, filename)
+
+            found: Set[int] = set()
+            offsets: Dict[int, List[int]] = {}
+            try:
+                stream = matcher.stream()
+                window = b""
+                window_start = 0    # absolute offset of window[0]
+                pending: List[Tuple[int, int]] = []
+                with open(full_path, "rb") as f:
+                    for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+                        window += block
+                        pending.extend(stream.feed(block))
+                        decided = window_start + len(window) - context
+                        undecided = []
+                        for hit in pending:
+                            if hit[1] > decided:
+                                undecided.append(hit)
+                            else:
+                                _record_hit(window, window_start, hit, patterns, found, offsets, max_hits)
+                        pending = undecided
+                        cut = max(len(window) - keep, 0)
+                        window = window[cut:]
+                        window_start += cut
+                for hit in pending:
+                    _record_hit(window, window_start, hit, patterns, found, offsets, max_hits)
+            except Exception as e:
+                print(f"[ADLSConnector] Could not read file {full_path}: {e}")
+                continue
+
+            if not found:
+                continue
+
+            matched: Dict[Hashable, Set[str]] = {}
+            matched_offsets: Dict[Hashable, List[int]] = {}
+            for pattern_id in found:
+                for key, pii_field in owners[pattern_id]:
+                    matched.setdefault(key, set()).add(pii_field)
+                    matched_offsets.setdefault(key, []).extend(offsets[pattern_id])
+
+            for key, fields in matched.items():
+                results[key].append(
+                    DataLocation(
+                        source_name="ADLS",
+                        location_type=LocationType.FILE,
+                        file_path=full_path,
+                        pii_fields=[f for f in ("email", "customer_id") if f in fields],
+                        byte_offsets=sorted(matched_offsets[key])[:max_hits],
+                    )
+                )
+
+    return results
+
+
+def _record_hit(
+    window: bytes,
+    window_start: int,
+    hit: Tuple[int, int],
+    patterns: List[bytes],
+    found: Set[int],
+    offsets: Dict[int, List[int]],
+    max_hits: int,
+) -> None:
+    """
+    Record an automaton hit (pattern id, absolute end) if it is a whole
+    token; `window` must hold the hit and its boundary context.
+    """
+
+    pattern_id, end = hit
+    start = end - len(patterns[pattern_id])
+    if is_whole_token(window, start - window_start, end - window_start):
+        found.add(pattern_id)
+        pattern_offsets = offsets.setdefault(pattern_id, [])
+        if len(pattern_offsets) < max_hits:
+            pattern_offsets.append(start)
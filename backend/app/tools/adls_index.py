@@ -0,0 +1,475 @@
+# backend/app/tools/adls_index.py
+
+"""
+Persistent identifier index for the ADLS connector.
+
+Instead of reading every file under ADLS_BASE_PATH for every request, we
+keep an inverted index in a small SQLite file:
+
+    files(path, mtime_ns, size)      -> what has been indexed, and its version
+    postings(token, field, path)     -> which files contain which identifier
+
+Tokens are email addresses and "id-like" words (letters/digits/._- runs that
+contain at least one digit, e.g. CUST001). refresh() only re-tokenizes files
+whose mtime or size changed, and drops files that disappeared, so keeping
+the index current costs one stat() per file. Lookups are a single indexed
+query: O(matches) instead of O(lake size). Refreshes run off the request
+path: on a background thread started by the connector when the index ages
+(refresh_in_background), or from `python adls_index.py refresh` (cron).
+
+Note: matching is on whole tokens, not substrings – "CUST001" no longer
+matches inside "CUST0010". Identifiers the tokenizer would not index
+themselves (e.g. a customer_id without a digit, or shorter than 3
+characters) cannot be answered from the index; see is_indexable().
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.core.config import get_settings
+from app.agents.state import DataLocation, LocationType
+
+# Only text-like files are indexed (same rule as the full-scan connector).
+INDEXED_EXTENSIONS = (".txt", ".json")
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Runs of characters that can be part of an email or an identifier.
+_TOKEN_RUN_RE = re.compile(rb"[A-Za-z0-9._%+@-]+")
+_EMAIL_RE = re.compile(rb"^[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)+$")
+_DIGIT_RE = re.compile(rb"[0-9]")
+
+MAX_TOKEN_LENGTH = 254
+
+# Whole-token check for substring hits (scans, batch discovery, redaction),
+# matching the tokenizer: a hit must not touch another token character,
+# except through a run of '.' / '-', which _classify_token strips from both
+# ends of a token ("a@x.com." ends a sentence). Such runs are looked
+# through up to TOKEN_BOUNDARY_CONTEXT bytes.
+TOKEN_BOUNDARY_CONTEXT = 8
+_TOKEN_INNER = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_%+@")
+_TOKEN_EDGE = frozenset(b".-")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    field TEXT NOT NULL,
+    path  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_postings_token ON postings (token);
+CREATE INDEX IF NOT EXISTS ix_postings_path ON postings (path);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class RefreshStats:
+    scanned: int = 0      # files (re)tokenized
+    unchanged: int = 0    # files skipped because mtime/size matched
+    removed: int = 0      # files dropped from the index
+    tokens: int = 0       # postings written
+    elapsed: float = 0.0
+
+
+@dataclass
+class VerifyReport:
+    missing: List[str] = field(default_factory=list)    # on disk, not indexed
+    stale: List[str] = field(default_factory=list)      # indexed, but changed on disk
+    orphaned: List[str] = field(default_factory=list)   # indexed, gone from disk
+    mismatched: List[str] = field(default_factory=list) # deep check: postings differ
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.stale or self.orphaned or self.mismatched)
+
+
+def _classify_token(run: bytes) -> Optional[Tuple[str, str]]:
+    token = run.strip(b".-")
+    if not token or len(token) > MAX_TOKEN_LENGTH:
+        return None
+    if b"@" in token:
+        if _EMAIL_RE.match(token):
+            return token.decode("ascii"), "email"
+        return None
+    if len(token) >= 3 and _DIGIT_RE.search(token):
+        return token.decode("ascii"), "customer_id"
+    return None
+
+
+def is_whole_token(data: Sequence[int], start: int, end: int) -> bool:
+    """
+    True if data[start:end] (bytes, or an mmap) is a whole token. Bytes
+    outside `data` count as a boundary, so callers keep
+    TOKEN_BOUNDARY_CONTEXT + 1 bytes of context on each side of a hit.
+    """
+
+    before = start
+    while before > 0 and start - before < TOKEN_BOUNDARY_CONTEXT and data[before - 1] in _TOKEN_EDGE:
+        before -= 1
+    if before > 0 and data[before - 1] in _TOKEN_INNER:
+        return False
+
+    after = end
+    while after < len(data) and after - end < TOKEN_BOUNDARY_CONTEXT and data[after] in _TOKEN_EDGE:
+        after += 1
+    return after == len(data) or data[after] not in _TOKEN_INNER
+
+
+def is_indexable(value: str, pii_field: str) -> bool:
+    """
+    True if a lookup for this identifier can be answered by the index: the
+    value is exactly one token that the tokenizer keeps under pii_field.
+    Anything else (no digit, too short, spaces, non-ASCII, ...) would
+    silently find nothing, so callers must scan instead.
+    """
+
+    try:
+        raw = value.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    run = _TOKEN_RUN_RE.fullmatch(raw)
+    return run is not None and _classify_token(raw) == (value, pii_field)
+
+
+def tokenize_file(path: str) -> Set[Tuple[str, str]]:
+    """
+    Distinct (token, field) pairs found in a file, read in fixed-size blocks.
+    A run of token characters touching the end of a block is carried over
+    to the next block so tokens split across blocks are not lost.
+    """
+
+    tokens: Set[Tuple[str, str]] = set()
+    carry = b""
+    skip_leading_run = False
+
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(READ_BLOCK_SIZE)
+            data = carry + block
+            carry = b""
+            if not data:
+                break
+
+            for m in _TOKEN_RUN_RE.finditer(data):
+                if skip_leading_run:
+                    skip_leading_run = False
+                    if m.start() == 0:
+                        # Tail of an over-long run from the previous block.
+                        continue
+                if block and m.end() == len(data):
+                    # Possibly incomplete; keep it unless it is already too long.
+                    if m.end() - m.start() <= MAX_TOKEN_LENGTH:
+                        carry = m.group()
+                    else:
+                        skip_leading_run = True
+                    continue
+                classified = _classify_token(m.group())
+                if classified:
+                    tokens.add(classified)
+
+            if not block:
+                break
+
+    return tokens
+
+
+def iter_lake_files(base_path: str) -> Iterator[Tuple[str, os.stat_result]]:
+    for root, _, files in os.walk(base_path):
+        for filename in files:
+            if not filename.endswith(INDEXED_EXTENSIONS):
+                continue
+            full_path = os.path.join(root, filename)
+            try:
+                yield full_path, os.stat(full_path)
+            except OSError:
+                continue
+
+
+class AdlsIndex:
+    def __init__(self, index_path: str, base_path: str) -> None:
+        self.index_path = index_path
+        self.base_path = base_path
+        self._refresh_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
+
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            indexed_base = self._get_meta(conn, "base_path")
+            if indexed_base is not None and indexed_base != os.path.abspath(base_path):
+                # Index belongs to another lake – start over.
+                self._clear(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ----------------- Connection helpers -----------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @staticmethod
+    def _clear(conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM postings")
+        conn.execute("DELETE FROM files")
+        conn.execute("DELETE FROM meta")
+
+    # ----------------- Maintenance -----------------
+
+    def refresh(self) -> RefreshStats:
+        """
+        Incrementally bring the index in line with the lake.
+        """
+
+        stats = RefreshStats()
+        started = time.perf_counter()
+
+        with self._refresh_lock:
+            conn = self._connect()
+            try:
+                indexed: Dict[str, Tuple[int, int]] = {
+                    path: (mtime_ns, size)
+                    for path, mtime_ns, size in conn.execute(
+                        "SELECT path, mtime_ns, size FROM files"
+                    )
+                }
+
+                seen: Set[str] = set()
+                if os.path.isdir(self.base_path):
+                    for path, st in iter_lake_files(self.base_path):
+                        seen.add(path)
+                        if indexed.get(path) == (st.st_mtime_ns, st.st_size):
+                            stats.unchanged += 1
+                            continue
+
+                        try:
+                            tokens = tokenize_file(path)
+                        except OSError as e:
+                            print(f"[ADLSIndex] Could not read file {path}: {e}")
+                            continue
+
+                        conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+                        conn.executemany(
+                            "INSERT INTO postings (token, field, path) VALUES (?, ?, ?)",
+                            [(token, fld, path) for token, fld in tokens],
+                        )
+                        conn.execute(
+                            "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?) "
+                            "ON CONFLICT(path) DO UPDATE SET "
+                            "mtime_ns = excluded.mtime_ns, size = excluded.size",
+                            (path, st.st_mtime_ns, st.st_size),
+                        )
+                        stats.scanned += 1
+                        stats.tokens += len(tokens)
+
+                gone = [(p,) for p in indexed if p not in seen]
+                conn.executemany("DELETE FROM postings WHERE path = ?", gone)
+                conn.executemany("DELETE FROM files WHERE path = ?", gone)
+                stats.removed = len(gone)
+
+                self._set_meta(conn, "base_path", os.path.abspath(self.base_path))
+                self._set_meta(conn, "last_refresh", str(time.time()))
+                conn.commit()
+            finally:
+                conn.close()
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def rebuild(self) -> RefreshStats:
+        """
+        Drop everything and index the whole lake again.
+        """
+
+        with self._refresh_lock:
+            conn = self._connect()
+            try:
+                self._clear(conn)
+                conn.commit()
+            finally:
+                conn.close()
+        return self.refresh()
+
+    def verify(self, deep: bool = False) -> VerifyReport:
+        """
+        Compare the index with the lake without changing it.
+        deep=True also re-tokenizes every indexed file and compares postings.
+        """
+
+        report = VerifyReport()
+        conn = self._connect()
+        try:
+            indexed = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute(
+                    "SELECT path, mtime_ns, size FROM files"
+                )
+            }
+
+            seen: Set[str] = set()
+            if os.path.isdir(self.base_path):
+                for path, st in iter_lake_files(self.base_path):
+                    seen.add(path)
+                    version = indexed.get(path)
+                    if version is None:
+                        report.missing.append(path)
+                    elif version != (st.st_mtime_ns, st.st_size):
+                        report.stale.append(path)
+                    elif deep:
+                        stored = set(
+                            conn.execute(
+                                "SELECT token, field FROM postings WHERE path = ?",
+                                (path,),
+                            )
+                        )
+                        if stored != tokenize_file(path):
+                            report.mismatched.append(path)
+
+            report.orphaned = [p for p in indexed if p not in seen]
+        finally:
+            conn.close()
+
+        return report
+
+    def age(self) -> Optional[float]:
+        """
+        Seconds since the last completed refresh, by any process (the meta
+        table is shared), or None if the index was never built.
+        """
+
+        conn = self._connect()
+        try:
+            last_refresh = self._get_meta(conn, "last_refresh")
+        finally:
+            conn.close()
+        if last_refresh is None:
+            return None
+        return max(time.time() - float(last_refresh), 0.0)
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start refresh() on a daemon thread unless one is already running
+        here or a refresh holds the lock. Never blocks. Returns True if a
+        refresh was started.
+        """
+
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return False
+            if self._refresh_lock.locked():
+                return False
+            self._background = threading.Thread(
+                target=self._refresh_quietly, name="regent-adls-index", daemon=True
+            )
+            self._background.start()
+            return True
+
+    def _refresh_quietly(self) -> None:
+        try:
+            stats = self.refresh()
+            print(
+                f"[ADLSIndex] Refreshed: {stats.scanned} file(s) indexed, "
+                f"{stats.removed} removed in {stats.elapsed:.2f}s."
+            )
+        except Exception as e:
+            print(f"[ADLSIndex] Background refresh failed: {e}")
+
+    # ----------------- Lookups -----------------
+
+    def lookup(
+        self,
+        email: Optional[str],
+        customer_id: Optional[str],
+    ) -> List[DataLocation]:
+        """
+        Files containing the email and/or customer_id, as FILE DataLocations.
+        """
+
+        wanted: Dict[Tuple[str, str], str] = {}
+        if email:
+            wanted[(email, "email")] = "email"
+        if customer_id:
+            wanted[(customer_id, "customer_id")] = "customer_id"
+        if not wanted:
+            return []
+
+        tokens = list({token for token, _ in wanted})
+        placeholders = ",".join("?" for _ in tokens)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT token, field, path FROM postings "
+                f"WHERE token IN ({placeholders}) ORDER BY path",
+                tokens,
+            ).fetchall()
+        finally:
+            conn.close()
+
+        matches: Dict[str, List[str]] = {}
+        for token, fld, path in rows:
+            pii_field = wanted.get((token, fld))
+            if pii_field and pii_field not in matches.setdefault(path, []):
+                matches[path].append(pii_field)
+
+        locations: List[DataLocation] = []
+        for path, fields in matches.items():
+            if not os.path.exists(path):
+                # Deleted since the last refresh.
+                continue
+            locations.append(
+                DataLocation(
+                    source_name="ADLS",
+                    location_type=LocationType.FILE,
+                    file_path=path,
+                    pii_fields=[f for f in ("email", "customer_id") if f in fields],
+                )
+            )
+        return locations
+
+
+_index: Optional[AdlsIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_adls_index() -> AdlsIndex:
+    """
+    Process-wide AdlsIndex for settings.ADLS_BASE_PATH.
+    """
+
+    global _index
+    with _index_lock:
+        if _index is None:
+            settings = get_settings()
+            _index = AdlsIndex(settings.adls_index_path, settings.ADLS_BASE_PATH)
+        return _index
@@ -0,0 +1,23 @@
+# backend/app/tools/batching.py
+
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Yield lists of up to `size` items, lazily (itertools.batched for lists).
+    """
+
+    if size < 1:
+        raise ValueError("batch size must be at least 1")
+
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
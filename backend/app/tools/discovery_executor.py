@@ -0,0 +1,518 @@
+# backend/app/tools/discovery_executor.py
+
+"""
+Concurrent fan-out discovery across all registered connectors.
+
+The SQL, Mongo and ADLS helpers are independent blocking calls, so instead
+of calling them one after another we submit each to a shared, bounded
+thread pool and merge their DataLocation results as they finish. Discovery
+latency is then close to the slowest connector instead of the sum.
+
+Every connector has its own deadline. A connector that misses it is
+reported as "timeout" in the DiscoveryReport and the results of the other
+connectors are still returned (its thread cannot be killed, it simply
+finishes in the background and its result is ignored).
+
+stream_discovery is the streaming pipeline's variant
+(app/agents/streaming_agent.py): the connectors' streaming searches
+(iter_user_pii_in_*) run in the same pool and their location batches are
+yielded as they arrive, through a bounded queue, so memory is bounded by
+the batch size rather than by the user's footprint.
+
+run_batch_discovery runs the batch connectors (one query set / one lake
+pass for many users) for a group of queued requests at once.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from app.core.config import get_settings
+from app.core.metrics import DISCOVERY_TIMEOUTS
+from app.agents.state import DataLocation, UserIdentifiers
+from app.db.session import SessionLocal
+from app.tools.adls_connector import (
+    iter_user_pii_in_adls,
+    search_user_pii_in_adls,
+    search_users_pii_in_adls_batch,
+)
+from app.tools.batching import batched
+from app.tools.mongo_connector import (
+    iter_user_pii_in_mongo,
+    search_user_pii_in_mongo,
+    search_users_pii_in_mongo_batch,
+)
+from app.tools.sql_connector import (
+    iter_user_pii_in_sql,
+    search_user_pii_in_sql,
+    search_users_pii_in_sql_batch,
+)
+
+# (email, customer_id) -> locations
+ConnectorSearch = Callable[[Optional[str], Optional[str]], List[DataLocation]]
+
+# {key: identifiers} -> {key: locations}, every key present
+BatchSearch = Callable[[Mapping[Hashable, UserIdentifiers]], Dict[Hashable, List[DataLocation]]]
+
+# (email, customer_id, batch_size) -> generator of location batches
+ConnectorStream = Callable[[Optional[str], Optional[str], int], Iterator[List[DataLocation]]]
+
+
+@dataclass
+class DiscoveryConnector:
+    """
+    One data source that discovery fans out to.
+
+    timeout: per-connector deadline in seconds
+             (None -> settings.discovery_connector_timeout).
+    stream:  optional generator variant used by stream_discovery; without
+             it the search result is batched once it is complete.
+    """
+
+    name: str
+    search: ConnectorSearch
+    timeout: Optional[float] = None
+    stream: Optional[ConnectorStream] = None
+
+
+@dataclass
+class ConnectorRun:
+    """
+    Outcome of one connector call: "ok", "timeout" or "error".
+    duration is measured from the moment the connector started running.
+    """
+
+    name: str
+    status: str
+    duration: float
+    locations_found: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class DiscoveryReport:
+    locations: List[DataLocation] = field(default_factory=list)
+    runs: List[ConnectorRun] = field(default_factory=list)
+    elapsed: float = 0.0
+    # stream_discovery leaves `locations` empty and only counts them here.
+    locations_streamed: int = 0
+
+    @property
+    def timed_out(self) -> List[str]:
+        return [r.name for r in self.runs if r.status == "timeout"]
+
+    @property
+    def partial(self) -> bool:
+        return any(r.status != "ok" for r in self.runs)
+
+
+# ----------------------------------------------------------------------
+# Connector registry
+# ----------------------------------------------------------------------
+
+# Registered connectors search strictly: an unreachable source or a table
+# that cannot be queried raises, so its run is "error" and the report is
+# partial instead of an empty, seemingly complete result.
+
+def _search_sql(email: Optional[str], customer_id: Optional[str]) -> List[DataLocation]:
+    # Sessions are not thread-safe: each SQL discovery call gets its own.
+    db = SessionLocal()
+    try:
+        return search_user_pii_in_sql(db, email, customer_id, strict=True)
+    finally:
+        db.close()
+
+
+def _search_mongo(email: Optional[str], customer_id: Optional[str]) -> List[DataLocation]:
+    return search_user_pii_in_mongo(email, customer_id, strict=True)
+
+
+def _stream_sql(
+    email: Optional[str],
+    customer_id: Optional[str],
+    batch_size: int,
+) -> Iterator[List[DataLocation]]:
+    # Held for the whole stream; closed when the generator is exhausted or closed.
+    db = SessionLocal()
+    try:
+        yield from iter_user_pii_in_sql(db, email, customer_id, batch_size)
+    finally:
+        db.close()
+
+
+CONNECTORS: List[DiscoveryConnector] = [
+    DiscoveryConnector(name="sql", search=_search_sql, stream=_stream_sql),
+    DiscoveryConnector(name="mongo", search=_search_mongo, stream=iter_user_pii_in_mongo),
+    DiscoveryConnector(name="adls", search=search_user_pii_in_adls, stream=iter_user_pii_in_adls),
+]
+
+
+def _search_sql_batch(
+    identities: Mapping[Hashable, UserIdentifiers],
+) -> Dict[Hashable, List[DataLocation]]:
+    db = SessionLocal()
+    try:
+        return search_users_pii_in_sql_batch(db, identities, strict=True)
+    finally:
+        db.close()
+
+
+def _search_mongo_batch(
+    identities: Mapping[Hashable, UserIdentifiers],
+) -> Dict[Hashable, List[DataLocation]]:
+    return search_users_pii_in_mongo_batch(identities, strict=True)
+
+
+# name -> batch search, for run_batch_discovery.
+BATCH_CONNECTORS: Dict[str, BatchSearch] = {
+    "sql": _search_sql_batch,
+    "mongo": _search_mongo_batch,
+    "adls": search_users_pii_in_adls_batch,
+}
+
+
+def register_connector(
+    name: str,
+    search: ConnectorSearch,
+    timeout: Optional[float] = None,
+    stream: Optional[ConnectorStream] = None,
+) -> None:
+    """
+    Add (or replace, by name) a connector used by run_discovery / stream_discovery.
+    """
+
+    CONNECTORS[:] = [c for c in CONNECTORS if c.name != name]
+    CONNECTORS.append(
+        DiscoveryConnector(name=name, search=search, timeout=timeout, stream=stream)
+    )
+
+
+# ----------------------------------------------------------------------
+# Executor
+# ----------------------------------------------------------------------
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=get_settings().discovery_max_workers,
+                thread_name_prefix="regent-discovery",
+            )
+        return _pool
+
+
+def _timed_search(
+    search: ConnectorSearch,
+    email: Optional[str],
+    customer_id: Optional[str],
+) -> Tuple[List[DataLocation], float]:
+    started = time.perf_counter()
+    locations = search(email, customer_id)
+    return locations, time.perf_counter() - started
+
+
+def run_discovery(
+    email: Optional[str],
+    customer_id: Optional[str],
+    connectors: Optional[List[DiscoveryConnector]] = None,
+) -> DiscoveryReport:
+    """
+    Run all connectors concurrently and merge their results.
+
+    Locations are appended in completion order; report.runs has one entry
+    per connector with its status and timing.
+    """
+
+    default_timeout = get_settings().discovery_connector_timeout
+    connectors = CONNECTORS if connectors is None else connectors
+    report = DiscoveryReport()
+
+    started = time.perf_counter()
+    pool = _get_pool()
+
+    by_future: Dict[Future, DiscoveryConnector] = {}
+    deadlines: Dict[Future, float] = {}
+    for connector in connectors:
+        future = pool.submit(_timed_search, connector.search, email, customer_id)
+        by_future[future] = connector
+        deadlines[future] = started + (connector.timeout or default_timeout)
+
+    pending = set(by_future)
+    while pending:
+        next_deadline = min(deadlines[f] for f in pending)
+        done, pending = wait(
+            pending,
+            timeout=max(0.0, next_deadline - time.perf_counter()),
+            return_when=FIRST_COMPLETED,
+        )
+
+        for future in done:
+            name = by_future[future].name
+            try:
+                locations, duration = future.result()
+            except Exception as e:
+                print(f"[Discovery] Connector '{name}' failed: {e}")
+                report.runs.append(
+                    ConnectorRun(
+                        name=name,
+                        status="error",
+                        duration=time.perf_counter() - started,
+                        error=str(e),
+                    )
+                )
+                continue
+
+            report.locations.extend(locations)
+            report.runs.append(
+                ConnectorRun(
+                    name=name,
+                    status="ok",
+                    duration=duration,
+                    locations_found=len(locations),
+                )
+            )
+
+        now = time.perf_counter()
+        expired = {f for f in pending if deadlines[f] <= now}
+        for future in expired:
+            future.cancel()
+            name = by_future[future].name
+            print(f"[Discovery] Connector '{name}' missed its deadline; continuing without it.")
+            DISCOVERY_TIMEOUTS.labels(connector=name).inc()
+            report.runs.append(
+                ConnectorRun(name=name, status="timeout", duration=now - started)
+            )
+        pending -= expired
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+
+# ----------------------------------------------------------------------
+# Batch
+# ----------------------------------------------------------------------
+
+def _timed_batch(
+    search: BatchSearch,
+    identities: Mapping[Hashable, UserIdentifiers],
+) -> Tuple[Dict[Hashable, List[DataLocation]], float]:
+    started = time.perf_counter()
+    results = search(identities)
+    return results, time.perf_counter() - started
+
+
+def run_batch_discovery(
+    identities: Mapping[Hashable, UserIdentifiers],
+    connectors: Optional[Mapping[str, BatchSearch]] = None,
+) -> Dict[Hashable, DiscoveryReport]:
+    """
+    Discover many users at once with the batch connectors, run concurrently:
+    `IN (...)` queries in SQL and Mongo, and a single Aho-Corasick pass over
+    the lake however many users there are.
+
+    Returns key -> DiscoveryReport for that user alone (its locations, and
+    one run per connector with the connector's shared status / duration).
+    There is no per-connector deadline: one batch call stands in for many
+    single-user calls. A failed connector is "error" in every report.
+    """
+
+    connectors = BATCH_CONNECTORS if connectors is None else connectors
+    reports: Dict[Hashable, DiscoveryReport] = {key: DiscoveryReport() for key in identities}
+    if not identities:
+        return reports
+
+    started = time.perf_counter()
+    pool = _get_pool()
+    futures = {
+        name: pool.submit(_timed_batch, search, identities)
+        for name, search in connectors.items()
+    }
+
+    for name, future in futures.items():
+        try:
+            results, duration = future.result()
+        except Exception as e:
+            print(f"[Discovery] Batch connector '{name}' failed: {e}")
+            duration = time.perf_counter() - started
+            for report in reports.values():
+                report.runs.append(
+                    ConnectorRun(name=name, status="error", duration=duration, error=str(e))
+                )
+            continue
+
+        for key, report in reports.items():
+            locations = results.get(key, [])
+            report.locations.extend(locations)
+            report.runs.append(
+                ConnectorRun(
+                    name=name,
+                    status="ok",
+                    duration=duration,
+                    locations_found=len(locations),
+                )
+            )
+
+    elapsed = time.perf_counter() - started
+    for report in reports.values():
+        report.elapsed = elapsed
+    return reports
+
+# ----------------------------------------------------------------------
+# Streaming
+# ----------------------------------------------------------------------
+
+# Set in a connector's progress entry while it waits for room in the queue.
+_WAITING = float("inf")
+
+
+def _put(out: "queue.Queue", item, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(
+    connector: DiscoveryConnector,
+    email: Optional[str],
+    customer_id: Optional[str],
+    batch_size: int,
+    out: "queue.Queue",
+    stop: threading.Event,
+    progress: Dict[str, float],
+) -> None:
+    """
+    Runs in the discovery pool: feeds one connector's batches into `out`,
+    then a ConnectorRun. progress[name] is when the connector last resumed
+    work (or _WAITING while the queue is full), for the caller's deadline.
+    """
+
+    name = connector.name
+    started = time.perf_counter()
+    waited = 0.0
+    found = 0
+    try:
+        if connector.stream is not None:
+            batches = connector.stream(email, customer_id, batch_size)
+        else:
+            batches = batched(connector.search(email, customer_id), batch_size)
+
+        with closing(batches):
+            for batch in batches:
+                if not batch:
+                    continue
+                found += len(batch)
+                progress[name] = _WAITING
+                put_started = time.perf_counter()
+                if not _put(out, (name, batch), stop):
+                    return
+                progress[name] = time.perf_counter()
+                waited += progress[name] - put_started
+    except Exception as e:
+        print(f"[Discovery] Connector '{name}' failed: {e}")
+        run = ConnectorRun(
+            name=name,
+            status="error",
+            duration=time.perf_counter() - started - waited,
+            locations_found=found,
+            error=str(e),
+        )
+    else:
+        run = ConnectorRun(
+            name=name,
+            status="ok",
+            duration=time.perf_counter() - started - waited,
+            locations_found=found,
+        )
+    _put(out, (name, run), stop)
+
+
+def stream_discovery(
+    email: Optional[str],
+    customer_id: Optional[str],
+    report: DiscoveryReport,
+    batch_size: Optional[int] = None,
+    connectors: Optional[List[DiscoveryConnector]] = None,
+) -> Iterator[List[DataLocation]]:
+    """
+    Streaming run_discovery: run all connectors concurrently and yield
+    their location batches (at most batch_size each) as they arrive.
+
+    At most settings.pipeline_max_pending_batches batches are buffered;
+    connectors block while the consumer is busy. A connector's deadline
+    applies to producing each batch (time spent waiting for the consumer
+    does not count). `report` is filled in as connectors finish: runs,
+    locations_streamed and, once the generator ends, elapsed. Closing the
+    generator early stops the connectors at their next batch.
+    """
+
+    settings = get_settings()
+    default_timeout = settings.discovery_connector_timeout
+    batch_size = batch_size or settings.pipeline_batch_size
+    connectors = CONNECTORS if connectors is None else connectors
+
+    out: "queue.Queue[Tuple[str, Union[List[DataLocation], ConnectorRun]]]" = queue.Queue(
+        maxsize=max(1, settings.pipeline_max_pending_batches)
+    )
+    stops: Dict[str, threading.Event] = {}
+    progress: Dict[str, float] = {}
+    timeouts: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    pool = _get_pool()
+    for connector in connectors:
+        name = connector.name
+        stops[name] = threading.Event()
+        progress[name] = started
+        timeouts[name] = connector.timeout or default_timeout
+        pool.submit(
+            _produce, connector, email, customer_id, batch_size, out, stops[name], progress
+        )
+
+    pending = set(stops)
+    try:
+        while pending:
+            now = time.perf_counter()
+            for name in [n for n in pending if progress[n] + timeouts[n] <= now]:
+                stops[name].set()
+                pending.discard(name)
+                print(f"[Discovery] Connector '{name}' missed its deadline; continuing without it.")
+                DISCOVERY_TIMEOUTS.labels(connector=name).inc()
+                report.runs.append(
+                    ConnectorRun(name=name, status="timeout", duration=now - started)
+                )
+            if not pending:
+                break
+
+            next_deadline = min(progress[n] + timeouts[n] for n in pending)
+            try:
+                name, item = out.get(timeout=min(max(0.0, next_deadline - now), 1.0))
+            except queue.Empty:
+                continue
+
+            if name not in pending:
+                continue    # late output of a connector that timed out
+            if isinstance(item, ConnectorRun):
+                pending.discard(name)
+                report.runs.append(item)
+                continue
+
+            report.locations_streamed += len(item)
+            yield item
+    finally:
+        for stop in stops.values():
+            stop.set()
+        report.elapsed = time.perf_counter() - started
@@ -0,0 +1,323 @@
+# backend/app/tools/file_redactor.py
+
+"""
+LIVE-mode redaction of lake files.
+
+Each matched file is streamed through a chunked find-and-mask transform:
+blocks of settings.file_redaction_block_size bytes are searched with one
+compiled pattern of all identifiers, and every hit is overwritten with '*'
+of the same length (byte offsets / line numbers stay valid, JSON stays
+JSON). A hit must be a whole token, by the tokenizer rule of the lake index
+(app/tools/adls_index.py): "CUST001" is not masked inside "CUST0012", nor
+"a@x.com" inside "bob.a@x.com". Only the bytes after the last safe cut
+point — enough for the longest identifier plus its boundary context, or the
+end of a hit straddling it — are carried into the next block, so memory is
+constant in the file size and a hit spanning a block boundary is found
+exactly as in a whole-file scan.
+
+Output goes to a temp file in the same directory, which is fsynced and
+then os.replace()d over the original (an atomic rename on POSIX), followed
+by an fsync of the directory. A crash leaves either the old or the new
+file, never a half-written one; stray "*.redact-tmp" files are the only
+possible leftover. A file that changes while it is being redacted is left
+alone and reported as failed.
+
+Redactions of one file are serialized for the whole read-to-replace cycle:
+by a per-path lock between threads, and by flock() on the file between
+processes (POSIX only), so concurrent requests for different users each
+see the other's result instead of one of them failing.
+
+Files are redacted in parallel on a shared pool of
+settings.file_redaction_workers threads. Both MASK and DELETE redact: lake
+files are shared exports, so deleting a user's data means removing their
+identifiers, not the file.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import fcntl  # POSIX only
+except ImportError:  # pragma: no cover - depends on platform
+    fcntl = None
+
+from app.core.config import get_settings
+from app.tools.adls_index import TOKEN_BOUNDARY_CONTEXT, is_whole_token
+from app.agents.state import (
+    ActionStatus,
+    ActionType,
+    DeletionAction,
+    LocationType,
+    UserIdentifiers,
+)
+
+EXECUTED_ACTIONS = (ActionType.MASK, ActionType.DELETE)
+
+TEMP_SUFFIX = ".redact-tmp"
+MASK_BYTE = b"*"
+
+
+@dataclass
+class FileRedaction:
+    path: str
+    status: str                # "redacted" / "unchanged" / "failed"
+    replacements: int = 0
+    bytes_processed: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class FileExecutionReport:
+    files: List[FileRedaction] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def replacements(self) -> int:
+        return sum(f.replacements for f in self.files)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for f in self.files if f.status == "failed")
+
+
+def compile_needles(needles: Iterable[bytes]) -> "re.Pattern[bytes]":
+    # Longest first, so a needle that contains another wins.
+    ordered = sorted({n for n in needles if n}, key=len, reverse=True)
+    if not ordered:
+        raise ValueError("Nothing to redact")
+    return re.compile(b"|".join(re.escape(n) for n in ordered))
+
+
+def redact_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    pattern: "re.Pattern[bytes]",
+    max_needle: int,
+    block_size: int,
+) -> int:
+    """
+    Copy src to dst with every match of `pattern` that is a whole token
+    masked. Returns the number of replacements. Holds at most
+    block_size + max_needle + 2 * TOKEN_BOUNDARY_CONTEXT + 1 bytes.
+    """
+
+    keep = max_needle + TOKEN_BOUNDARY_CONTEXT
+    carry = b""
+    lead = 0    # bytes at the start of carry already written: lookbehind context
+    replacements = 0
+
+    while True:
+        block = src.read(block_size)
+        eof = not block
+        data = carry + block
+
+        # Matches starting before `cut` are final: every needle starting
+        # there, and its boundary context, fits in `data`. At EOF
+        # everything is final.
+        cut = len(data) if eof else max(len(data) - keep, lead)
+        out = bytearray()
+        pos = search = lead
+        while True:
+            m = pattern.search(data, search)
+            if m is None or m.start() >= cut:
+                break
+            if not is_whole_token(data, m.start(), m.end()):
+                search = m.start() + 1
+                continue
+            out += data[pos : m.start()]
+            out += MASK_BYTE * (m.end() - m.start())
+            pos = search = m.end()
+            replacements += 1
+        cut = max(cut, pos)
+        out += data[pos:cut]
+        dst.write(out)
+
+        if eof:
+            return replacements
+        lead = min(cut, TOKEN_BOUNDARY_CONTEXT + 1)
+        carry = data[cut - lead :]
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return    # e.g. Windows: directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# Per-path locks for redact_file, created under _pool_lock. One per file
+# ever redacted by this process; the lake is finite, so they are kept.
+_path_locks: Dict[str, threading.Lock] = {}
+
+
+@contextmanager
+def _locked_file(path: str) -> Iterator[BinaryIO]:
+    """
+    Open `path` for reading, holding its redaction lock until exit.
+
+    Between processes the lock is flock() on the open file. A writer that
+    got the lock while we waited has os.replace()d the path by the time we
+    get it, so we retry until the locked file is still the one at `path`.
+    """
+
+    key = os.path.abspath(path)
+    with _pool_lock:
+        lock = _path_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        while True:
+            f = open(path, "rb")
+            if fcntl is None:
+                break
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                if os.fstat(f.fileno()).st_ino == os.stat(path).st_ino:
+                    break
+            except BaseException:
+                f.close()
+                raise
+            f.close()
+        try:
+            yield f
+        finally:
+            f.close()    # also releases the flock
+
+
+def redact_file(path: str, needles: Sequence[bytes], block_size: Optional[int] = None) -> FileRedaction:
+    """
+    Mask `needles` in the file at `path`, atomically replacing it.
+    """
+
+    block_size = block_size or get_settings().file_redaction_block_size
+    started = time.perf_counter()
+    pattern = compile_needles(needles)
+    max_needle = max(len(n) for n in needles if n)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = None
+    try:
+        with _locked_file(path) as src:
+            before = os.fstat(src.fileno())
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory, prefix=f".{os.path.basename(path)}.", suffix=TEMP_SUFFIX
+            )
+            with os.fdopen(fd, "wb") as dst:
+                replacements = redact_stream(src, dst, pattern, max_needle, block_size)
+                dst.flush()
+                if replacements:
+                    os.fsync(dst.fileno())
+
+            if not replacements:
+                os.remove(tmp_path)
+                return FileRedaction(
+                    path, "unchanged", 0, before.st_size, time.perf_counter() - started
+                )
+
+            after = os.stat(path)
+            if (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size):
+                os.remove(tmp_path)
+                return FileRedaction(
+                    path, "failed", 0, before.st_size, time.perf_counter() - started,
+                    "file changed during redaction",
+                )
+
+            os.chmod(tmp_path, before.st_mode & 0o7777)
+            os.replace(tmp_path, path)
+            _fsync_dir(directory)
+        return FileRedaction(
+            path, "redacted", replacements, before.st_size, time.perf_counter() - started
+        )
+    except Exception as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f"[FileRedactor] Could not redact {path}: {e}")
+        return FileRedaction(path, "failed", 0, 0, time.perf_counter() - started, str(e))
+
+
+# ----------------------------------------------------------------------
+# Executor
+# ----------------------------------------------------------------------
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=get_settings().file_redaction_workers,
+                thread_name_prefix="regent-redact",
+            )
+        return _pool
+
+
+def _needles(ids: UserIdentifiers, pii_fields: Iterable[str]) -> List[bytes]:
+    values = {"email": ids.email, "customer_id": ids.customer_id}
+    wanted = [f for f in pii_fields if f in values] or list(values)
+    return [values[f].encode("utf-8") for f in wanted if values[f]]
+
+
+def execute_file_actions(
+    actions: Sequence[DeletionAction],
+    identifiers: UserIdentifiers,
+    block_size: Optional[int] = None,
+) -> FileExecutionReport:
+    """
+    Redact the user's identifiers from every file with a MASK / DELETE
+    action and record the outcome on each action (status + a "LIVE: ..."
+    note in outcome). Files are processed in parallel, each once.
+    """
+
+    report = FileExecutionReport()
+    started = time.perf_counter()
+
+    by_path: Dict[str, List[DeletionAction]] = {}
+    for action in actions:
+        loc = action.location
+        if loc.location_type != LocationType.FILE or action.action_type not in EXECUTED_ACTIONS:
+            continue
+        by_path.setdefault(loc.file_path, []).append(action)
+
+    jobs = {}
+    for path, path_actions in by_path.items():
+        needles = sorted(
+            {n for a in path_actions for n in _needles(identifiers, a.location.pii_fields)}
+        )
+        if not path or not needles:
+            for action in path_actions:
+                action.status = ActionStatus.FAILED
+                action.add_outcome("LIVE: missing file path / identifiers")
+            continue
+        jobs[path] = _get_pool().submit(redact_file, path, needles, block_size)
+
+    for path, future in jobs.items():
+        result = future.result()
+        report.files.append(result)
+        if result.status == "failed":
+            status, note = ActionStatus.FAILED, f"LIVE: redaction failed: {result.error}"
+        elif result.status == "unchanged":
+            status, note = ActionStatus.SKIPPED, "LIVE: identifiers no longer in file"
+        else:
+            status, note = ActionStatus.SUCCESS, f"LIVE: redacted {result.replacements} occurrence(s)"
+        for action in by_path[path]:
+            action.status = status
+            action.add_outcome(note)
+
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,147 @@
+# backend/app/tools/file_scanner.py
+
+"""
+Constant-memory search of identifiers in (possibly huge) lake files.
+
+Two modes, both working on raw bytes (identifiers are UTF-8 encoded once,
+file contents are never decoded):
+
+- "stream": read fixed-size blocks; the last (longest needle + context)
+  bytes of each block are carried into the next one, so hits spanning a
+  block boundary are found exactly once.
+- "mmap":   memory-map the file and let mmap.find() walk it; the OS pages
+  data in and out, so RSS does not grow with file size.
+
+Only whole-token hits count (adls_index.is_whole_token), the same rule the
+ADLS index tokenizes by: "C10" is not found inside "C100".
+
+Hits are reported as (byte offset, 1-based line number), capped per needle
+and file, so a frequent identifier never hides a rarer one.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from app.tools.adls_index import TOKEN_BOUNDARY_CONTEXT, is_whole_token
+
+READ_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Window used to count newlines between hits in mmap mode.
+LINE_COUNT_WINDOW = 4 * 1024 * 1024
+
+SCAN_MODES = ("stream", "mmap")
+
+
+@dataclass
+class FileHit:
+    pii_field: str
+    byte_offset: int
+    line_number: int
+
+
+def scan_file(
+    path: str,
+    needles: Dict[str, bytes],
+    mode: str = "stream",
+    max_hits: int = 100,
+) -> List[FileHit]:
+    """
+    Find `needles` (pii_field -> encoded identifier) in the file at `path`.
+    Returns hits sorted by offset; at most `max_hits` per needle.
+    """
+
+    needles = {k: v for k, v in needles.items() if v}
+    if not needles:
+        return []
+    if mode == "mmap":
+        return _scan_mmap(path, needles, max_hits)
+    if mode == "stream":
+        return _scan_stream(path, needles, max_hits)
+    raise ValueError(f"Unknown scan mode: {mode!r} (expected one of {SCAN_MODES})")
+
+
+def _scan_stream(path: str, needles: Dict[str, bytes], max_hits: int) -> List[FileHit]:
+    # A hit is decided once TOKEN_BOUNDARY_CONTEXT + 1 bytes follow it (or
+    # at EOF); the tail keeps enough bytes to look behind undecided hits.
+    context = TOKEN_BOUNDARY_CONTEXT + 1
+    keep = max(len(n) for n in needles.values()) + 2 * context
+    hits: List[FileHit] = []
+    counts = {pii_field: 0 for pii_field in needles}
+
+    tail = b""
+    tail_offset = 0      # absolute offset of data[0]
+    tail_lines = 0       # newlines before data[0]
+
+    with open(path, "rb") as f:
+        while any(n < max_hits for n in counts.values()):
+            block = f.read(READ_BLOCK_SIZE)
+            eof = not block
+            data = tail + block
+
+            # Hits ending at or before `done` were decided in the previous
+            # round; those ending after `limit` are decided in the next one.
+            done = len(tail) - context
+            limit = len(data) if eof else len(data) - context
+
+            found: List[Tuple[int, str]] = []
+            for pii_field, needle in needles.items():
+                if counts[pii_field] >= max_hits:
+                    continue
+                pos = data.find(needle, max(0, done - len(needle) + 1))
+                while pos != -1 and pos + len(needle) <= limit and counts[pii_field] < max_hits:
+                    if is_whole_token(data, pos, pos + len(needle)):
+                        found.append((pos, pii_field))
+                        counts[pii_field] += 1
+                    pos = data.find(needle, pos + 1)
+
+            found.sort()
+            newlines = tail_lines
+            counted_to = 0
+            for pos, pii_field in found:
+                newlines += data.count(b"\n", counted_to, pos)
+                counted_to = pos
+                hits.append(FileHit(pii_field, tail_offset + pos, newlines + 1))
+
+            if eof:
+                break
+            cut = max(len(data) - keep, 0)
+            tail_lines += data.count(b"\n", 0, cut)
+            tail_offset += cut
+            tail = data[cut:]
+
+    return hits
+
+
+def _scan_mmap(path: str, needles: Dict[str, bytes], max_hits: int) -> List[FileHit]:
+    if os.path.getsize(path) == 0:
+        return []
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        found: List[Tuple[int, str]] = []
+        for pii_field, needle in needles.items():
+            pos = mm.find(needle)
+            count = 0
+            while pos != -1 and count < max_hits:
+                if is_whole_token(mm, pos, pos + len(needle)):
+                    found.append((pos, pii_field))
+                    count += 1
+                pos = mm.find(needle, pos + 1)
+
+        found.sort()
+        hits: List[FileHit] = []
+        newlines = 0
+        counted_to = 0
+        for pos, pii_field in found:
+            # Count newlines in bounded windows so we never copy the whole gap.
+            while counted_to < pos:
+                window_end = min(pos, counted_to + LINE_COUNT_WINDOW)
+                newlines += mm[counted_to:window_end].count(b"\n")
+                counted_to = window_end
+            hits.append(FileHit(pii_field, pos, newlines + 1))
+
+    return hits
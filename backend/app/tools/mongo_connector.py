@@ -1,19 +1,81 @@
 # backend/app/tools/mongo_connector.py
 
-from typing import Optional, List
+import threading
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional
 
 from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 
 from app.core.config import get_settings
-from app.agents.state import DataLocation, LocationType
+from app.core.metrics import (
+    CONNECTOR_CALLS,
+    CONNECTOR_DURATION,
+    CONNECTOR_IN_FLIGHT,
+    instrumented,
+)
+from app.agents.state import DataLocation, LocationType, UserIdentifiers, pii_fields_tuple
+from app.tools.batching import batched
 
 settings = get_settings()
 
+# Only the fields we need to build DataLocations / match identifiers.
+_PROJECTION = {"_id": 1, "email": 1, "customer_id": 1}
 
+_PII_FIELDS = pii_fields_tuple(("email", "customer_id", "payload"))
+
+_client: Optional[MongoClient] = None
+_client_lock = threading.Lock()
+
+
+def get_mongo_client() -> MongoClient:
+    """
+    Process-wide MongoClient.
+
+    MongoClient is thread-safe and keeps its own connection pool, so one
+    instance is shared by all requests instead of paying connection setup,
+    server selection and TLS per call. Closed by close_mongo_client()
+    on application shutdown.
+    """
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = MongoClient(
+                settings.MONGO_URI,
+                maxPoolSize=settings.mongo_max_pool_size,
+                minPoolSize=settings.mongo_min_pool_size,
+                serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+            )
+        return _client
+
+
+def close_mongo_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _events_collection():
+    return get_mongo_client()[settings.MONGO_DB_NAME]["events"]
+
+
+def _to_location(doc) -> DataLocation:
+    return DataLocation(
+        source_name="MongoEvents",
+        location_type=LocationType.MONGO_DOC,
+        collection_name="events",
+        document_id=str(doc.get("_id")),
+        pii_fields=_PII_FIELDS,
+    )
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="mongo")
 def search_user_pii_in_mongo(
     email: Optional[str],
     customer_id: Optional[str],
+    strict: bool = False,
 ) -> List[DataLocation]:
     """
     Discovery helper for MongoDB.
@@ -25,12 +87,14 @@ def search_user_pii_in_mongo(
         - "payload" (may contain PII text)
 
     This function:
-      - Connects to MongoDB using settings.MONGO_URI / MONGO_DB_NAME
+      - Uses the shared client (settings.MONGO_URI / MONGO_DB_NAME)
       - Builds a query using available identifiers
-      - Returns DataLocation objects for matching documents
+      - Returns DataLocation objects for all matching documents
+        (cursor is fetched in batches of settings.mongo_cursor_batch_size)
 
     If Mongo is not available, it catches the error and returns an empty list
-    so the system continues working.
+    so the system continues working. With strict=True the error is raised
+    instead, so discovery can report the connector as failed.
     """
 
     locations: List[DataLocation] = []
@@ -40,34 +104,109 @@ def search_user_pii_in_mongo(
         return locations
 
     try:
-        client = MongoClient(settings.MONGO_URI)
-        db = client[settings.MONGO_DB_NAME]
-        collection = db["events"]
-
-        query = {}
-        if email:
-            query["email"] = email
-        if customer_id:
-            query["customer_id"] = customer_id
-
-        # Limit to a reasonable number for demo
-        cursor = collection.find(query).limit(50)
-
-        for doc in cursor:
-            loc = DataLocation(
-                source_name="MongoEvents",
-                location_type=LocationType.MONGO_DOC,
-                collection_name="events",
-                document_id=str(doc.get("_id")),
-                pii_fields=["email", "customer_id", "payload"],
-            )
-            locations.append(loc)
-
-        client.close()
+        locations.extend(_iter_user_locations(email, customer_id))
     except PyMongoError as e:
         # If Mongo is not running or any error occurs, just log and return empty.
         print(f"[MongoConnector] Error while searching MongoDB: {e}")
+        if strict:
+            raise
     except Exception as e:
         print(f"[MongoConnector] Unexpected error: {e}")
+        if strict:
+            raise
 
     return locations
+
+
+def _iter_user_locations(email: Optional[str], customer_id: Optional[str]) -> Iterator[DataLocation]:
+    query = {}
+    if email:
+        query["email"] = email
+    if customer_id:
+        query["customer_id"] = customer_id
+
+    cursor = _events_collection().find(query, _PROJECTION).batch_size(
+        settings.mongo_cursor_batch_size
+    )
+    for doc in cursor:
+        yield _to_location(doc)
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="mongo_stream")
+def iter_user_pii_in_mongo(
+    email: Optional[str],
+    customer_id: Optional[str],
+    batch_size: int,
+) -> Iterator[List[DataLocation]]:
+    """
+    Streaming variant of search_user_pii_in_mongo for the streaming
+    pipeline: yields lists of at most batch_size DataLocations while the
+    cursor is still being read. Errors are raised (after the batches
+    already yielded), so the stream's connector is reported as failed.
+    """
+
+    if not email and not customer_id:
+        return
+
+    yield from batched(_iter_user_locations(email, customer_id), batch_size)
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="mongo_batch")
+def search_users_pii_in_mongo_batch(
+    identities: Mapping[Hashable, UserIdentifiers],
+    strict: bool = False,
+) -> Dict[Hashable, List[DataLocation]]:
+    """
+    Batch discovery in Mongo for many users at once.
+
+    Users with an email are resolved with `{"email": {"$in": [...]}}` queries
+    (customer_id, if given, must match too – same rule as the single-user
+    search); users with only a customer_id use `{"customer_id": {"$in": [...]}}`.
+    Identifiers are sent in chunks of settings.mongo_in_chunk_size.
+
+    Returns key -> list of DataLocations (every key is present).
+    Errors are logged and the results so far returned; with strict=True
+    they are raised.
+    """
+
+    results: Dict[Hashable, List[DataLocation]] = {key: [] for key in identities}
+
+    by_email: Dict[str, List[Hashable]] = {}
+    by_customer_id: Dict[str, List[Hashable]] = {}
+    for key, ids in identities.items():
+        if ids.email:
+            by_email.setdefault(ids.email, []).append(key)
+        elif ids.customer_id:
+            by_customer_id.setdefault(ids.customer_id, []).append(key)
+
+    try:
+        collection = _events_collection()
+
+        for field, owners in (("email", by_email), ("customer_id", by_customer_id)):
+            values = list(owners)
+            for start in range(0, len(values), settings.mongo_in_chunk_size):
+                chunk = values[start : start + settings.mongo_in_chunk_size]
+                cursor = collection.find(
+                    {field: {"$in": chunk}}, _PROJECTION
+                ).batch_size(settings.mongo_cursor_batch_size)
+
+                for doc in cursor:
+                    for key in owners.get(doc.get(field), ()):
+                        wanted_customer_id = identities[key].customer_id
+                        if (
+                            field == "email"
+                            and wanted_customer_id
+                            and doc.get("customer_id") != wanted_customer_id
+                        ):
+                            continue
+                        results[key].append(_to_location(doc))
+    except PyMongoError as e:
+        print(f"[MongoConnector] Error while searching MongoDB: {e}")
+        if strict:
+            raise
+    except Exception as e:
+        print(f"[MongoConnector] Unexpected error: {e}")
+        if strict:
+            raise
+
+    return results
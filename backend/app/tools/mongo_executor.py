@@ -0,0 +1,190 @@
+# backend/app/tools/mongo_executor.py
+
+"""
+LIVE-mode execution of Mongo DeletionActions.
+
+Actions are grouped by (collection, action type) and sent as unordered
+bulk_write batches of settings.mongo_executor_batch_size operations instead
+of one round trip per document:
+
+    DELETE  DeleteOne({"_id": id})
+    MASK    UpdateOne({"_id": id}, {"$set": {<pii field>: <mask value>}})
+
+MASK overwrites the location's pii_fields: "email" becomes
+"redacted-<id>@redacted.invalid", everything else (customer_id, payload, ...)
+becomes null.
+
+Unordered batches keep going past a failing operation; the writeErrors of a
+BulkWriteError carry the index of each failed operation, which maps it back
+to its action (FAILED + error message), while the rest of the batch succeeds.
+Documents that no longer exist are reported SKIPPED for MASK; a DELETE of a
+missing document counts as done.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.core.config import get_settings
+from app.agents.state import ActionStatus, ActionType, DeletionAction, LocationType
+from app.tools.mongo_connector import get_mongo_client
+
+EXECUTED_ACTIONS = (ActionType.MASK, ActionType.DELETE)
+
+
+@dataclass
+class MongoBatchResult:
+    collection_name: str
+    action_type: str
+    batch: int                 # 1-based, within its (collection, action type) group
+    operations: int
+    documents_affected: int
+    write_errors: int
+    status: str                # "ok" / "partial" / "failed"
+    duration: float
+    error: Optional[str] = None
+
+
+@dataclass
+class MongoExecutionReport:
+    batches: List[MongoBatchResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def documents_affected(self) -> int:
+        return sum(b.documents_affected for b in self.batches)
+
+    @property
+    def write_errors(self) -> int:
+        return sum(b.write_errors for b in self.batches)
+
+
+def _document_id(document_id: str) -> Any:
+    # DataLocation keeps ids as strings; Mongo-generated ids are ObjectIds.
+    return ObjectId(document_id) if ObjectId.is_valid(document_id) else document_id
+
+
+def _mask_update(doc_id: Any, pii_fields: Sequence[str]) -> Dict[str, Any]:
+    values = {
+        name: f"redacted-{doc_id}@redacted.invalid" if name == "email" else None
+        for name in pii_fields
+    }
+    return {"$set": values}
+
+
+def _operation(action_type: ActionType, doc_id: Any, actions: List[DeletionAction]):
+    if action_type == ActionType.DELETE:
+        return DeleteOne({"_id": doc_id})
+    fields = sorted({f for a in actions for f in a.location.pii_fields}) or ["email"]
+    return UpdateOne({"_id": doc_id}, _mask_update(doc_id, fields))
+
+
+def _group_actions(
+    actions: Sequence[DeletionAction],
+) -> Dict[Tuple[str, ActionType], Dict[Any, List[DeletionAction]]]:
+    # (collection, action type) -> document id -> actions on that document
+    groups: Dict[Tuple[str, ActionType], Dict[Any, List[DeletionAction]]] = {}
+    for action in actions:
+        loc = action.location
+        if loc.location_type != LocationType.MONGO_DOC or action.action_type not in EXECUTED_ACTIONS:
+            continue
+        if not loc.collection_name or not loc.document_id:
+            action.status = ActionStatus.FAILED
+            action.add_outcome("LIVE: missing collection name / document id")
+            continue
+        by_id = groups.setdefault((loc.collection_name, action.action_type), {})
+        by_id.setdefault(_document_id(loc.document_id), []).append(action)
+    return groups
+
+
+def execute_mongo_actions(
+    actions: Sequence[DeletionAction],
+    database=None,
+    batch_size: Optional[int] = None,
+) -> MongoExecutionReport:
+    """
+    Apply the Mongo MASK / DELETE actions and record the outcome on each
+    action (status + a "LIVE: ..." note in outcome).
+
+    database defaults to settings.MONGO_DB_NAME on the shared client; any
+    pymongo-compatible Database (e.g. mongomock) works.
+    """
+
+    settings = get_settings()
+    batch_size = batch_size or settings.mongo_executor_batch_size
+    report = MongoExecutionReport()
+    started = time.perf_counter()
+
+    groups = _group_actions(actions)
+    if groups and database is None:
+        database = get_mongo_client()[settings.MONGO_DB_NAME]
+
+    for (collection_name, action_type), by_id in groups.items():
+        collection = database[collection_name]
+        verb = "masked" if action_type == ActionType.MASK else "deleted"
+        ids = list(by_id)
+        total_batches = (len(ids) + batch_size - 1) // batch_size
+
+        for n, start in enumerate(range(0, len(ids), batch_size), 1):
+            batch_ids = ids[start : start + batch_size]
+            operations = [_operation(action_type, doc_id, by_id[doc_id]) for doc_id in batch_ids]
+            batch_started = time.perf_counter()
+            failed: Dict[int, str] = {}
+
+            try:
+                result = collection.bulk_write(operations, ordered=False)
+                details = result.bulk_api_result
+            except BulkWriteError as e:
+                details = e.details
+                failed = {
+                    err["index"]: err.get("errmsg", "write error")
+                    for err in details.get("writeErrors", [])
+                }
+            except PyMongoError as e:
+                print(f"[MongoExecutor] {collection_name} {action_type.value} batch {n} failed: {e}")
+                report.batches.append(
+                    MongoBatchResult(
+                        collection_name, action_type.value, n, len(operations), 0, len(operations),
+                        "failed", time.perf_counter() - batch_started, str(e),
+                    )
+                )
+                for doc_id in batch_ids:
+                    for action in by_id[doc_id]:
+                        action.status = ActionStatus.FAILED
+                        action.add_outcome(f"LIVE: batch {n}/{total_batches} failed: {e}")
+                continue
+
+            counter = "nRemoved" if action_type == ActionType.DELETE else "nMatched"
+            affected = details.get(counter, 0)
+            missing = set()
+            if action_type == ActionType.MASK and affected < len(operations) - len(failed):
+                # Some documents were gone; find out which (one extra query).
+                present = {
+                    d["_id"] for d in collection.find({"_id": {"$in": batch_ids}}, {"_id": 1})
+                }
+                missing = set(batch_ids) - present
+
+            report.batches.append(
+                MongoBatchResult(
+                    collection_name, action_type.value, n, len(operations), affected, len(failed),
+                    "partial" if failed else "ok", time.perf_counter() - batch_started,
+                )
+            )
+            where = f"batch {n}/{total_batches}"
+            for index, doc_id in enumerate(batch_ids):
+                if index in failed:
+                    status, note = ActionStatus.FAILED, f"LIVE: write error in {where}: {failed[index]}"
+                elif doc_id in missing:
+                    status, note = ActionStatus.SKIPPED, f"LIVE: document not found ({where})"
+                else:
+                    status, note = ActionStatus.SUCCESS, f"LIVE: {verb} in {where}"
+                for action in by_id[doc_id]:
+                    action.status = status
+                    action.add_outcome(note)
+
+    report.elapsed = time.perf_counter() - started
+    return report
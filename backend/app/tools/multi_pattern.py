@@ -0,0 +1,137 @@
+# backend/app/tools/multi_pattern.py
+
+"""
+Multi-pattern byte matcher (Aho-Corasick).
+
+Used for batch discovery: thousands of identifiers are compiled into one
+automaton, so scanning a file costs one pass over its bytes regardless of
+how many identifiers we are looking for.
+
+If the optional `pyahocorasick` package is installed its C automaton is
+used; otherwise a pure-Python automaton with the same interface is used
+(same results, lower throughput).
+"""
+
+from collections import deque
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+
+class MultiPatternMatcher:
+    """
+    Compiled set of byte patterns. Pattern ids are their index in `patterns`.
+
+        matcher = MultiPatternMatcher([b"alice@example.com", b"CUST001"])
+        stream = matcher.stream()
+        for block in blocks:
+            for pattern_id, end_offset in stream.feed(block):
+                ...
+    """
+
+    def __init__(self, patterns: Sequence[bytes]) -> None:
+        if any(not p for p in patterns):
+            raise ValueError("patterns must be non-empty")
+
+        self.patterns: List[bytes] = list(patterns)
+        self.max_length = max((len(p) for p in self.patterns), default=0)
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for pattern_id, pattern in enumerate(self.patterns):
+                # latin-1 maps bytes 1:1 onto code points, so string offsets
+                # are byte offsets.
+                key = pattern.decode("latin-1")
+                existing = self._automaton.get(key, ())
+                self._automaton.add_word(key, existing + (pattern_id,))
+            if self.patterns:
+                self._automaton.make_automaton()
+        else:
+            self._build_python_automaton()
+
+    def stream(self) -> "MatchStream":
+        return MatchStream(self)
+
+    # ----------------- Pure-Python automaton -----------------
+
+    def _build_python_automaton(self) -> None:
+        goto: List[Dict[int, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for byte in pattern:
+                nxt = goto[state].get(byte)
+                if nxt is None:
+                    goto.append({})
+                    out.append(())
+                    nxt = len(goto) - 1
+                    goto[state][byte] = nxt
+                state = nxt
+            out[state] = out[state] + (pattern_id,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for byte, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and byte not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(byte, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+
+class MatchStream:
+    """
+    Matching state for one input stream (e.g. one file read in blocks).
+    Matches that span block boundaries are found; each is reported once,
+    as (pattern_id, end_offset) with end_offset exclusive and absolute.
+    feed() is a generator: iterate it fully before feeding the next block.
+    """
+
+    def __init__(self, matcher: MultiPatternMatcher) -> None:
+        self.matcher = matcher
+        self.offset = 0          # absolute offset of the next byte fed
+        self._state = 0          # pure-Python automaton state
+        self._tail = b""         # C automaton: last max_length-1 bytes
+
+    def feed(self, block: bytes) -> Iterator[Tuple[int, int]]:
+        matcher = self.matcher
+        if not matcher.patterns or not block:
+            self.offset += len(block)
+            return
+
+        if ahocorasick is not None:
+            data = self._tail + block
+            base = self.offset - len(self._tail)
+            min_end = len(self._tail)
+            for end_index, pattern_ids in matcher._automaton.iter(data.decode("latin-1")):
+                if end_index >= min_end:
+                    for pattern_id in pattern_ids:
+                        yield pattern_id, base + end_index + 1
+            keep = matcher.max_length - 1
+            self._tail = data[-keep:] if keep else b""
+            self.offset += len(block)
+            return
+
+        goto, fail, out = matcher._goto, matcher._fail, matcher._out
+        state = self._state
+        base = self.offset
+        for i, byte in enumerate(block):
+            while state and byte not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(byte, 0)
+            if out[state]:
+                for pattern_id in out[state]:
+                    yield pattern_id, base + i + 1
+        self._state = state
+        self.offset += len(block)
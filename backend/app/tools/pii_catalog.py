@@ -0,0 +1,82 @@
+# backend/app/tools/pii_catalog.py
+
+"""
+Declarative catalog of SQL tables that hold user PII.
+
+SQL discovery (and later, masking/deletion) is driven by this list instead
+of being hardcoded per model: to cover a new table, add a PiiTable entry.
+Tables are referenced by name with lightweight `table()` / `column()`
+constructs, so no ORM model is needed and no full rows are loaded.
+
+mask_values says what MASK writes into each PII column (app/tools/sql_executor.py):
+a literal or a SQL expression; PII columns without an entry are set to NULL.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import String, cast, column, literal, table
+from sqlalchemy.sql.expression import ColumnClause, TableClause
+
+
+def redacted_email(primary_key: str) -> Any:
+    """
+    Per-row placeholder for NOT NULL / UNIQUE email columns:
+    'redacted-<pk>@redacted.invalid'.
+    """
+    return literal("redacted-") + cast(column(primary_key), String) + "@redacted.invalid"
+
+
+@dataclass(frozen=True)
+class PiiTable:
+    """
+    source_name:        logical system name used by policies (e.g. "CustomerDB")
+    table_name:         physical table
+    primary_key:        single-column primary key
+    identifier_columns: user identifier -> column holding it
+                        ("email" / "customer_id")
+    pii_columns:        columns containing PII (reported as pii_fields)
+    mask_values:        PII column -> value written by MASK (default NULL)
+    """
+
+    source_name: str
+    table_name: str
+    primary_key: str
+    identifier_columns: Dict[str, str]
+    pii_columns: Tuple[str, ...] = field(default_factory=tuple)
+    mask_values: Dict[str, Any] = field(default_factory=dict)
+
+    @cached_property
+    def table(self) -> TableClause:
+        names = {self.primary_key, *self.identifier_columns.values(), *self.pii_columns}
+        return table(self.table_name, *(column(n) for n in sorted(names)))
+
+    def col(self, name: str) -> ColumnClause:
+        return self.table.c[name]
+
+    def mask_assignments(self) -> Dict[str, Any]:
+        """
+        UPDATE ... SET values that mask every PII column.
+        """
+        return {name: self.mask_values.get(name) for name in self.pii_columns}
+
+
+PII_CATALOG: List[PiiTable] = [
+    PiiTable(
+        source_name="CustomerDB",
+        table_name="customer_orders",
+        primary_key="id",
+        identifier_columns={"email": "user_email", "customer_id": "customer_id"},
+        pii_columns=("user_email", "customer_id", "shipping_address", "notes"),
+        mask_values={"user_email": redacted_email("id")},
+    ),
+    PiiTable(
+        source_name="CustomerDB",
+        table_name="user_profiles",
+        primary_key="id",
+        identifier_columns={"email": "email", "customer_id": "customer_id"},
+        pii_columns=("email", "customer_id", "phone", "dob", "full_name"),
+        mask_values={"email": redacted_email("id")},
+    ),
+]
@@ -1,8 +1,13 @@
 # backend/app/tools/policy_engine.py
 
+import json
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from app.core.config import get_settings
 from app.agents.state import DataLocation, LocationType, ActionType
 
 
@@ -28,7 +33,8 @@ class PolicyRule:
 
 
 # ----------------------------------------------------------------------
-# Example policy rules (you can customize/extend later)
+# Built-in policy rules, used when no rules file can be loaded.
+# The default rules file (policy_rules.json) contains the same rules.
 # ----------------------------------------------------------------------
 
 POLICY_RULES: List[PolicyRule] = [
@@ -52,6 +58,172 @@ POLICY_RULES: List[PolicyRule] = [
     ),
 ]
 
+DEFAULT_DECISION: Tuple[ActionType, str] = (
+    ActionType.MASK,
+    "Default policy: mask PII when no specific rule is defined.",
+)
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "policy_rules.json")
+
+PolicyKey = Tuple[Optional[str], Optional[LocationType]]
+
+
+class CompiledPolicy:
+    """
+    Rules compiled into an index keyed by (source_name, location_type).
+
+    First-match semantics of the rule list are preserved: for a location,
+    the candidate patterns are (source, type), (source, *), (*, type) and
+    (*, *); the winner is the candidate whose first rule comes earliest in
+    the list. Decisions are memoized per key, so deciding is O(1).
+    """
+
+    def __init__(self, rules: Sequence[PolicyRule]) -> None:
+        self.rules: List[PolicyRule] = list(rules)
+        self._first_rule: Dict[PolicyKey, int] = {}
+        for i, rule in enumerate(self.rules):
+            self._first_rule.setdefault((rule.source_name, rule.location_type), i)
+        self._decisions: Dict[PolicyKey, Tuple[ActionType, str]] = {}
+
+    def decide(
+        self,
+        source_name: Optional[str],
+        location_type: Optional[LocationType],
+    ) -> Tuple[ActionType, str]:
+        if location_type is not None and not isinstance(location_type, LocationType):
+            # Plain strings compare equal to the enum but hash differently.
+            location_type = LocationType(location_type)
+
+        key = (source_name, location_type)
+        decision = self._decisions.get(key)
+        if decision is not None:
+            return decision
+
+        best: Optional[int] = None
+        for candidate in (
+            (source_name, location_type),
+            (source_name, None),
+            (None, location_type),
+            (None, None),
+        ):
+            i = self._first_rule.get(candidate)
+            if i is not None and (best is None or i < best):
+                best = i
+
+        if best is None:
+            decision = DEFAULT_DECISION
+        else:
+            rule = self.rules[best]
+            decision = (rule.action, rule.description or "Matched policy rule.")
+
+        self._decisions[key] = decision
+        return decision
+
+
+def _parse_enum(enum_cls, value):
+    if value is None:
+        return None
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return enum_cls[str(value).upper()]
+
+
+def load_policy_rules(path: str) -> List[PolicyRule]:
+    """
+    Read rules from a JSON file: a list of objects with optional
+    source_name / location_type, plus action and description.
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, list):
+        raise ValueError("policy rules file must contain a JSON list")
+
+    return [
+        PolicyRule(
+            source_name=item.get("source_name"),
+            location_type=_parse_enum(LocationType, item.get("location_type")),
+            action=_parse_enum(ActionType, item.get("action", "mask")),
+            description=item.get("description", ""),
+        )
+        for item in raw
+    ]
+
+
+class PolicyStore:
+    """
+    Holds the current CompiledPolicy and hot-reloads it from the rules file.
+
+    A reload compiles the new rules completely before swapping the reference,
+    so readers always see either the old or the new policy, never a mix.
+    If the file is missing the built-in POLICY_RULES are used; if it is
+    invalid, the previous policy stays active.
+    """
+
+    def __init__(self, path: str, reload_interval: float) -> None:
+        self.path = path
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._mtime_ns: Optional[int] = None
+        self._next_check = 0.0
+        self._policy = CompiledPolicy(POLICY_RULES)
+        self.reload(force=True)
+
+    def current(self) -> CompiledPolicy:
+        if time.monotonic() >= self._next_check:
+            self.reload()
+        return self._policy
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Re-read the rules file if it changed (or always, with force=True).
+        Returns True when a new policy was swapped in.
+        """
+
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_interval
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            if not force and mtime_ns == self._mtime_ns:
+                return False
+
+            if mtime_ns is None:
+                rules = POLICY_RULES
+            else:
+                try:
+                    rules = load_policy_rules(self.path)
+                except Exception as e:
+                    print(f"[PolicyEngine] Could not load rules from {self.path}: {e}")
+                    self._mtime_ns = mtime_ns
+                    return False
+
+            self._policy = CompiledPolicy(rules)
+            self._mtime_ns = mtime_ns
+            return True
+
+
+_store: Optional[PolicyStore] = None
+_store_lock = threading.Lock()
+
+
+def get_policy_store() -> PolicyStore:
+    global _store
+    if _store is not None:
+        return _store
+    with _store_lock:
+        if _store is None:
+            settings = get_settings()
+            _store = PolicyStore(
+                path=settings.policy_rules_path or DEFAULT_RULES_PATH,
+                reload_interval=settings.policy_reload_interval_seconds,
+            )
+        return _store
+
 
 def decide_action_for_location(location: DataLocation) -> Tuple[ActionType, str]:
     """
@@ -65,17 +237,27 @@ def decide_action_for_location(location: DataLocation) -> Tuple[ActionType, str]
       (action_type, policy_reason)
     """
 
-    for rule in POLICY_RULES:
-        # Check source_name match (if rule specifies it)
-        if rule.source_name is not None and rule.source_name != location.source_name:
-            continue
+    policy = get_policy_store().current()
+    return policy.decide(location.source_name, location.location_type)
+
 
-        # Check location_type match (if rule specifies it)
-        if rule.location_type is not None and rule.location_type != location.location_type:
-            continue
+def decide_actions(locations: Sequence[DataLocation]) -> List[Tuple[ActionType, str]]:
+    """
+    Batch variant of decide_action_for_location.
+
+    Locations are grouped by (source_name, location_type) and the policy is
+    consulted once per group; the whole batch is decided against a single
+    policy snapshot. Returns decisions in the same order as `locations`.
+    """
 
-        # Rule matches
-        return rule.action, rule.description or "Matched policy rule."
+    policy = get_policy_store().current()
+    by_key: Dict[PolicyKey, Tuple[ActionType, str]] = {}
 
-    # Default policy: MASK
-    return ActionType.MASK, "Default policy: mask PII when no specific rule is defined."
+    decisions: List[Tuple[ActionType, str]] = []
+    for loc in locations:
+        key = (loc.source_name, loc.location_type)
+        decision = by_key.get(key)
+        if decision is None:
+            decision = by_key[key] = policy.decide(*key)
+        decisions.append(decision)
+    return decisions
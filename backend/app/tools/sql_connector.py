@@ -1,12 +1,21 @@
 # backend/app/tools/sql_connector.py
 
-from typing import Optional, List
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional
 
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
+from app.core.metrics import (
+    CONNECTOR_CALLS,
+    CONNECTOR_DURATION,
+    CONNECTOR_IN_FLIGHT,
+    instrumented,
+)
 from app.db.models.user_profile import UserProfile
-from app.db.models.customer_order import CustomerOrder
-from app.agents.state import DataLocation, LocationType
+from app.agents.state import DataLocation, LocationType, UserIdentifiers, pii_fields_tuple
+from app.tools.pii_catalog import PII_CATALOG, PiiTable
 
 
 def get_user_profile_by_identifiers(
@@ -34,36 +43,191 @@ def get_user_profile_by_identifiers(
     return query.first()
 
 
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="sql")
 def search_user_pii_in_sql(
     db: Session,
     email: Optional[str],
     customer_id: Optional[str],
+    strict: bool = False,
 ) -> List[DataLocation]:
     """
     Discovery helper:
-    - Find all rows in CustomerOrder that belong to this user
-      by email or customer_id.
+    - Find all rows in the PII catalog tables (app/tools/pii_catalog.py)
+      that belong to this user by email and/or customer_id.
     - Return them as DataLocation objects.
+
+    A table that cannot be queried is skipped (logged); with strict=True
+    the error is raised instead, so discovery reports the connector as
+    failed rather than as a complete search.
     """
 
-    query = db.query(CustomerOrder)
+    if not email and not customer_id:
+        return []
 
-    if email:
-        query = query.filter(CustomerOrder.user_email == email)
-    if customer_id:
-        query = query.filter(CustomerOrder.customer_id == customer_id)
-
-    rows = query.all()
-    locations: List[DataLocation] = []
-
-    for row in rows:
-        loc = DataLocation(
-            source_name="CustomerDB",
-            location_type=LocationType.SQL_ROW,
-            table_name="customer_orders",
-            primary_key=str(row.id),
-            pii_fields=["user_email", "customer_id", "shipping_address", "notes"],
+    key = "user"
+    results = _search_users_pii_in_sql_batch(
+        db, {key: UserIdentifiers(email=email, customer_id=customer_id)}, strict=strict
+    )
+    return results[key]
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="sql_stream")
+def iter_user_pii_in_sql(
+    db: Session,
+    email: Optional[str],
+    customer_id: Optional[str],
+    batch_size: int,
+    catalog: Optional[List[PiiTable]] = None,
+) -> Iterator[List[DataLocation]]:
+    """
+    Streaming variant of search_user_pii_in_sql for the streaming pipeline:
+    yields the user's rows as lists of at most batch_size DataLocations,
+    table by table, while the primary keys are still being fetched
+    (yield_per). Same matching rule: by email (and customer_id, if given
+    and the table has one), else by customer_id. A table that cannot be
+    queried raises (like strict=True), so the search is not reported as
+    complete.
+
+    The session's cursor stays open between batches, so the generator must
+    be consumed (or closed) in the thread that owns `db`.
+    """
+
+    if not email and not customer_id:
+        return
+
+    settings = get_settings()
+    catalog = PII_CATALOG if catalog is None else catalog
+
+    for pii_table in catalog:
+        email_col_name = pii_table.identifier_columns.get("email")
+        cid_col_name = pii_table.identifier_columns.get("customer_id")
+
+        conditions = []
+        if email:
+            if not email_col_name:
+                continue
+            conditions.append(pii_table.col(email_col_name) == email)
+            if customer_id and cid_col_name:
+                conditions.append(pii_table.col(cid_col_name) == customer_id)
+        else:
+            if not cid_col_name:
+                continue
+            conditions.append(pii_table.col(cid_col_name) == customer_id)
+
+        pii_fields = pii_fields_tuple(pii_table.pii_columns)
+        stmt = (
+            select(pii_table.col(pii_table.primary_key))
+            .where(*conditions)
+            .execution_options(yield_per=min(settings.sql_yield_per, batch_size))
         )
-        locations.append(loc)
 
-    return locations
+        try:
+            for rows in db.execute(stmt).partitions(batch_size):
+                yield [
+                    DataLocation(
+                        source_name=pii_table.source_name,
+                        location_type=LocationType.SQL_ROW,
+                        table_name=pii_table.table_name,
+                        primary_key=str(row[0]),
+                        pii_fields=pii_fields,
+                    )
+                    for row in rows
+                ]
+        except SQLAlchemyError as e:
+            db.rollback()
+            print(f"[SQLConnector] Table {pii_table.table_name} failed: {e}")
+            raise
+
+
+@instrumented(CONNECTOR_DURATION, CONNECTOR_CALLS, CONNECTOR_IN_FLIGHT, connector="sql_batch")
+def search_users_pii_in_sql_batch(
+    db: Session,
+    identities: Mapping[Hashable, UserIdentifiers],
+    catalog: Optional[List[PiiTable]] = None,
+    strict: bool = False,
+) -> Dict[Hashable, List[DataLocation]]:
+    """
+    Batch SQL discovery driven by the PII catalog.
+
+    For each catalog table we issue primary-key-only queries over the whole
+    batch: `WHERE <email column> IN (...)` for users with an email (their
+    customer_id, if given, must match too), and `WHERE <customer_id column>
+    IN (...)` for users with only a customer_id. Identifiers go in chunks
+    of settings.sql_in_chunk_size and rows are streamed with yield_per –
+    no ORM objects are materialized.
+
+    Returns key -> list of SQL_ROW DataLocations (every key is present).
+    strict: raise instead of skipping a table that cannot be queried.
+    """
+
+    return _search_users_pii_in_sql_batch(db, identities, catalog, strict=strict)
+
+
+def _search_users_pii_in_sql_batch(
+    db: Session,
+    identities: Mapping[Hashable, UserIdentifiers],
+    catalog: Optional[List[PiiTable]] = None,
+    strict: bool = False,
+) -> Dict[Hashable, List[DataLocation]]:
+    settings = get_settings()
+    catalog = PII_CATALOG if catalog is None else catalog
+    results: Dict[Hashable, List[DataLocation]] = {key: [] for key in identities}
+
+    by_email: Dict[str, List[Hashable]] = {}
+    by_customer_id: Dict[str, List[Hashable]] = {}
+    for key, ids in identities.items():
+        if ids.email:
+            by_email.setdefault(ids.email, []).append(key)
+        elif ids.customer_id:
+            by_customer_id.setdefault(ids.customer_id, []).append(key)
+
+    for pii_table in catalog:
+        email_col_name = pii_table.identifier_columns.get("email")
+        cid_col_name = pii_table.identifier_columns.get("customer_id")
+        pk = pii_table.col(pii_table.primary_key)
+        pii_fields = pii_fields_tuple(pii_table.pii_columns)
+
+        lookups = []
+        if email_col_name and by_email:
+            lookups.append((email_col_name, by_email))
+        if cid_col_name and by_customer_id:
+            lookups.append((cid_col_name, by_customer_id))
+
+        try:
+            for match_col_name, owners in lookups:
+                match_col = pii_table.col(match_col_name)
+                selected = [pk, match_col]
+                check_cid = match_col_name == email_col_name and cid_col_name is not None
+                if check_cid:
+                    selected.append(pii_table.col(cid_col_name))
+
+                values = list(owners)
+                for start in range(0, len(values), settings.sql_in_chunk_size):
+                    chunk = values[start : start + settings.sql_in_chunk_size]
+                    stmt = (
+                        select(*selected)
+                        .where(match_col.in_(chunk))
+                        .execution_options(yield_per=settings.sql_yield_per)
+                    )
+                    for row in db.execute(stmt):
+                        for key in owners.get(row[1], ()):
+                            wanted_cid = identities[key].customer_id
+                            if check_cid and wanted_cid and row[2] != wanted_cid:
+                                continue
+                            results[key].append(
+                                DataLocation(
+                                    source_name=pii_table.source_name,
+                                    location_type=LocationType.SQL_ROW,
+                                    table_name=pii_table.table_name,
+                                    primary_key=str(row[0]),
+                                    pii_fields=pii_fields,
+                                )
+                            )
+        except SQLAlchemyError as e:
+            # e.g. table not created in this database – skip it, keep the rest.
+            db.rollback()
+            print(f"[SQLConnector] Skipping table {pii_table.table_name}: {e}")
+            if strict:
+                raise
+
+    return results
@@ -0,0 +1,173 @@
+# backend/app/tools/sql_executor.py
+
+"""
+LIVE-mode execution of SQL DeletionActions.
+
+Actions are grouped by (table, action type) and applied set-based, one
+statement per chunk of primary keys instead of one ORM update per row:
+
+    MASK    UPDATE <table> SET <pii columns> = <catalog mask values>
+            WHERE <pk> IN (...)
+    DELETE  DELETE FROM <table> WHERE <pk> IN (...)
+
+Each chunk (settings.sql_executor_chunk_size keys) is its own transaction,
+so locks are held for one chunk at a time and a failing chunk does not undo
+the others. Where the database supports RETURNING, the affected keys are
+read back and every action gets its exact outcome (SUCCESS, or SKIPPED when
+its row was already gone); otherwise a chunk's outcome applies to all its
+actions. FLAG / NONE actions and non-SQL locations are left untouched.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.agents.state import ActionStatus, ActionType, DeletionAction, LocationType
+from app.tools.pii_catalog import PII_CATALOG, PiiTable
+
+EXECUTED_ACTIONS = (ActionType.MASK, ActionType.DELETE)
+
+
+@dataclass
+class SqlChunkResult:
+    table_name: str
+    action_type: str
+    chunk: int                 # 1-based, within its (table, action type) group
+    rows_requested: int
+    rows_affected: int
+    status: str                # "ok" / "failed"
+    duration: float
+    error: Optional[str] = None
+
+
+@dataclass
+class SqlExecutionReport:
+    chunks: List[SqlChunkResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_affected(self) -> int:
+        return sum(c.rows_affected for c in self.chunks)
+
+    @property
+    def failed_chunks(self) -> int:
+        return sum(1 for c in self.chunks if c.status != "ok")
+
+
+def _pk_value(primary_key: str) -> Any:
+    # DataLocation keeps keys as strings; compare integer keys as integers.
+    return int(primary_key) if primary_key.isdigit() else primary_key
+
+
+def _group_actions(
+    actions: Sequence[DeletionAction],
+) -> Dict[Tuple[str, ActionType], Dict[Any, List[DeletionAction]]]:
+    # (table, action type) -> primary key -> actions on that row
+    groups: Dict[Tuple[str, ActionType], Dict[Any, List[DeletionAction]]] = {}
+    for action in actions:
+        loc = action.location
+        if loc.location_type != LocationType.SQL_ROW or action.action_type not in EXECUTED_ACTIONS:
+            continue
+        if not loc.table_name or loc.primary_key is None:
+            action.status = ActionStatus.FAILED
+            action.add_outcome("LIVE: missing table name / primary key")
+            continue
+        by_pk = groups.setdefault((loc.table_name, action.action_type), {})
+        by_pk.setdefault(_pk_value(loc.primary_key), []).append(action)
+    return groups
+
+
+def _statement(pii_table: PiiTable, action_type: ActionType, chunk: List[Any], returning: bool):
+    pk = pii_table.col(pii_table.primary_key)
+    if action_type == ActionType.MASK:
+        stmt = update(pii_table.table).where(pk.in_(chunk)).values(pii_table.mask_assignments())
+    else:
+        stmt = delete(pii_table.table).where(pk.in_(chunk))
+    return stmt.returning(pk) if returning else stmt
+
+
+def execute_sql_actions(
+    db: Session,
+    actions: Sequence[DeletionAction],
+    chunk_size: Optional[int] = None,
+    catalog: Optional[List[PiiTable]] = None,
+) -> SqlExecutionReport:
+    """
+    Apply the SQL MASK / DELETE actions and record the outcome on each
+    action (status + a "LIVE: ..." note in outcome).
+
+    Commits after every chunk; `db` should not carry other pending work.
+    """
+
+    settings = get_settings()
+    chunk_size = chunk_size or settings.sql_executor_chunk_size
+    tables = {t.table_name: t for t in (PII_CATALOG if catalog is None else catalog)}
+    dialect = db.get_bind().dialect
+
+    report = SqlExecutionReport()
+    started = time.perf_counter()
+
+    for (table_name, action_type), by_pk in _group_actions(actions).items():
+        pii_table = tables.get(table_name)
+        if pii_table is None:
+            for row_actions in by_pk.values():
+                for action in row_actions:
+                    action.status = ActionStatus.FAILED
+                    action.add_outcome(f"LIVE: table '{table_name}' is not in the PII catalog")
+            continue
+
+        verb = "masked" if action_type == ActionType.MASK else "deleted"
+        returning = (
+            dialect.update_returning if action_type == ActionType.MASK else dialect.delete_returning
+        )
+        keys = list(by_pk)
+        total_chunks = (len(keys) + chunk_size - 1) // chunk_size
+
+        for n, start in enumerate(range(0, len(keys), chunk_size), 1):
+            chunk = keys[start : start + chunk_size]
+            chunk_started = time.perf_counter()
+            try:
+                result = db.execute(_statement(pii_table, action_type, chunk, returning))
+                affected = {row[0] for row in result} if returning else None
+                rows_affected = len(affected) if returning else max(result.rowcount, 0)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                report.chunks.append(
+                    SqlChunkResult(
+                        table_name, action_type.value, n, len(chunk), 0, "failed",
+                        time.perf_counter() - chunk_started, str(e),
+                    )
+                )
+                print(f"[SQLExecutor] {table_name} {action_type.value} chunk {n} failed: {e}")
+                for key in chunk:
+                    for action in by_pk[key]:
+                        action.status = ActionStatus.FAILED
+                        action.add_outcome(f"LIVE: chunk {n}/{total_chunks} failed: {e}")
+                continue
+
+            report.chunks.append(
+                SqlChunkResult(
+                    table_name, action_type.value, n, len(chunk), rows_affected, "ok",
+                    time.perf_counter() - chunk_started,
+                )
+            )
+            note = f"LIVE: {verb} in chunk {n}/{total_chunks}"
+            for key in chunk:
+                # Without RETURNING the chunk's outcome applies to every row.
+                found = affected is None or key in affected
+                for action in by_pk[key]:
+                    if found:
+                        action.status = ActionStatus.SUCCESS
+                        action.add_outcome(note)
+                    else:
+                        action.status = ActionStatus.SKIPPED
+                        action.add_outcome(f"LIVE: row not found (chunk {n}/{total_chunks})")
+
+    report.elapsed = time.perf_counter() - started
+    return report
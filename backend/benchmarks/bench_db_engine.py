@@ -0,0 +1,101 @@
+# backend/benchmarks/bench_db_engine.py
+
+"""
+Request-path throughput with the bare engine vs the tuned engine profile.
+
+Each simulated client repeatedly does what a request + its pipeline run do
+against data_rights_requests: INSERT + commit, SELECT by id, UPDATE status
++ commit. Runs against a fresh SQLite file per profile / concurrency level.
+
+    python benchmarks/bench_db_engine.py --clients 1 8 32 --ops 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings
+from app.db.base_class import Base
+from app.db.engine_profiles import create_tuned_engine
+from app.models.request import DataRightsRequest
+
+
+def run_client(Session, ops, errors, lock):
+    for i in range(ops):
+        db = Session()
+        try:
+            obj = DataRightsRequest(
+                email=f"bench{i}@example.com",
+                request_type="deletion",
+                status="PENDING",
+                mode="SIMULATION",
+            )
+            db.add(obj)
+            db.commit()
+
+            db.get(DataRightsRequest, obj.id)
+
+            obj.status = "COMPLETED"
+            db.commit()
+        except Exception:
+            db.rollback()
+            with lock:
+                errors[0] += 1
+        finally:
+            db.close()
+
+
+def bench(profile, clients, ops):
+    settings = Settings(db_tuning_enabled=(profile == "tuned"))
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_tuned_engine(url, settings)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        errors = [0]
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=run_client, args=(Session, ops, errors, lock))
+            for _ in range(clients)
+        ]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+
+    total = clients * ops
+    return total, elapsed, errors[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--ops", type=int, default=200, help="request cycles per client")
+    args = parser.parse_args()
+
+    print(f"{'profile':<8} {'clients':>7} {'cycles':>8} {'seconds':>9} {'cycles/s':>10} {'errors':>7}")
+    for clients in args.clients:
+        for profile in ("default", "tuned"):
+            total, elapsed, errors = bench(profile, clients, args.ops)
+            print(
+                f"{profile:<8} {clients:>7} {total:>8} {elapsed:>9.2f} "
+                f"{(total - errors) / elapsed:>10.0f} {errors:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
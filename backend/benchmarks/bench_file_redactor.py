@@ -0,0 +1,118 @@
+# backend/benchmarks/bench_file_redactor.py
+
+"""
+Streaming file redaction: throughput and memory on one large export and on
+many small files redacted in parallel.
+
+Peak memory is the process high-water mark (ru_maxrss) before and after,
+so it shows whether redacting grows with file size.
+
+    python benchmarks/bench_file_redactor.py --size-mb 1024 --files 2000
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from app.agents.state import (
+    ActionStatus,
+    ActionType,
+    DataLocation,
+    DeletionAction,
+    LocationType,
+    UserIdentifiers,
+)
+from app.tools.file_redactor import execute_file_actions, redact_file
+
+EMAIL = "erase.me@example.com"
+CUSTOMER_ID = "CUST-ERASE-001"
+
+LINE_OTHER = b'{"email": "someone.else@example.com", "customer_id": "CUST-0000042", "note": "n/a"}\n'
+LINE_USER = f'{{"email": "{EMAIL}", "customer_id": "{CUSTOMER_ID}", "note": "n/a"}}\n'.encode()
+
+
+def max_rss_mb():
+    # Linux reports KiB, macOS bytes.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def write_export(path, size_mb, user_every=100):
+    chunk = (LINE_OTHER * (user_every - 1) + LINE_USER) * 1000
+    target = size_mb * 1024 * 1024
+    with open(path, "wb") as f:
+        written = 0
+        while written < target:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def bench_large(workdir, size_mb):
+    path = os.path.join(workdir, "export.json")
+    size = write_export(path, size_mb)
+    rss_before = max_rss_mb()
+
+    started = time.perf_counter()
+    result = redact_file(path, [EMAIL.encode(), CUSTOMER_ID.encode()])
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"one {size / 1024 / 1024:,.0f} MiB file: {result.status}, "
+        f"{result.replacements:,} replacements in {elapsed:.2f} s "
+        f"({size / 1024 / 1024 / elapsed:,.0f} MiB/s); "
+        f"max RSS {rss_before:.0f} -> {max_rss_mb():.0f} MiB"
+    )
+    os.remove(path)
+
+
+def bench_many(workdir, n_files):
+    folder = os.path.join(workdir, "lake")
+    os.makedirs(folder)
+    actions = []
+    for i in range(n_files):
+        path = os.path.join(folder, f"file-{i:06d}.json")
+        with open(path, "wb") as f:
+            f.write(LINE_OTHER * 50 + LINE_USER + LINE_OTHER * 50)
+        actions.append(
+            DeletionAction(
+                location=DataLocation(
+                    source_name="ADLS",
+                    location_type=LocationType.FILE,
+                    file_path=path,
+                    pii_fields=["email", "customer_id"],
+                ),
+                action_type=ActionType.MASK,
+                status=ActionStatus.SUCCESS,
+            )
+        )
+
+    report = execute_file_actions(actions, UserIdentifiers(email=EMAIL, customer_id=CUSTOMER_ID))
+    ok = sum(1 for a in actions if a.status == ActionStatus.SUCCESS)
+    print(
+        f"{n_files:,} small files: {ok:,} redacted, {report.failed} failed in "
+        f"{report.elapsed:.2f} s ({n_files / report.elapsed:,.0f} files/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--files", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        bench_large(workdir, args.size_mb)
+        bench_many(workdir, args.files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# backend/benchmarks/bench_mongo_executor.py
+
+"""
+LIVE Mongo execution throughput: unordered bulk_write batches vs one
+delete_one / update_one round trip per document.
+
+Runs against mongomock by default, or a real server with --mongo-uri
+(a scratch database is created and dropped).
+
+    python benchmarks/bench_mongo_executor.py --docs 1000 10000 --batch-sizes 500 1000
+    python benchmarks/bench_mongo_executor.py --mongo-uri mongodb://localhost:27017
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+import mongomock
+from pymongo import MongoClient
+
+from app.agents.state import ActionStatus, ActionType, DataLocation, DeletionAction, LocationType
+from app.tools.mongo_executor import execute_mongo_actions
+
+PII_FIELDS = ["email", "customer_id", "payload"]
+
+
+def mongomock_compat():
+    """
+    mongomock 4.3's bulk builder predates the `sort` argument newer pymongo
+    UpdateOne passes; accept and ignore it so bulk updates run on mongomock.
+    """
+    from mongomock.collection import BulkOperationBuilder
+
+    add_update = BulkOperationBuilder.add_update
+    if getattr(add_update, "_accepts_sort", False):
+        return
+
+    def patched(self, *args, sort=None, **kwargs):
+        return add_update(self, *args, **kwargs)
+
+    patched._accepts_sort = True
+    BulkOperationBuilder.add_update = patched
+
+
+def seed(collection, n):
+    collection.delete_many({})
+    ids = collection.insert_many(
+        [
+            {
+                "email": "erase.me@example.com",
+                "customer_id": "CUST-ERASE",
+                "payload": {"event": "checkout", "address": f"{i} Main Street"},
+            }
+            for i in range(n)
+        ]
+    ).inserted_ids
+    return [str(i) for i in ids]
+
+
+def make_actions(doc_ids, action_type):
+    return [
+        DeletionAction(
+            location=DataLocation(
+                source_name="MongoEvents",
+                location_type=LocationType.MONGO_DOC,
+                collection_name="events",
+                document_id=doc_id,
+                pii_fields=list(PII_FIELDS),
+            ),
+            action_type=action_type,
+            status=ActionStatus.SUCCESS,
+        )
+        for doc_id in doc_ids
+    ]
+
+
+def one_by_one(database, actions):
+    """The naive approach: one round trip per document."""
+    from bson import ObjectId
+
+    collection = database["events"]
+    for action in actions:
+        doc_id = ObjectId(action.location.document_id)
+        if action.action_type == ActionType.DELETE:
+            collection.delete_one({"_id": doc_id})
+        else:
+            collection.update_one(
+                {"_id": doc_id},
+                {
+                    "$set": {
+                        "email": f"redacted-{doc_id}@redacted.invalid",
+                        "customer_id": None,
+                        "payload": None,
+                    }
+                },
+            )
+
+
+def run_variant(database, label, n, action_type, runner):
+    doc_ids = seed(database["events"], n)
+    actions = make_actions(doc_ids, action_type)
+
+    started = time.perf_counter()
+    runner(database, actions)
+    elapsed = time.perf_counter() - started
+
+    left = database["events"].count_documents({"email": "erase.me@example.com"})
+    ok = sum(1 for a in actions if a.status == ActionStatus.SUCCESS)
+    print(
+        f"{label:<30} {action_type.value:<7} {elapsed:8.2f} s  "
+        f"{n / elapsed:12,.0f} docs/s  success={ok:,} pii_left={left:,}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, nargs="+", default=[1000])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000])
+    parser.add_argument("--mongo-uri", default=None, help="real server instead of mongomock")
+    args = parser.parse_args()
+
+    if args.mongo_uri:
+        client = MongoClient(args.mongo_uri)
+        database = client["regent_bench_executor"]
+    else:
+        mongomock_compat()
+        client = mongomock.MongoClient()
+        database = client["regent"]
+
+    try:
+        for n in args.docs:
+            print(f"\n{n:,} documents ({'server' if args.mongo_uri else 'mongomock'})")
+            for action_type in (ActionType.MASK, ActionType.DELETE):
+                run_variant(database, "one round trip per document", n, action_type, one_by_one)
+                for batch_size in args.batch_sizes:
+                    run_variant(
+                        database,
+                        f"bulk_write, batch={batch_size}",
+                        n,
+                        action_type,
+                        lambda db, actions: execute_mongo_actions(
+                            actions, database=db, batch_size=batch_size
+                        ),
+                    )
+    finally:
+        if args.mongo_uri:
+            client.drop_database(database.name)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# backend/benchmarks/bench_sql_executor.py
+
+"""
+LIVE SQL execution throughput: set-based chunked executor vs a row-by-row
+ORM update per DataLocation.
+
+Every variant runs against its own copy of a generated SQLite database in
+which all --rows customer_orders rows belong to the user being erased.
+
+    python benchmarks/bench_sql_executor.py --rows 10000 1000000 --chunk-sizes 500 1000 5000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings
+from app.agents.state import ActionStatus, ActionType, DataLocation, DeletionAction, LocationType
+from app.db.base import Base
+from app.db.engine_profiles import create_tuned_engine
+from app.db.models import CustomerOrder
+from app.tools.sql_executor import execute_sql_actions
+
+EMAIL = "erase.me@example.com"
+INSERT_BATCH = 50_000
+
+
+def build_database(path, rows):
+    engine = create_tuned_engine(f"sqlite:///{path}", Settings())
+    Base.metadata.create_all(engine)
+    created = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        for start in range(0, rows, INSERT_BATCH):
+            conn.execute(
+                insert(CustomerOrder.__table__),
+                [
+                    {
+                        "id": i + 1,
+                        "user_email": EMAIL,
+                        "customer_id": "CUST-ERASE",
+                        "order_number": f"ORD{i:08d}",
+                        "shipping_address": f"{i} Main Street",
+                        "notes": "leave at the door",
+                        "created_at": created,
+                    }
+                    for i in range(start, min(start + INSERT_BATCH, rows))
+                ],
+            )
+    engine.dispose()
+
+
+def make_actions(rows, action_type):
+    return [
+        DeletionAction(
+            location=DataLocation(
+                source_name="CustomerDB",
+                location_type=LocationType.SQL_ROW,
+                table_name="customer_orders",
+                primary_key=str(i + 1),
+                pii_fields=["user_email", "customer_id", "shipping_address", "notes"],
+            ),
+            action_type=action_type,
+            status=ActionStatus.SUCCESS,
+        )
+        for i in range(rows)
+    ]
+
+
+def row_by_row(db, actions):
+    """The naive approach: load, modify and flush one ORM object per action."""
+    for action in actions:
+        obj = db.get(CustomerOrder, int(action.location.primary_key))
+        if action.action_type == ActionType.DELETE:
+            db.delete(obj)
+        else:
+            obj.user_email = f"redacted-{obj.id}@redacted.invalid"
+            obj.customer_id = obj.shipping_address = obj.notes = None
+        db.flush()
+    db.commit()
+
+
+def remaining_pii(db):
+    return db.execute(
+        select(func.count()).select_from(CustomerOrder).where(CustomerOrder.user_email == EMAIL)
+    ).scalar()
+
+
+def run_variant(template, workdir, label, rows, action_type, runner):
+    path = os.path.join(workdir, "run.db")
+    shutil.copyfile(template, path)
+    engine = create_tuned_engine(f"sqlite:///{path}", Settings())
+    Session = sessionmaker(bind=engine)
+    actions = make_actions(rows, action_type)
+
+    db = Session()
+    try:
+        started = time.perf_counter()
+        runner(db, actions)
+        elapsed = time.perf_counter() - started
+        left = remaining_pii(db)
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+
+    ok = sum(1 for a in actions if a.status == ActionStatus.SUCCESS)
+    print(
+        f"{label:<34} {action_type.value:<7} {elapsed:9.2f} s  "
+        f"{rows / elapsed:12,.0f} rows/s  success={ok:,} pii_left={left:,}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument(
+        "--baseline-max",
+        type=int,
+        default=10_000,
+        help="skip the row-by-row baseline above this many rows",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            template = os.path.join(workdir, f"template-{rows}.db")
+            started = time.perf_counter()
+            build_database(template, rows)
+            print(f"\n{rows:,} rows (fixture built in {time.perf_counter() - started:.1f} s)")
+
+            for action_type in (ActionType.MASK, ActionType.DELETE):
+                if rows <= args.baseline_max:
+                    run_variant(template, workdir, "row-by-row ORM", rows, action_type, row_by_row)
+                for chunk_size in args.chunk_sizes:
+                    run_variant(
+                        template,
+                        workdir,
+                        f"set-based executor, chunk={chunk_size}",
+                        rows,
+                        action_type,
+                        lambda db, actions: execute_sql_actions(db, actions, chunk_size=chunk_size),
+                    )
+            os.remove(template)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# backend/benchmarks/bench_state_memory.py
+
+"""
+Memory per discovery location / deletion action: the previous plain
+dataclasses (own pii_fields list, own name strings, eager details string)
+vs the slotted records in app/agents/state.py.
+
+Locations are built the way they arrive from a driver or a decoded
+payload: every record gets freshly allocated strings and lists.
+
+    python benchmarks/bench_state_memory.py --locations 500000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+from app.agents.deletion_agent import run_deletion_agent
+from app.agents.state import (
+    ActionStatus,
+    ActionType,
+    DataLocation,
+    LocationType,
+    RegentState,
+)
+from app.tools.policy_engine import decide_actions
+
+
+@dataclass
+class LegacyDataLocation:
+    source_name: str
+    location_type: LocationType
+    table_name: Optional[str] = None
+    primary_key: Optional[str] = None
+    collection_name: Optional[str] = None
+    document_id: Optional[str] = None
+    file_path: Optional[str] = None
+    byte_offsets: List[int] = field(default_factory=list)
+    line_numbers: List[int] = field(default_factory=list)
+    pii_fields: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LegacyDeletionAction:
+    location: LegacyDataLocation
+    action_type: ActionType
+    status: ActionStatus
+    details: Optional[str] = None
+
+
+def fresh(s):
+    # A new str object with the same value, as a driver would return.
+    return "".join(list(s))
+
+
+def make_locations(cls, n):
+    locations = []
+    for i in range(n):
+        if i % 2 == 0:
+            locations.append(
+                cls(
+                    source_name=fresh("CustomerDB"),
+                    location_type=LocationType.SQL_ROW,
+                    table_name=fresh("customer_orders"),
+                    primary_key=str(i),
+                    pii_fields=[fresh(f) for f in ("user_email", "customer_id", "shipping_address", "notes")],
+                )
+            )
+        else:
+            locations.append(
+                cls(
+                    source_name=fresh("MongoEvents"),
+                    location_type=LocationType.MONGO_DOC,
+                    collection_name=fresh("events"),
+                    document_id=f"{i:024x}",
+                    pii_fields=[fresh(f) for f in ("email", "customer_id", "payload")],
+                )
+            )
+    return locations
+
+
+def legacy_deletion_agent(locations):
+    """The previous run_deletion_agent body: eager details per action."""
+    actions = []
+    for loc, (action_type, policy_reason) in zip(locations, decide_actions(locations)):
+        if loc.location_type == LocationType.SQL_ROW:
+            target_desc = f"SQL table '{loc.table_name}', primary_key={loc.primary_key}"
+        else:
+            target_desc = f"Mongo collection '{loc.collection_name}', document_id={loc.document_id}"
+        details = (
+            f"Policy decision: {action_type.value.upper()} "
+            f"(reason: {policy_reason}). "
+            f"Target: source={loc.source_name}, {target_desc}, pii_fields={loc.pii_fields}"
+        )
+        actions.append(LegacyDeletionAction(loc, action_type, ActionStatus.SUCCESS, details))
+    return actions
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def report(label, n, nbytes, elapsed):
+    print(f"{label:<34} {nbytes / n:8.0f} B/location  {nbytes / 1024 / 1024:9.1f} MiB  {elapsed:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--locations", type=int, default=500_000)
+    args = parser.parse_args()
+    n = args.locations
+    print(f"{n:,} locations (half SQL rows, half Mongo documents)")
+
+    legacy, legacy_bytes, t = measure(lambda: make_locations(LegacyDataLocation, n))
+    report("legacy locations", n, legacy_bytes, t)
+    legacy_actions, legacy_action_bytes, t = measure(lambda: legacy_deletion_agent(legacy))
+    report("legacy actions (eager details)", n, legacy_action_bytes, t)
+    del legacy, legacy_actions
+
+    compact, compact_bytes, t = measure(lambda: make_locations(DataLocation, n))
+    report("slotted locations", n, compact_bytes, t)
+    state, compact_action_bytes, t = measure(
+        lambda: run_deletion_agent(RegentState(data_map=compact))
+    )
+    report("slotted actions (lazy details)", n, compact_action_bytes, t)
+
+    before = legacy_bytes + legacy_action_bytes
+    after = compact_bytes + compact_action_bytes
+    print(
+        f"\nlocation + action: {before / n:.0f} -> {after / n:.0f} B "
+        f"({before / after:.1f}x smaller); "
+        f"details still render: {state.deletion_actions[-1].details[:60]}..."
+    )
+
+
+if __name__ == "__main__":
+    main()
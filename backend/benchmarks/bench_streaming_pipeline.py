@@ -0,0 +1,180 @@
+# backend/benchmarks/bench_streaming_pipeline.py
+
+"""
+Peak memory of discovery -> policy -> persisted actions for one user with a
+large footprint: the materialized path (run_discovery collects every
+location, every action is built, then all are stored) vs the streaming
+pipeline (stream_discovery -> iter_deletion_actions -> RequestLogWriter,
+batch by batch).
+
+Uses a temp SQLite database (customer_orders rows + request_actions) and
+mongomock for Mongo. Peak memory is the tracemalloc high-water mark of the
+run itself, not of the fixtures.
+
+    python benchmarks/bench_streaming_pipeline.py --rows 200000 --docs 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import closing
+from datetime import datetime
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+import mongomock
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.agents.deletion_agent import iter_deletion_actions, run_deletion_agent
+from app.agents.state import RegentState
+from app.db.base import Base
+from app.db.base_class import Base as RequestBase
+from app.db.engine_profiles import create_tuned_engine
+from app.db.models import CustomerOrder
+from app.models.request_log import RequestAction
+from app.services.request_log_store import RequestLogWriter
+from app.tools import mongo_connector
+from app.tools.discovery_executor import (
+    DiscoveryConnector,
+    DiscoveryReport,
+    run_discovery,
+    stream_discovery,
+)
+from app.tools.mongo_connector import iter_user_pii_in_mongo, search_user_pii_in_mongo
+from app.tools.sql_connector import iter_user_pii_in_sql, search_user_pii_in_sql
+
+EMAIL = "bench.user@example.com"
+CUSTOMER_ID = "CUSTBENCH001"
+
+settings = get_settings()
+
+
+def seed(workdir, rows, docs):
+    # The app's engine profile (WAL): discovery reads while actions are stored.
+    engine = create_tuned_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}", settings)
+    Base.metadata.create_all(engine)
+    RequestBase.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(CustomerOrder.__table__),
+            [
+                {
+                    "user_email": EMAIL,
+                    "customer_id": CUSTOMER_ID,
+                    "order_number": f"ORD{i:07d}",
+                    "shipping_address": f"{i} Main Street",
+                    "notes": "leave at the door",
+                    "created_at": datetime(2024, 1, 1),
+                }
+                for i in range(rows)
+            ],
+        )
+
+    client = mongomock.MongoClient()
+    client[settings.MONGO_DB_NAME]["events"].insert_many(
+        [{"email": EMAIL, "customer_id": CUSTOMER_ID, "payload": {"n": i}} for i in range(docs)]
+    )
+    mongo_connector._client = client
+    return sessionmaker(bind=engine)
+
+
+def connectors(Session):
+    def search_sql(email, customer_id):
+        db = Session()
+        try:
+            return search_user_pii_in_sql(db, email, customer_id)
+        finally:
+            db.close()
+
+    def stream_sql(email, customer_id, batch_size):
+        db = Session()
+        try:
+            yield from iter_user_pii_in_sql(db, email, customer_id, batch_size)
+        finally:
+            db.close()
+
+    return [
+        DiscoveryConnector(name="sql", search=search_sql, stream=stream_sql, timeout=600),
+        DiscoveryConnector(
+            name="mongo", search=search_user_pii_in_mongo, stream=iter_user_pii_in_mongo, timeout=600
+        ),
+    ]
+
+
+def materialized(Session, request_id):
+    report = run_discovery(EMAIL, CUSTOMER_ID, connectors=connectors(Session))
+    state = run_deletion_agent(RegentState(data_map=report.locations))
+
+    db = Session()
+    try:
+        writer = RequestLogWriter(db, request_id, batch_size=settings.request_log_batch_size)
+        writer.add_actions(state.deletion_actions)
+        writer.flush()
+        db.commit()
+    finally:
+        db.close()
+    return len(state.deletion_actions)
+
+
+def streaming(Session, request_id, batch_size):
+    db = Session()
+    stored = 0
+    try:
+        writer = RequestLogWriter(db, request_id, batch_size=settings.request_log_batch_size)
+        batches = stream_discovery(
+            EMAIL, CUSTOMER_ID, DiscoveryReport(), batch_size=batch_size,
+            connectors=connectors(Session),
+        )
+        with closing(batches):
+            for actions in iter_deletion_actions(batches):
+                writer.add_actions(actions)
+                writer.flush()
+                db.commit()
+                stored += len(actions)
+    finally:
+        db.close()
+    return stored
+
+
+def measure(label, run):
+    tracemalloc.start()
+    started = time.perf_counter()
+    n = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {n:>9,} actions  {elapsed:7.2f} s  peak {peak / 1024 / 1024:8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        Session = seed(workdir, args.rows, args.docs)
+        print(f"one user with {args.rows:,} SQL rows and {args.docs:,} Mongo documents")
+
+        measure("materialized", lambda: materialized(Session, 1))
+        for i, batch_size in enumerate(args.batch_sizes, start=2):
+            measure(f"streaming, batch={batch_size}", lambda: streaming(Session, i, batch_size))
+
+        db = Session()
+        try:
+            print(f"request_actions rows: {db.query(RequestAction).count():,}")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
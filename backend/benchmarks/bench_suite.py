@@ -0,0 +1,506 @@
+# backend/benchmarks/bench_suite.py
+
+"""
+Benchmark suite for the pipeline pieces that scale with data volume.
+
+Every case runs at several scales against generated local fixtures (a temp
+SQLite database, a temp lake folder, mongomock for Mongo), reports wall time,
+throughput and tracemalloc peak memory, and writes the results as JSON so
+runs can be compared over time:
+
+    pip install -r requirements-dev.txt   # adds mongomock
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --cases "adls.*" --max-scale 10000
+    python benchmarks/bench_suite.py --compare benchmarks/results/<older>.json
+
+Scales are locations / rows / documents for most cases, lake files for the
+adls.* cases and complete pipeline runs for graph.run_regent_flow. Timings
+are the best of --repeat runs; peak memory comes from one extra run under
+tracemalloc (allocations made by the case itself, not its fixtures).
+
+Focused, single-topic benchmarks live next to this one:
+bench_policy_engine.py (compiled policy vs linear scan) and
+bench_db_engine.py (engine profile under concurrent clients).
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Ensure "app" package is importable when running this as a script
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
+
+import mongomock
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.agents.deletion_agent import run_deletion_agent
+from app.agents.graph import RegentState as FlowState, run_regent_flow
+from app.agents.state import DataLocation, LocationType, RegentState
+from app.db.base import Base
+from app.db.models import CustomerOrder, UserProfile
+from app.services.agents.audit_agent import AuditAgent
+from app.tools import adls_index, mongo_connector
+from app.tools.adls_connector import search_user_pii_in_adls
+from app.tools.mongo_connector import search_user_pii_in_mongo
+from app.tools.policy_engine import decide_action_for_location, decide_actions
+from app.tools.sql_connector import search_user_pii_in_sql
+
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+
+LOCATION_SCALES = (10, 1_000, 100_000)
+LAKE_SCALES = (100, 10_000, 100_000)
+
+TARGET_EMAIL = "bench.user@example.com"
+TARGET_CUSTOMER_ID = "CUSTBENCH001"
+
+# Share of lake files that mention the target user.
+LAKE_HIT_RATIO = 0.01
+LAKE_FILES_PER_DIR = 1000
+
+settings = get_settings()
+
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+def make_locations(n: int) -> List[DataLocation]:
+    """
+    A realistic mix of SQL rows, Mongo documents and lake files.
+    """
+
+    sources = [
+        ("CustomerDB", LocationType.SQL_ROW),
+        ("MongoEvents", LocationType.MONGO_DOC),
+        ("ADLS", LocationType.FILE),
+    ]
+    locations = []
+    for i in range(n):
+        source_name, location_type = sources[i % len(sources)]
+        if location_type == LocationType.SQL_ROW:
+            loc = DataLocation(
+                source_name=source_name,
+                location_type=location_type,
+                table_name="customer_orders",
+                primary_key=str(i),
+                pii_fields=["user_email", "customer_id", "shipping_address", "notes"],
+            )
+        elif location_type == LocationType.MONGO_DOC:
+            loc = DataLocation(
+                source_name=source_name,
+                location_type=location_type,
+                collection_name="events",
+                document_id=f"{i:024x}",
+                pii_fields=["email", "customer_id", "payload"],
+            )
+        else:
+            loc = DataLocation(
+                source_name=source_name,
+                location_type=location_type,
+                file_path=f"/lake/part-{i // LAKE_FILES_PER_DIR:04d}/file-{i:06d}.json",
+                pii_fields=["email"],
+                byte_offsets=[128],
+                line_numbers=[3],
+            )
+        locations.append(loc)
+    return locations
+
+
+def make_sql_fixture(workdir: str, n: int) -> sessionmaker:
+    """
+    n customer_orders rows for the target user among n rows for others.
+    """
+
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    Base.metadata.create_all(engine)
+
+    orders = []
+    for i in range(2 * n):
+        mine = i % 2 == 0
+        orders.append(
+            {
+                "user_email": TARGET_EMAIL if mine else f"user{i}@example.com",
+                "customer_id": TARGET_CUSTOMER_ID if mine else f"CUST{i:06d}",
+                "order_number": f"ORD{i:07d}",
+                "shipping_address": f"{i} Main Street",
+                "notes": "leave at the door",
+                "created_at": datetime(2024, 1, 1),
+            }
+        )
+
+    now = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(CustomerOrder.__table__), orders)
+        conn.execute(
+            insert(UserProfile.__table__),
+            [
+                {
+                    "email": TARGET_EMAIL,
+                    "customer_id": TARGET_CUSTOMER_ID,
+                    "phone": "+15550001234",
+                    "full_name": "Bench User",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+    return sessionmaker(bind=engine)
+
+
+def make_mongo_fixture(n: int) -> mongomock.MongoClient:
+    client = mongomock.MongoClient()
+    events = client[settings.MONGO_DB_NAME]["events"]
+    docs = []
+    for i in range(2 * n):
+        mine = i % 2 == 0
+        docs.append(
+            {
+                "email": TARGET_EMAIL if mine else f"user{i}@example.com",
+                "customer_id": TARGET_CUSTOMER_ID if mine else f"CUST{i:06d}",
+                "payload": {"event": "login", "ip": "10.0.0.1"},
+            }
+        )
+    events.insert_many(docs)
+    return client
+
+
+def make_lake(workdir: str, n_files: int, seed: int = 7) -> str:
+    """
+    n_files small .json/.txt files; LAKE_HIT_RATIO of them mention the
+    target user, the rest other users.
+    """
+
+    rng = random.Random(seed)
+    base = os.path.join(workdir, "lake")
+    hits = set(rng.sample(range(n_files), max(1, int(n_files * LAKE_HIT_RATIO))))
+    for i in range(n_files):
+        folder = os.path.join(base, f"part-{i // LAKE_FILES_PER_DIR:04d}")
+        if i % LAKE_FILES_PER_DIR == 0:
+            os.makedirs(folder, exist_ok=True)
+        if i in hits:
+            email, customer_id = TARGET_EMAIL, TARGET_CUSTOMER_ID
+        else:
+            email, customer_id = f"user{i}@example.com", f"CUST{i:06d}"
+        ext = "json" if i % 2 else "txt"
+        with open(os.path.join(folder, f"file-{i:06d}.{ext}"), "w") as f:
+            f.write(
+                f'{{"event": "checkout", "n": {i},\n'
+                f' "email": "{email}",\n'
+                f' "customer_id": "{customer_id}",\n'
+                f' "note": "{"x" * rng.randint(50, 400)}"}}\n'
+            )
+    return base
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+
+# (scale, workdir) -> zero-argument callable running the measured work
+# once and returning the number of items it processed.
+CaseSetup = Callable[[int, str], Callable[[], int]]
+
+
+@dataclass
+class Case:
+    name: str
+    unit: str
+    scales: Tuple[int, ...]
+    setup: CaseSetup
+
+
+def setup_decide_single(n: int, workdir: str) -> Callable[[], int]:
+    locations = make_locations(n)
+
+    def run() -> int:
+        for loc in locations:
+            decide_action_for_location(loc)
+        return n
+
+    return run
+
+
+def setup_decide_batch(n: int, workdir: str) -> Callable[[], int]:
+    locations = make_locations(n)
+    return lambda: len(decide_actions(locations))
+
+
+def setup_deletion_agent(n: int, workdir: str) -> Callable[[], int]:
+    locations = make_locations(n)
+
+    def run() -> int:
+        state = run_deletion_agent(RegentState(data_map=list(locations)))
+        return len(state.deletion_actions)
+
+    return run
+
+
+def setup_format_actions(n: int, workdir: str) -> Callable[[], int]:
+    actions = run_deletion_agent(RegentState(data_map=make_locations(n))).deletion_actions
+    agent = AuditAgent()
+
+    def run() -> int:
+        agent._format_actions(actions)
+        return n
+
+    return run
+
+
+def setup_sql_search(n: int, workdir: str) -> Callable[[], int]:
+    Session = make_sql_fixture(workdir, n)
+
+    def run() -> int:
+        db = Session()
+        try:
+            found = search_user_pii_in_sql(db, TARGET_EMAIL, TARGET_CUSTOMER_ID)
+        finally:
+            db.close()
+        assert len(found) == n + 1, f"expected {n + 1} rows, found {len(found)}"
+        return len(found)
+
+    return run
+
+
+def setup_mongo_search(n: int, workdir: str) -> Callable[[], int]:
+    mongo_connector._client = make_mongo_fixture(n)
+
+    def run() -> int:
+        found = search_user_pii_in_mongo(TARGET_EMAIL, TARGET_CUSTOMER_ID)
+        assert len(found) == n, f"expected {n} documents, found {len(found)}"
+        return len(found)
+
+    return run
+
+
+def _point_adls_at(lake: str, workdir: str, index_enabled: bool) -> None:
+    settings.adls_base_path = lake
+    settings.adls_index_enabled = index_enabled
+    settings.adls_index_path = os.path.join(workdir, "adls_index.db")
+    settings.adls_scan_mode = "stream"
+    adls_index._index = None
+
+
+def setup_adls_scan(n_files: int, workdir: str) -> Callable[[], int]:
+    lake = make_lake(workdir, n_files)
+    _point_adls_at(lake, workdir, index_enabled=False)
+
+    def run() -> int:
+        search_user_pii_in_adls(TARGET_EMAIL, TARGET_CUSTOMER_ID)
+        return n_files
+
+    return run
+
+
+def setup_adls_index_refresh(n_files: int, workdir: str) -> Callable[[], int]:
+    lake = make_lake(workdir, n_files)
+    _point_adls_at(lake, workdir, index_enabled=True)
+
+    def run() -> int:
+        # Full (re)build: what the first request after a cold start pays.
+        adls_index.get_adls_index().rebuild()
+        return n_files
+
+    return run
+
+
+def setup_adls_index_lookup(n_files: int, workdir: str) -> Callable[[], int]:
+    lake = make_lake(workdir, n_files)
+    _point_adls_at(lake, workdir, index_enabled=True)
+    adls_index.get_adls_index().refresh()
+
+    def run() -> int:
+        search_user_pii_in_adls(TARGET_EMAIL, TARGET_CUSTOMER_ID)
+        return n_files
+
+    return run
+
+
+def setup_regent_flow(n_runs: int, workdir: str) -> Callable[[], int]:
+    # The discovery step runs the real connectors: point Mongo and the lake
+    # at small local fixtures (SQL uses the app database).
+    mongo_connector._client = make_mongo_fixture(10)
+    lake = os.path.join(workdir, "lake")
+    os.makedirs(lake)
+    _point_adls_at(lake, workdir, index_enabled=False)
+
+    def run() -> int:
+        for i in range(n_runs):
+            run_regent_flow(
+                FlowState(
+                    request_id=i,
+                    email=f"user{i}@example.com",
+                    customer_id=f"CUST{i:06d}",
+                )
+            )
+        return n_runs
+
+    return run
+
+
+CASES: List[Case] = [
+    Case("policy.decide_action_for_location", "locations", LOCATION_SCALES, setup_decide_single),
+    Case("policy.decide_actions", "locations", LOCATION_SCALES, setup_decide_batch),
+    Case("deletion.run_deletion_agent", "locations", LOCATION_SCALES, setup_deletion_agent),
+    Case("audit.format_actions", "actions", LOCATION_SCALES, setup_format_actions),
+    Case("sql.search_user_pii_in_sql", "rows", LOCATION_SCALES, setup_sql_search),
+    Case("mongo.search_user_pii_in_mongo", "documents", LOCATION_SCALES, setup_mongo_search),
+    Case("adls.search_scan", "files", LAKE_SCALES, setup_adls_scan),
+    Case("adls.index_rebuild", "files", LAKE_SCALES, setup_adls_index_refresh),
+    Case("adls.search_indexed", "files", LAKE_SCALES, setup_adls_index_lookup),
+    Case("graph.run_regent_flow", "runs", LOCATION_SCALES, setup_regent_flow),
+]
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+def measure(run: Callable[[], int], repeat: int) -> Dict[str, Any]:
+    times = []
+    items = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items = run()
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "items": items,
+        "seconds_best": best,
+        "seconds_median": statistics.median(times),
+        "items_per_second": items / best if best > 0 else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_case(case: Case, scale: int, repeat: int) -> Dict[str, Any]:
+    workdir = tempfile.mkdtemp(prefix="regent-bench-")
+    try:
+        run = case.setup(scale, workdir)
+        result = measure(run, repeat)
+    finally:
+        mongo_connector._client = None
+        adls_index._index = None
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {"case": case.name, "unit": case.unit, "scale": scale, "repeat": repeat, **result}
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception:
+        return None
+    return out.stdout.strip() or None
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def print_result(r: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    line = (
+        f"{r['case']:<36} {r['scale']:>8} {r['unit']:<9} "
+        f"{r['seconds_best'] * 1000:10.1f} ms  "
+        f"{r['items_per_second'] or 0:14,.0f}/s  "
+        f"{format_bytes(r['peak_memory_bytes']):>10}"
+    )
+    if baseline:
+        ratio = baseline["seconds_best"] / r["seconds_best"] if r["seconds_best"] else 0
+        mem = r["peak_memory_bytes"] / baseline["peak_memory_bytes"] if baseline["peak_memory_bytes"] else 0
+        line += f"   speedup x{ratio:.2f}, memory x{mem:.2f}"
+    print(line)
+
+
+def load_baseline(path: Optional[str]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    if not path:
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {(r["case"], r["scale"]): r for r in data["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", nargs="*", default=["*"], help="glob patterns on case names")
+    parser.add_argument("--max-scale", type=int, default=None, help="skip larger scales")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="JSON results path")
+    parser.add_argument("--compare", default=None, help="earlier JSON results to compare with")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if any(fnmatch.fnmatch(c.name, p) for p in args.cases)]
+    if args.list:
+        for c in cases:
+            print(f"{c.name:<36} {c.unit:<9} scales={list(c.scales)}")
+        return
+
+    # Keep the suite self-contained: no LLM calls, quiet connectors.
+    settings.llm_enabled = False
+    baseline = load_baseline(args.compare)
+
+    results = []
+    for case in cases:
+        for scale in case.scales:
+            if args.max_scale is not None and scale > args.max_scale:
+                continue
+            result = run_case(case, scale, args.repeat)
+            results.append(result)
+            print_result(result, baseline.get((case.name, scale)))
+
+    started = datetime.now(timezone.utc)
+    report = {
+        "meta": {
+            "created_at": started.isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bench-{started.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
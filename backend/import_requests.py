@@ -0,0 +1,82 @@
+# backend/import_requests.py
+
+"""
+Streaming NDJSON importer for data-rights requests.
+
+Each input line is one CreateRequestPayload as JSON. Rows are inserted as
+PENDING in chunked multi-row transactions; running workers pick them up.
+
+    python import_requests.py partner_batch.jsonl
+    python import_requests.py - --results results.ndjson < partner_batch.jsonl
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure "app" package is importable when running this as a script
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.append(CURRENT_DIR)
+
+from app.core.config import get_settings
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.services.bulk_intake import import_request_lines, iter_file_lines
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+def main():
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="Import NDJSON data-rights requests.")
+    parser.add_argument("path", help="NDJSON file to import, or '-' for stdin")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.bulk_chunk_size,
+        help="rows per INSERT / transaction",
+    )
+    parser.add_argument(
+        "--results",
+        help="write per-line results (NDJSON) to this file instead of stdout",
+    )
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+
+    source = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    sink = open(args.results, "w", encoding="utf-8") if args.results else sys.stdout
+
+    db = SessionLocal()
+    created = failed = 0
+    started = time.perf_counter()
+    try:
+        chunks = iter(lambda: source.read(READ_BLOCK_SIZE), b"")
+        for result in import_request_lines(db, iter_file_lines(chunks), args.chunk_size):
+            if result.status == "created":
+                created += 1
+            else:
+                failed += 1
+            sink.write(result.model_dump_json(exclude_none=True) + "\n")
+    finally:
+        db.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - started
+    rate = created / elapsed if elapsed > 0 else 0.0
+    print(
+        f"✅ Imported {created} request(s), {failed} rejected, "
+        f"in {elapsed:.2f}s ({rate:.0f} req/s).",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# backend/run_worker.py
+
+"""
+Standalone worker process for the Regent pipeline.
+
+Run it next to the API (with JOB_WORKERS=0 on the API side if you want all
+pipeline work out of the uvicorn processes):
+
+    python run_worker.py --workers 4
+    python run_worker.py --drain      # process everything PENDING, then exit
+    python run_worker.py --drain --batch 1000
+                                      # ... discovering 1000 requests per pass
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure "app" package is importable when running this as a script
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.append(CURRENT_DIR)
+
+from app.core.config import get_settings
+from app.db.base_class import Base
+from app.db.session import engine
+from app.services.job_runner import JobRunner
+
+
+def main():
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="Run Regent pipeline workers.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(settings.job_workers, 1),
+        help="number of worker threads",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.job_poll_interval,
+        help="seconds between polls when idle",
+    )
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="process all PENDING requests on this thread and exit",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=0,
+        help="with --drain: discover this many requests at once "
+        "(one pass over the lake per batch)",
+    )
+    args = parser.parse_args()
+
+    # Make sure tables exist
+    Base.metadata.create_all(bind=engine)
+
+    runner = JobRunner(workers=args.workers, poll_interval=args.poll_interval)
+
+    if args.drain:
+        if args.batch > 0:
+            processed = runner.drain_batched(args.batch)
+        else:
+            processed = runner.drain()
+        print(f"✅ Processed {processed} request(s).")
+        return
+
+    runner.start(stale_after_seconds=settings.job_stale_after_seconds)
+    print(f"Regent worker running with {args.workers} thread(s). Ctrl+C to stop.")
+    try:
+        while runner.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("Stopping workers after their current request...")
+    finally:
+        runner.stop()
+
+
+if __name__ == "__main__":
+    main()
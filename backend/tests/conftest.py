@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+
+import os
+import sys
+
+# Ensure "app" package is importable however pytest is invoked
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
@@ -0,0 +1,86 @@
+# backend/tests/test_adls_batch.py
+
+import pytest
+
+from app.agents.state import UserIdentifiers
+from app.core.config import get_settings
+from app.tools import adls_connector, adls_index, file_scanner
+from app.tools.adls_connector import search_user_pii_in_adls, search_users_pii_in_adls_batch
+from app.tools.adls_index import AdlsIndex
+
+FILES = {
+    "exact.json": b'{"customer_id": "CUST10", "email": "a@x.com"}\n',
+    "longer_id.json": b'{"customer_id": "CUST100", "email": "b@x.com"}\n',
+    "prefixed.txt": b"from xa@x.com and XCUST10, ref CUST10_2\n",
+    "sentence.txt": b"Mail a@x.com. Ticket -CUST100-.\n",
+    "suffix.txt": b"a@x.com.au wrote about CUST1000\n",
+    "nested/deep.json": b'["CUST10"]',
+    "ignored.csv": b"CUST10,a@x.com\n",
+}
+
+USERS = {
+    1: UserIdentifiers(email="a@x.com", customer_id="CUST10"),
+    2: UserIdentifiers(email="b@x.com", customer_id="CUST100"),
+    3: UserIdentifiers(email="xa@x.com", customer_id=None),
+    4: UserIdentifiers(email=None, customer_id="CUST1000"),
+    5: UserIdentifiers(email="x.com", customer_id="CUST"),
+}
+
+
+@pytest.fixture
+def lake(tmp_path, monkeypatch):
+    base = tmp_path / "lake"
+    for name, data in FILES.items():
+        path = base / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "adls_base_path", str(base))
+    monkeypatch.setattr(settings, "adls_index_max_age_seconds", 0)
+    monkeypatch.setattr(adls_index, "_index", AdlsIndex(str(tmp_path / "index.db"), str(base)))
+    return base
+
+
+def _files(locations):
+    return sorted(loc.file_path for loc in locations)
+
+
+@pytest.mark.parametrize("scan_mode", ["stream", "mmap", "text"])
+@pytest.mark.parametrize("index_enabled", [False, True])
+def test_batch_matches_single_lookups(lake, monkeypatch, scan_mode, index_enabled):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "adls_scan_mode", scan_mode)
+    monkeypatch.setattr(settings, "adls_index_enabled", index_enabled)
+
+    batch = search_users_pii_in_adls_batch(USERS)
+
+    for key, ids in USERS.items():
+        single = search_user_pii_in_adls(ids.email, ids.customer_id)
+        assert _files(batch[key]) == _files(single), key
+        assert {loc.file_path: loc.pii_fields for loc in batch[key]} == {
+            loc.file_path: loc.pii_fields for loc in single
+        }
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 9, 1 << 20])
+def test_whole_tokens_across_blocks(lake, monkeypatch, block_size):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "adls_scan_mode", "stream")
+    monkeypatch.setattr(settings, "adls_index_enabled", False)
+    monkeypatch.setattr(adls_connector, "READ_BLOCK_SIZE", block_size)
+    monkeypatch.setattr(file_scanner, "READ_BLOCK_SIZE", block_size)
+
+    batch = search_users_pii_in_adls_batch(USERS)
+
+    assert _files(batch[1]) == [
+        str(lake / "exact.json"),
+        str(lake / "nested/deep.json"),
+        str(lake / "sentence.txt"),
+    ]
+    assert _files(batch[2]) == [str(lake / "longer_id.json"), str(lake / "sentence.txt")]
+    assert _files(batch[3]) == [str(lake / "prefixed.txt")]
+    assert _files(batch[4]) == [str(lake / "suffix.txt")]
+    assert batch[5] == []
+    for key, ids in USERS.items():
+        assert _files(search_user_pii_in_adls(ids.email, ids.customer_id)) == _files(batch[key])
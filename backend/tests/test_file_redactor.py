@@ -0,0 +1,73 @@
+# backend/tests/test_file_redactor.py
+
+import io
+import threading
+
+import pytest
+
+from app.tools.file_redactor import compile_needles, redact_file, redact_stream
+
+NEEDLES = [b"CUST001", b"a@x.com"]
+
+TEXT = (
+    b'{"customer_id": "CUST001", "email": "a@x.com"}\n'
+    b'{"customer_id": "CUST0012", "email": "bob.a@x.com"}\n'
+    b'{"customer_id": "XCUST001", "email": "a@x.com.au"}\n'
+    b"Contact a@x.com. Ref -CUST001- or CUST001_2, CUST001-7.\n"
+)
+
+EXPECTED = (
+    b'{"customer_id": "*******", "email": "*******"}\n'
+    b'{"customer_id": "CUST0012", "email": "bob.a@x.com"}\n'
+    b'{"customer_id": "XCUST001", "email": "a@x.com.au"}\n'
+    b"Contact *******. Ref -*******- or CUST001_2, CUST001-7.\n"
+)
+
+
+def _redact(data: bytes, block_size: int) -> bytes:
+    dst = io.BytesIO()
+    max_needle = max(len(n) for n in NEEDLES)
+    redact_stream(io.BytesIO(data), dst, compile_needles(NEEDLES), max_needle, block_size)
+    return dst.getvalue()
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 16, 1 << 20])
+def test_neighbouring_identifiers_survive(block_size):
+    assert _redact(TEXT, block_size) == EXPECTED
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 1 << 20])
+def test_boundary_context_across_blocks(block_size):
+    data = b"CUST001" + b"." * 5 + b"x CUST001" + b"-" * 3 + b"\n"
+    assert _redact(data, block_size) == b"CUST001.....x *******---\n"
+
+
+def test_redact_file_keeps_other_users(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_bytes(TEXT)
+
+    result = redact_file(str(path), NEEDLES, block_size=8)
+
+    assert result.status == "redacted"
+    assert result.replacements == 4
+    assert path.read_bytes() == EXPECTED
+
+
+def test_concurrent_redactions_of_one_file(tmp_path):
+    path = tmp_path / "shared.json"
+    path.write_bytes(b'{"customer_id": "CUST001", "email": "b@y.org"}\n' * 20000)
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def run(needle):
+        barrier.wait()
+        results[needle] = redact_file(str(path), [needle], block_size=4096)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in (b"CUST001", b"b@y.org")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [r.status for r in results.values()] == ["redacted", "redacted"]
+    assert path.read_bytes() == b'{"customer_id": "*******", "email": "*******"}\n' * 20000